@@ -0,0 +1,80 @@
+"""
+asyncio client for the ParaBank REST API, for issuing many calls concurrently
+"""
+import time
+from dataclasses import dataclass, field
+
+import aiohttp
+
+from api.client import DEFAULT_FORMAT, DEFAULT_POOL_SIZE, DEFAULT_TIMEOUT, ParaBankEndpoints
+
+
+@dataclass
+class ApiResponse:
+    """Fully read response (aiohttp responses cannot be used after the connection is released)"""
+    status_code: int
+    headers: dict  # case-insensitive (CIMultiDict)
+    content: bytes
+    elapsed: float  # seconds
+    encoding: str = "utf-8"
+    url: str = field(default="")
+    
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or "utf-8", "replace")
+
+
+class AsyncParaBankClient(ParaBankEndpoints):
+    """
+    Async client backed by one aiohttp.ClientSession
+    pool_size caps the number of simultaneous keep-alive connections
+
+    Usage:
+        async with AsyncParaBankClient(base_url) as client:
+            responses = await asyncio.gather(*(client.get_account(i) for i in ids))
+    """
+    
+    def __init__(self, base_url, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, data_format=DEFAULT_FORMAT):
+        self._set_format(data_format)
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.session = None
+    
+    def url(self, path):
+        return f"{self.base_url}/{path}"
+    
+    async def open(self):
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size, limit_per_host=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"Accept": self.content_type},
+            )
+        return self
+    
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+    
+    async def __aenter__(self):
+        return await self.open()
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def _request(self, method, path, params=None, data=None, headers=None):
+        await self.open()
+        params = {key: str(value) for key, value in (params or {}).items()}
+        start = time.perf_counter()
+        async with self.session.request(method, self.url(path), params=params, data=data, headers=headers) as response:
+            content = await response.read()
+            return ApiResponse(
+                status_code=response.status,
+                headers=response.headers.copy(),
+                content=content,
+                elapsed=time.perf_counter() - start,
+                encoding=response.charset or "utf-8",
+                url=str(response.url),
+            )
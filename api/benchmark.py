@@ -0,0 +1,113 @@
+"""
+Repeated-call latency benchmarks with a stored baseline and a regression gate
+One sample is noise; N samples after a warmup give a distribution that can be
+compared run to run
+"""
+import json
+import os
+import platform
+import time
+from datetime import datetime, timezone
+
+from api.stats import summarize
+
+
+DEFAULT_METRICS = ("p50", "p90")
+
+
+def measure(call, repeats=30, warmup=3):
+    """
+    Call `call()` warmup + repeats times and return the latencies (ms) of the timed calls
+    The call must return a response; any status >= 400 aborts the benchmark
+    """
+    for _ in range(warmup):
+        _check(call())
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        response = call()
+        latencies.append((time.perf_counter() - start) * 1000)
+        _check(response)
+    return latencies
+
+
+def _check(response):
+    if response.status_code >= 400:
+        raise AssertionError(f"Benchmark call failed with HTTP {response.status_code}: {response.text[:200]}")
+
+
+def compare(current, baseline, max_regression_pct, metrics=DEFAULT_METRICS, min_delta_ms=0.0):
+    """
+    Return the regressions of `current` against `baseline` (summaries from api.stats)
+    A metric regresses when it is more than max_regression_pct slower AND more than
+    min_delta_ms slower, so sub-millisecond jitter on fast endpoints does not fail the gate
+    """
+    regressions = []
+    for metric in metrics:
+        if metric not in current or metric not in baseline:
+            continue
+        before, now = baseline[metric], current[metric]
+        limit = before * (1 + max_regression_pct / 100)
+        if now > limit and now - before > min_delta_ms:
+            change = (now / before - 1) * 100 if before else float("inf")
+            regressions.append(f"{metric} {now:.1f} ms vs baseline {before:.1f} ms (+{change:.0f}%)")
+    return regressions
+
+
+def load_baseline(path):
+    """Benchmarks of the stored baseline ({name: summary}); empty if there is none yet"""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return json.load(file).get("benchmarks", {})
+
+
+def save_baseline(path, results):
+    """
+    Merge `results` ({name: summary}) into the baseline file
+    Benchmarks not run this time keep their previous values
+    """
+    benchmarks = load_baseline(path)
+    benchmarks.update(results)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    data = {
+        "saved_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": platform.node(),
+        "python": platform.python_version(),
+        "benchmarks": dict(sorted(benchmarks.items())),
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=2)
+        file.write("\n")
+
+
+class BenchmarkSession:
+    """
+    Results of one pytest session, compared against (and optionally saved to) a baseline
+    Each benchmark name should identify the endpoint and the environment (target, format)
+    """
+    
+    def __init__(self, baseline_path, repeats, warmup, max_regression_pct, metrics=DEFAULT_METRICS, min_delta_ms=0.0):
+        self.baseline_path = baseline_path
+        self.repeats = repeats
+        self.warmup = warmup
+        self.max_regression_pct = max_regression_pct
+        self.metrics = metrics
+        self.min_delta_ms = min_delta_ms
+        self.baseline = load_baseline(baseline_path)
+        self.results = {}
+    
+    def run(self, name, call):
+        """Measure `call`, store its summary and return (summary, regressions)"""
+        summary = summarize(measure(call, self.repeats, self.warmup))
+        self.results[name] = summary
+        baseline = self.baseline.get(name)
+        if baseline is None:
+            return summary, []
+        return summary, compare(summary, baseline, self.max_regression_pct, self.metrics, self.min_delta_ms)
+    
+    def save(self):
+        if self.results:
+            save_baseline(self.baseline_path, self.results)
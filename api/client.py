@@ -0,0 +1,149 @@
+"""
+Client for the ParaBank REST API (/services/bank)
+"""
+import xml.etree.ElementTree as ET
+from abc import ABC, abstractmethod
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from api.models import Account, Transaction
+from api.parsing import FORMATS
+from api.streaming import iter_response_models
+
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 30
+DEFAULT_FORMAT = "xml"
+
+ACCOUNT_TYPES = {"CHECKING": 0, "SAVINGS": 1, "LOAN": 2}
+
+
+def payee_xml(payee):
+    """Build the <payee> XML body expected by /billpay from a dict"""
+    root = ET.Element("payee")
+    ET.SubElement(root, "name").text = payee["name"]
+    address = ET.SubElement(root, "address")
+    for field in ("street", "city", "state", "zipCode"):
+        ET.SubElement(address, field).text = payee.get("address", {}).get(field, "")
+    ET.SubElement(root, "phoneNumber").text = payee.get("phoneNumber", "")
+    ET.SubElement(root, "accountNumber").text = str(payee.get("accountNumber", ""))
+    return ET.tostring(root, encoding="unicode")
+
+
+class ParaBankEndpoints(ABC):
+    """
+    One method per ParaBank operation
+    Subclasses implement _request(method, path, params, data, headers); the
+    operations return whatever _request returns (a response or an awaitable)
+    """
+    
+    data_format = DEFAULT_FORMAT
+    
+    @property
+    def content_type(self):
+        """Media type requested with Accept (application/xml or application/json)"""
+        return FORMATS[self.data_format]
+    
+    def _set_format(self, data_format):
+        if data_format not in FORMATS:
+            raise ValueError(f"Unknown API format '{data_format}', expected one of {sorted(FORMATS)}")
+        self.data_format = data_format
+    
+    def login(self, username, password):
+        return self._request("GET", f"login/{username}/{password}")
+    
+    def get_customer(self, customer_id):
+        return self._request("GET", f"customers/{customer_id}")
+    
+    def get_customer_accounts(self, customer_id):
+        return self._request("GET", f"customers/{customer_id}/accounts")
+    
+    def get_account(self, account_id):
+        return self._request("GET", f"accounts/{account_id}")
+    
+    def get_transactions(self, account_id):
+        return self._request("GET", f"accounts/{account_id}/transactions")
+    
+    def deposit(self, account_id, amount):
+        return self._request("POST", "deposit", params={"accountId": account_id, "amount": amount})
+    
+    def withdraw(self, account_id, amount):
+        return self._request("POST", "withdraw", params={"accountId": account_id, "amount": amount})
+    
+    def transfer(self, from_account_id, to_account_id, amount):
+        params = {"fromAccountId": from_account_id, "toAccountId": to_account_id, "amount": amount}
+        return self._request("POST", "transfer", params=params)
+    
+    def bill_pay(self, account_id, amount, payee):
+        """payee is a dict with name, address (street/city/state/zipCode), phoneNumber, accountNumber"""
+        return self._request(
+            "POST", "billpay",
+            params={"accountId": account_id, "amount": amount},
+            data=payee_xml(payee),
+            headers={"Content-Type": "application/xml"},
+        )
+    
+    def create_account(self, customer_id, account_type, from_account_id):
+        """account_type may be the ParaBank code (0, 1, 2) or its name (CHECKING, SAVINGS, LOAN)"""
+        params = {
+            "customerId": customer_id,
+            "newAccountType": ACCOUNT_TYPES.get(account_type, account_type),
+            "fromAccountId": from_account_id,
+        }
+        return self._request("POST", "createAccount", params=params)
+    
+    @abstractmethod
+    def _request(self, method, path, params=None, data=None, headers=None):
+        """Send one request to the API and return the response (or an awaitable)"""
+
+
+class ParaBankClient(ParaBankEndpoints):
+    """
+    Synchronous client backed by a single requests.Session
+    The session keeps a pool of keep-alive connections, so TCP/TLS handshakes
+    happen once per pooled connection instead of once per call
+    """
+    
+    def __init__(self, base_url, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, data_format=DEFAULT_FORMAT):
+        self._set_format(data_format)
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers["Accept"] = self.content_type
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+    
+    def url(self, path):
+        return f"{self.base_url}/{path}"
+    
+    def _request(self, method, path, params=None, data=None, headers=None):
+        return self.session.request(
+            method, self.url(path), params=params, data=data, headers=headers, timeout=self.timeout,
+        )
+    
+    def iter_customer_accounts(self, customer_id):
+        """Stream the customer's accounts as Account models"""
+        return self._iter_models(f"customers/{customer_id}/accounts", Account)
+    
+    def iter_transactions(self, account_id):
+        """
+        Stream an account's transaction history as Transaction models
+        Parsing starts with the first bytes received and keeps memory flat for long histories
+        """
+        return self._iter_models(f"accounts/{account_id}/transactions", Transaction)
+    
+    def _iter_models(self, path, model):
+        # Generator: the request is only sent once the caller starts iterating
+        response = self.session.get(self.url(path), stream=True, timeout=self.timeout)
+        yield from iter_response_models(response, model)
+    
+    def close(self):
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
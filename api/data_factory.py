@@ -0,0 +1,167 @@
+"""
+Test-data factory: customers, accounts, balances and transactions through HTTP
+
+ParaBank has no REST endpoint to create customers, so registration is a plain
+form POST to register.htm (no browser). Everything after that goes through the
+REST API, with independent calls issued concurrently in batches.
+"""
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+import requests
+
+from api.async_client import AsyncParaBankClient
+from api.models import Account, Customer
+from api.parsing import parse_model, parse_models
+
+
+REGISTER_SUCCESS_TEXT = "Your account was created successfully"
+
+# Every new ParaBank account is funded from an existing one with this minimum
+MINIMUM_OPENING_DEPOSIT = Decimal("100")
+
+
+class DataFactoryError(Exception):
+    """A provisioning step was rejected by ParaBank"""
+
+
+@dataclass
+class CustomerData:
+    """A provisioned customer: credentials plus the ids UI tests need"""
+    username: str
+    password: str
+    customer_id: str
+    account_ids: list = field(default_factory=list)
+
+
+def new_username(prefix="qa"):
+    """Unique username (ParaBank usernames are global)"""
+    return f"{prefix}_{uuid.uuid4().hex[:8]}"
+
+
+class DataFactory:
+    """
+    Provision test data for a ParaBank instance
+    client: a ParaBankClient for the REST API; app_url: the web root (for register.htm)
+    batch_size caps the concurrent calls of each batch
+    """
+    
+    def __init__(self, client, app_url, batch_size=10):
+        self.client = client
+        self.app_url = app_url if app_url.endswith("/") else app_url + "/"
+        self.batch_size = batch_size
+    
+    # --- Customers ----------------------------------------------------------
+    
+    def register_customer(self, username=None, password="demo", first_name="QA", last_name="Worker"):
+        """Register a customer through the register.htm form and return its CustomerData"""
+        username = username or new_username()
+        form = {
+            "customer.firstName": first_name,
+            "customer.lastName": last_name,
+            "customer.address.street": "1 Test Street",
+            "customer.address.city": "Testville",
+            "customer.address.state": "CA",
+            "customer.address.zipCode": "90210",
+            "customer.phoneNumber": "555-0100",
+            "customer.ssn": "123-45-6789",
+            "customer.username": username,
+            "customer.password": password,
+            "repeatedPassword": password,
+        }
+        # Own session: the registration logs the browser-less client in, which must
+        # not leak into the shared API client
+        with requests.Session() as session:
+            url = f"{self.app_url}register.htm"
+            session.get(url, timeout=self.client.timeout)
+            response = session.post(url, data=form, timeout=self.client.timeout)
+        if response.status_code != 200 or REGISTER_SUCCESS_TEXT not in response.text:
+            raise DataFactoryError(f"Could not register customer '{username}' (HTTP {response.status_code})")
+        return self.load_customer(username, password)
+    
+    def load_customer(self, username, password):
+        """CustomerData of an existing customer (REST login + accounts)"""
+        response = self._check(self.client.login(username, password), f"login as '{username}'")
+        customer = parse_model(response, Customer)
+        return CustomerData(username, password, customer.id, self.account_ids(customer.id))
+    
+    def account_ids(self, customer_id):
+        response = self._check(self.client.get_customer_accounts(customer_id), "list accounts")
+        return [account.id for account in parse_models(response, Account)]
+    
+    # --- Accounts, balances and transactions (batched) ----------------------
+    
+    def open_accounts(self, customer_id, from_account_id, count, account_type="CHECKING"):
+        """Open `count` accounts funded from from_account_id; return the new account ids"""
+        responses = self._batch(
+            [lambda client: client.create_account(customer_id, account_type, from_account_id)] * count,
+            "open account",
+        )
+        return [parse_model(response, Account).id for response in responses]
+    
+    def deposit(self, account_ids, amount):
+        """Deposit `amount` into every account"""
+        self._batch([lambda client, account_id=account_id: client.deposit(account_id, amount)
+                     for account_id in account_ids], "deposit")
+    
+    def transfer(self, transfers):
+        """Run (from_account_id, to_account_id, amount) transfers to generate transaction history"""
+        self._batch([lambda client, transfer=transfer: client.transfer(*transfer)
+                     for transfer in transfers], "transfer")
+    
+    # --- Recipes ------------------------------------------------------------
+    
+    def provision_customer(self, username=None, password="demo", accounts=2, balance=Decimal("1000"), transfers=0):
+        """
+        New customer with `accounts` accounts, each topped up with `balance`,
+        and `transfers` transfers between its first two accounts
+        """
+        data = self.register_customer(username, password)
+        self.ensure_accounts(data, accounts)
+        if balance:
+            self.deposit(data.account_ids, balance)
+        if transfers and len(data.account_ids) >= 2:
+            first, second = data.account_ids[:2]
+            self.transfer([(first, second, 1) if i % 2 == 0 else (second, first, 1) for i in range(transfers)])
+        return data
+    
+    def ensure_accounts(self, data, minimum):
+        """Open accounts until the customer has at least `minimum`; updates data.account_ids"""
+        missing = minimum - len(data.account_ids)
+        if missing > 0:
+            if not data.account_ids:
+                raise DataFactoryError(f"Customer {data.customer_id} has no account to fund new ones from")
+            funding = data.account_ids[0]
+            # Top up the funding account first so its balance is left as it was
+            self.deposit([funding], MINIMUM_OPENING_DEPOSIT * missing)
+            data.account_ids += self.open_accounts(data.customer_id, funding, missing)
+        return data
+    
+    # --- Helpers ------------------------------------------------------------
+    
+    @staticmethod
+    def _check(response, action):
+        if response.status_code >= 400:
+            raise DataFactoryError(f"Could not {action}: HTTP {response.status_code} {response.text[:200]}")
+        return response
+    
+    def _batch(self, calls, action):
+        """Run `calls` (each `lambda client: awaitable`) concurrently with the async client"""
+        if not calls:
+            return []
+        
+        async def run():
+            async with AsyncParaBankClient(
+                self.client.base_url, pool_size=self.batch_size, timeout=self.client.timeout,
+                data_format=self.client.data_format,
+            ) as client:
+                semaphore = asyncio.Semaphore(self.batch_size)
+                
+                async def limited(call):
+                    async with semaphore:
+                        return await call(client)
+                return await asyncio.gather(*(limited(call) for call in calls))
+        
+        return [self._check(response, action) for response in asyncio.run(run())]
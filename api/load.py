@@ -0,0 +1,145 @@
+"""
+Load mode for the ParaBank REST API
+
+Drives a mix of operations at a fixed concurrency (and optionally a target
+request rate) for a set duration, and reports throughput, error rate and
+latency percentiles per operation and overall.
+"""
+import asyncio
+import itertools
+import time
+from dataclasses import dataclass, field
+
+from api.async_client import AsyncParaBankClient
+from api.client import DEFAULT_FORMAT
+from api.stats import summarize
+
+
+@dataclass
+class LoadResult:
+    """Raw samples of one load run; latencies are in milliseconds"""
+    duration: float
+    latencies: dict = field(default_factory=dict)  # operation -> [ms, ...]
+    errors: dict = field(default_factory=dict)  # operation -> count
+    
+    @property
+    def total_requests(self):
+        return sum(len(values) for values in self.latencies.values()) + sum(self.errors.values())
+    
+    @property
+    def total_errors(self):
+        return sum(self.errors.values())
+    
+    @property
+    def throughput(self):
+        """Completed requests per second"""
+        return self.total_requests / self.duration if self.duration else 0.0
+    
+    @property
+    def error_rate(self):
+        return self.total_errors / self.total_requests if self.total_requests else 0.0
+    
+    def summary(self, operation=None):
+        """Latency distribution (ms) for one operation, or for all of them"""
+        if operation is not None:
+            return summarize(self.latencies.get(operation, []))
+        return summarize([value for values in self.latencies.values() for value in values])
+    
+    def report(self):
+        """Human-readable table"""
+        lines = [
+            f"{'operation':<14}{'ok':>8}{'errors':>8}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}  (ms)",
+        ]
+        for operation in sorted(set(self.latencies) | set(self.errors)):
+            stats = self.summary(operation)
+            lines.append(self._row(operation, stats, self.errors.get(operation, 0)))
+        lines.append(self._row("TOTAL", self.summary(), self.total_errors))
+        lines.append(
+            f"{self.total_requests} requests in {self.duration:.1f}s -> "
+            f"{self.throughput:.1f} req/s, error rate {self.error_rate:.2%}"
+        )
+        return "\n".join(lines)
+    
+    @staticmethod
+    def _row(name, stats, errors):
+        if not stats["count"]:
+            return f"{name:<14}{0:>8}{errors:>8}"
+        return (
+            f"{name:<14}{stats['count']:>8}{errors:>8}"
+            f"{stats['p50']:>9.1f}{stats['p90']:>9.1f}{stats['p99']:>9.1f}{stats['max']:>9.1f}"
+        )
+
+
+def default_operations(customer_id, account_id, to_account_id, username="john", password="demo"):
+    """Login, accounts read, deposit and transfer: the mix we validate before releases"""
+    return {
+        "login": lambda client: client.login(username, password),
+        "accounts": lambda client: client.get_customer_accounts(customer_id),
+        "deposit": lambda client: client.deposit(account_id, 1),
+        "transfer": lambda client: client.transfer(account_id, to_account_id, 1),
+    }
+
+
+async def run_load_async(
+    base_url, operations, concurrency=10, rate=None, duration=10.0, pool_size=None, data_format=DEFAULT_FORMAT,
+):
+    """
+    Run the operations round-robin from `concurrency` workers for `duration` seconds
+    rate: target requests per second across all workers (None = as fast as possible)
+    """
+    names = list(operations)
+    result = LoadResult(duration=0.0, latencies={name: [] for name in names})
+    counter = itertools.count()
+    
+    async with AsyncParaBankClient(base_url, pool_size=pool_size or concurrency, data_format=data_format) as client:
+        start = time.perf_counter()
+        deadline = start + duration
+        
+        async def worker():
+            while True:
+                index = next(counter)
+                if rate:
+                    # Open model: request i is due at start + i/rate, whatever the latency
+                    due = start + index / rate
+                    if due >= deadline:
+                        return
+                    delay = due - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                elif time.perf_counter() >= deadline:
+                    return
+                name = names[index % len(names)]
+                sent = time.perf_counter()
+                try:
+                    response = await operations[name](client)
+                    failed = response.status_code >= 400
+                except Exception:
+                    failed = True
+                if failed:
+                    result.errors[name] = result.errors.get(name, 0) + 1
+                else:
+                    result.latencies[name].append((time.perf_counter() - sent) * 1000)
+        
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        result.duration = time.perf_counter() - start
+    return result
+
+
+def run_load(base_url, operations, concurrency=10, rate=None, duration=10.0, pool_size=None, data_format=DEFAULT_FORMAT):
+    """Synchronous entry point for run_load_async"""
+    return asyncio.run(run_load_async(base_url, operations, concurrency, rate, duration, pool_size, data_format))
+
+
+def check_thresholds(result, max_error_rate=None, max_p50_ms=None, max_p99_ms=None, min_throughput=None):
+    """Return the list of violated thresholds (empty list means pass)"""
+    failures = []
+    stats = result.summary()
+    if max_error_rate is not None and result.error_rate > max_error_rate:
+        failures.append(f"error rate {result.error_rate:.2%} > {max_error_rate:.2%}")
+    if max_p50_ms is not None and stats["count"] and stats["p50"] > max_p50_ms:
+        failures.append(f"p50 {stats['p50']:.1f} ms > {max_p50_ms} ms")
+    if max_p99_ms is not None and stats["count"] and stats["p99"] > max_p99_ms:
+        failures.append(f"p99 {stats['p99']:.1f} ms > {max_p99_ms} ms")
+    if min_throughput is not None and result.throughput < min_throughput:
+        failures.append(f"throughput {result.throughput:.1f} req/s < {min_throughput} req/s")
+    return failures
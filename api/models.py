@@ -0,0 +1,124 @@
+"""
+Compact typed models for ParaBank API payloads
+Plain __slots__ classes: thousands of transactions cost a fraction of the
+memory of the equivalent ElementTree nodes or dicts
+The same model is built from either the XML or the JSON representation
+"""
+from decimal import Decimal
+
+
+def _local(tag):
+    """Tag name without its '{namespace}' prefix"""
+    return tag.rpartition("}")[2]
+
+
+def _children(element):
+    return {_local(child.tag): child.text for child in element}
+
+
+def _decimal(value):
+    if value in (None, ""):
+        return None
+    # str() first so JSON floats keep their printed value (0.1, not 0.1000000000000000055...)
+    return Decimal(str(value))
+
+
+def _string(value):
+    """JSON ids are numbers, XML ids are text: keep both as text"""
+    return None if value is None else str(value)
+
+
+class Model:
+    """Base for the payload models: equality, repr and construction from XML or JSON"""
+    
+    __slots__ = ()
+    
+    # XML element tag of one item and of a list of items (JSON has no root names)
+    TAG = None
+    LIST_TAG = None
+    # XML child tag / JSON key -> attribute name, and attribute name -> converter
+    FIELDS = {}
+    CONVERTERS = {}
+    
+    def __init__(self, **values):
+        for name in self.__slots__:
+            setattr(self, name, values.get(name))
+    
+    @classmethod
+    def from_element(cls, element):
+        """Build the model from its XML element (<account>, <transaction>...)"""
+        return cls._build(_children(element))
+    
+    @classmethod
+    def from_json(cls, data):
+        """Build the model from its decoded JSON object"""
+        return cls._build(data)
+    
+    @classmethod
+    def _build(cls, raw):
+        values = {}
+        for key, name in cls.FIELDS.items():
+            value = raw.get(key)
+            converter = cls.CONVERTERS.get(name)
+            values[name] = converter(value) if converter else value
+        return cls(**values)
+    
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Customer(Model):
+    """<customer> (the address is not modelled)"""
+    
+    __slots__ = ("id", "first_name", "last_name", "phone_number", "ssn")
+    TAG = "customer"
+    FIELDS = {
+        "id": "id",
+        "firstName": "first_name",
+        "lastName": "last_name",
+        "phoneNumber": "phone_number",
+        "ssn": "ssn",
+    }
+    CONVERTERS = {"id": _string, "phone_number": _string, "ssn": _string}
+
+
+class Account(Model):
+    """<account>: ids are kept as the strings the XML API returns"""
+    
+    __slots__ = ("id", "customer_id", "type", "balance")
+    TAG = "account"
+    LIST_TAG = "accounts"
+    FIELDS = {"id": "id", "customerId": "customer_id", "type": "type", "balance": "balance"}
+    CONVERTERS = {"id": _string, "customer_id": _string, "balance": _decimal}
+
+
+class Transaction(Model):
+    """<transaction>: date is kept as the text the API returns"""
+    
+    __slots__ = ("id", "account_id", "type", "date", "amount", "description")
+    TAG = "transaction"
+    LIST_TAG = "transactions"
+    FIELDS = {
+        "id": "id",
+        "accountId": "account_id",
+        "type": "type",
+        "date": "date",
+        "amount": "amount",
+        "description": "description",
+    }
+    CONVERTERS = {"id": _string, "account_id": _string, "date": _string, "amount": _decimal}
+
+
+class BillPayResult(Model):
+    """<billPayResult>"""
+    
+    __slots__ = ("account_id", "amount", "payee_name")
+    TAG = "billPayResult"
+    FIELDS = {"accountId": "account_id", "amount": "amount", "payeeName": "payee_name"}
+    CONVERTERS = {"account_id": _string, "amount": _decimal}
@@ -0,0 +1,37 @@
+"""
+Turn API responses into models, whatever format the server negotiated
+Works with requests responses and with the async client's ApiResponse
+"""
+import json
+import xml.etree.ElementTree as ET
+
+from api.models import _local
+
+
+FORMATS = {"xml": "application/xml", "json": "application/json"}
+
+
+def is_json(response):
+    return "json" in response.headers.get("Content-Type", "")
+
+
+def _xml_root(response, expected_tag):
+    root = ET.fromstring(response.content)
+    if _local(root.tag) != expected_tag:
+        raise ValueError(f"Expected <{expected_tag}>, got <{_local(root.tag)}>")
+    return root
+
+
+def parse_model(response, model):
+    """One model from a single-object response (<account>, {"id": ...})"""
+    if is_json(response):
+        return model.from_json(json.loads(response.content))
+    return model.from_element(_xml_root(response, model.TAG))
+
+
+def parse_models(response, model):
+    """List of models from a list response (<accounts><account>..., [{...}])"""
+    if is_json(response):
+        return [model.from_json(item) for item in json.loads(response.content)]
+    root = _xml_root(response, model.LIST_TAG)
+    return [model.from_element(element) for element in root if _local(element.tag) == model.TAG]
@@ -0,0 +1,37 @@
+"""
+Latency statistics shared by the load and benchmark modes
+"""
+import math
+import statistics
+
+
+def percentile(values, pct):
+    """
+    Percentile with linear interpolation between closest ranks (pct in 0..100)
+    values does not need to be sorted
+    """
+    if not values:
+        raise ValueError("percentile() of empty data")
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(values):
+    """Distribution summary of a list of latencies (same unit in and out)"""
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "min": min(values),
+        "mean": statistics.fmean(values),
+        "stdev": statistics.pstdev(values),
+        "p50": percentile(values, 50),
+        "p90": percentile(values, 90),
+        "p99": percentile(values, 99),
+        "max": max(values),
+    }
@@ -0,0 +1,60 @@
+"""
+Incremental XML parsing of API responses
+Items are built and yielded as their closing tag arrives, so a long list is
+validated in constant memory and before the body has finished downloading
+"""
+import json
+import xml.etree.ElementTree as ET
+
+from api.models import _local
+from api.parsing import is_json
+
+
+def iter_elements(source, item_tag):
+    """
+    Yield each <item_tag> element that is a direct child of the document root
+    source is a binary file-like object (e.g. requests' response.raw)
+    Each element is detached from the tree once the caller moves on
+    """
+    root = None
+    depth = 0
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1 and _local(element.tag) == item_tag:
+            yield element
+            # Drop the finished item so the tree never grows past one child
+            root.clear()
+
+
+def iter_models(source, model):
+    """Yield model.from_element() for each <model.TAG> in the stream"""
+    for element in iter_elements(source, model.TAG):
+        yield model.from_element(element)
+
+
+def iter_response_models(response, model):
+    """
+    Stream the models out of a requests response opened with stream=True
+    JSON bodies are decoded in one go (the stdlib has no incremental JSON parser)
+    Raises HTTPError for error statuses and ValueError for other content types
+    """
+    with response:
+        if not response.ok:
+            # Read the (short) error body so the connection goes back to the pool
+            response.content
+            response.raise_for_status()
+        content_type = response.headers.get("Content-Type", "")
+        # Undo gzip/deflate transfer encoding while reading from the socket
+        response.raw.decode_content = True
+        if is_json(response):
+            for item in json.load(response.raw):
+                yield model.from_json(item)
+        elif "xml" in content_type:
+            yield from iter_models(response.raw, model)
+        else:
+            raise ValueError(f"Expected an XML or JSON response, got '{content_type}'")
@@ -1,63 +1,463 @@
+import os
+from urllib.parse import urlsplit
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
+from utils.driver_pool import DriverPool
+from utils.browser_options import add_browser_options, get_browser_settings
+from utils.browser_factory import add_browser_selection_option, driver_factory
+from utils.auth_session import AuthSession
+from utils.worker_customer import provision_customer
+from utils.page_timing import PageTimingPlugin, PageTimingRecorder
+from utils.action_profiler import ActionProfilerPlugin
+from utils.results_writer import JsonLinesResultsPlugin
+from utils.network_blocking import VISUAL_MARKER, set_blocked_urls
+from utils.asset_cache import AssetCache, cached_url_patterns, serve_from_cache
+from parabank_stub.server import start_server
+from api.client import DEFAULT_FORMAT, DEFAULT_POOL_SIZE, ParaBankClient
+from api.benchmark import BenchmarkSession
+from api.data_factory import DataFactory
+
+
+PARABANK_URL = "https://parabank.parasoft.com/parabank/"
+
+
+def pytest_addoption(parser):
+    """
+    Opciones de línea de comandos propias de la suite
+    """
+    parser.addoption(
+        "--isolated-customer",
+        action="store_true",
+        default=False,
+        help="Registrar un cliente nuevo por sesión/worker en lugar de usar john/demo "
+             "(se activa solo al ejecutar en paralelo con pytest-xdist)",
+    )
+    parser.addoption(
+        "--parabank-url",
+        default=os.environ.get("PARABANK_URL", PARABANK_URL),
+        help="URL raíz de ParaBank (también con la variable PARABANK_URL)",
+    )
+    parser.addoption(
+        "--local-parabank",
+        action="store_true",
+        default=os.environ.get("PARABANK_LOCAL") == "1",
+        help="Arrancar un ParaBank local en memoria (parabank_stub) y ejecutar contra él "
+             "(también con PARABANK_LOCAL=1)",
+    )
+    parser.addoption(
+        "--api-pool-size",
+        type=int,
+        default=DEFAULT_POOL_SIZE,
+        help="Conexiones keep-alive máximas del cliente de la API REST",
+    )
+    parser.addoption(
+        "--api-format",
+        choices=("xml", "json"),
+        default=os.environ.get("PARABANK_API_FORMAT", DEFAULT_FORMAT),
+        help="Formato pedido a la API REST con la cabecera Accept (también con PARABANK_API_FORMAT)",
+    )
+    parser.addoption(
+        "--page-timings",
+        action="store_true",
+        default=False,
+        help="Medir la carga de cada página (Navigation/Resource Timing) y resumirla por página al final",
+    )
+    parser.addoption(
+        "--profile-actions",
+        action="store_true",
+        default=False,
+        help="Medir cada método de los page objects, espera y comando WebDriver: "
+             "desglose por test y ranking de las acciones más lentas",
+    )
+    parser.addoption(
+        "--profile-top",
+        type=int,
+        default=15,
+        help="Número de acciones en el ranking de --profile-actions",
+    )
+    parser.addoption(
+        "--results-jsonl",
+        default=None,
+        metavar="PATH",
+        help="Escribir un resultado JSON por línea en PATH según va terminando cada test "
+             "(resultado, duraciones, tiempos de página, perfil y latencias de la API)",
+    )
+    add_load_options(parser)
+    add_benchmark_options(parser)
+    add_browser_options(parser)
+    add_browser_selection_option(parser)
+
+
+def add_load_options(parser):
+    """
+    Modo de carga de la API: opciones de línea de comandos y umbrales en pytest.ini
+    Los valores de la línea de comandos tienen prioridad sobre los de pytest.ini
+    """
+    group = parser.getgroup("load", "pruebas de carga de la API")
+    group.addoption(
+        "--load",
+        action="store_true",
+        default=False,
+        help="Ejecutar los tests marcados con 'load' (se omiten por defecto)",
+    )
+    group.addoption("--load-concurrency", type=int, default=None,
+                    help="Peticiones simultáneas (workers asíncronos)")
+    group.addoption("--load-rate", type=float, default=None,
+                    help="Peticiones por segundo objetivo (0 = lo más rápido posible)")
+    group.addoption("--load-duration", type=float, default=None,
+                    help="Duración de la prueba de carga en segundos")
+    parser.addini("load_concurrency", "Peticiones simultáneas por defecto", default="10")
+    parser.addini("load_rate", "Peticiones por segundo por defecto (0 = sin límite)", default="0")
+    parser.addini("load_duration", "Duración por defecto en segundos", default="30")
+    parser.addini("load_max_error_rate", "Tasa de error máxima (0-1)", default="0.01")
+    parser.addini("load_max_p50_ms", "Latencia p50 máxima en ms", default="")
+    parser.addini("load_max_p99_ms", "Latencia p99 máxima en ms", default="")
+    parser.addini("load_min_throughput", "Peticiones por segundo mínimas", default="")
+
+
+def add_benchmark_options(parser):
+    """
+    Benchmarks de latencia de la API: repeticiones, baseline y umbral de regresión
+    """
+    group = parser.getgroup("benchmark", "benchmarks de latencia de la API")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Ejecutar los tests marcados con 'benchmark' y compararlos con el baseline",
+    )
+    group.addoption(
+        "--benchmark-save",
+        action="store_true",
+        default=False,
+        help="Guardar los resultados como nuevo baseline (implica --benchmark)",
+    )
+    group.addoption("--benchmark-baseline", default=None,
+                    help="Fichero JSON del baseline (por defecto benchmark_baseline de pytest.ini)")
+    parser.addini("benchmark_baseline", "Fichero JSON del baseline", default="benchmarks/baseline.json")
+    parser.addini("benchmark_repeats", "Llamadas medidas por endpoint", default="30")
+    parser.addini("benchmark_warmup", "Llamadas de calentamiento no medidas", default="3")
+    parser.addini("benchmark_max_regression_pct", "Empeoramiento máximo en % respecto al baseline", default="20")
+    parser.addini("benchmark_min_delta_ms", "Diferencia mínima en ms para contar como regresión", default="5")
+    parser.addini("benchmark_metrics", "Estadísticos comparados con el baseline", type="args", default=["p50", "p90"])
+
+
+# Marker -> opción que lo activa: estos tests se omiten si no se pide la opción
+OPT_IN_MARKERS = {
+    "load": ("--load",),
+    "benchmark": ("--benchmark", "--benchmark-save"),
+}
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Los tests de carga solo se ejecutan con --load y los benchmarks con --benchmark
+    """
+    for marker, options in OPT_IN_MARKERS.items():
+        if any(config.getoption(option) for option in options):
+            continue
+        skip = pytest.mark.skip(reason=f"test '{marker}': usar {options[0]} para ejecutarlo")
+        for item in items:
+            if item.get_closest_marker(marker):
+                item.add_marker(skip)
+
+
+def pytest_configure(config):
+    """
+    Registrar los plugins opcionales de medición: tiempos de carga por página
+    (--page-timings), perfil de acciones (--profile-actions) y resultados en
+    JSON lines (--results-jsonl)
+    """
+    if config.getoption("--page-timings"):
+        config.pluginmanager.register(PageTimingPlugin(), "page_timings")
+    if config.getoption("--profile-actions"):
+        config.pluginmanager.register(ActionProfilerPlugin(config.getoption("--profile-top")), "action_profiler")
+    # Con pytest-xdist el fichero lo escribe solo el proceso principal
+    if config.getoption("--results-jsonl") and not hasattr(config, "workerinput"):
+        markers = [line.split(":")[0].strip() for line in config.getini("markers")]
+        config.pluginmanager.register(
+            JsonLinesResultsPlugin(config.getoption("--results-jsonl"), markers), "results_jsonl"
+        )
+
+
+def get_worker_id():
+    """
+    Identificador del worker de pytest-xdist ('gw0', 'gw1'...) o 'master' sin paralelismo
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+@pytest.fixture(scope="session")
+def browser_settings(request):
+    """Configuración del navegador: perfil más opciones de línea de comandos"""
+    return get_browser_settings(request.config)
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, browser_settings):
+    """
+    Pool de navegadores que vive toda la sesión (o todo el worker con pytest-xdist)
+    El navegador se elige una sola vez y se arranca una sola vez, y se reutiliza entre tests
+    """
+    pool = DriverPool(driver_factory(request.config, browser_settings))
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def asset_cache():
+    """
+    Caché de recursos estáticos (--cache-assets) compartida por los navegadores del proceso
+    """
+    return AssetCache()
 
 
 @pytest.fixture(scope="function")
-def driver():
-    """
-    Fixture que inicializa y cierra el navegador para cada test
-    Selenium 4.26+ incluye Selenium Manager que descarga automáticamente el driver correcto
-    """
-    driver = None
-    
-    try:
-        # Intentar con Chrome primero
-        chrome_options = ChromeOptions()
-        # chrome_options.add_argument("--headless")  # Descomentar para ejecutar sin abrir ventana
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--start-maximized")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-extensions")
-        
-        # Selenium Manager descarga automáticamente el driver correcto
-        driver = webdriver.Chrome(options=chrome_options)
-        print("✓ Chrome iniciado correctamente")
-        
-    except Exception as e:
-        print(f"✗ No se pudo inicializar Chrome: {e}")
-        print("Intentando con Microsoft Edge...")
-        
-        try:
-            # Intentar con Edge
-            edge_options = EdgeOptions()
-            # edge_options.add_argument("--headless")
-            edge_options.add_argument("--no-sandbox")
-            edge_options.add_argument("--disable-dev-shm-usage")
-            edge_options.add_argument("--start-maximized")
-            
-            driver = webdriver.Edge(options=edge_options)
-            print("✓ Edge iniciado correctamente")
-            
-        except Exception as e2:
-            print(f"✗ No se pudo inicializar Edge: {e2}")
-            raise Exception("No se pudo inicializar ningún navegador (Chrome o Edge)")
-    
-    # Timeout implícito
-    driver.implicitly_wait(10)
+def driver(request, driver_pool, browser_settings, asset_cache):
+    """
+    Fixture que entrega un navegador del pool para cada test
+    Al terminar el test se limpian cookies, storage y ventanas en lugar de cerrarlo
+    Con --page-timings los tiempos de carga de las páginas se guardan en el resultado del test
+    Con --block-assets (o el perfil ci) se bloquean por CDP las URLs de blocked_urls,
+    salvo en los tests marcados 'visual', que necesitan la página completa
+    Con --cache-assets (o el perfil ci) las URLs de cached_urls se sirven desde asset_cache
+    """
+    driver = driver_pool.acquire()
+    # Los navegadores del pool se reutilizan: el bloqueo y la caché se fijan en cada test
+    visual = request.node.get_closest_marker(VISUAL_MARKER) is not None
+    blocked = [] if visual else browser_settings["blocked_urls"]
+    if browser_settings["blocked_urls"]:
+        set_blocked_urls(driver, blocked)
+    if browser_settings["cached_urls"]:
+        serve_from_cache(driver, asset_cache, cached_url_patterns(browser_settings["cached_urls"], blocked))
+    recorder = None
+    if request.config.getoption("--page-timings"):
+        recorder = driver.page_timing_recorder = PageTimingRecorder()
     
     yield driver
     
-    # Cerrar el navegador después del test
-    if driver:
-        driver.quit()
+    if recorder is not None:
+        recorder.capture(driver)
+        del driver.page_timing_recorder
+        request.node.user_properties.append((PageTimingPlugin.PROPERTY, recorder.records))
+    
+    # Devolver el navegador limpio al pool
+    driver_pool.release(driver)
+
+
+@pytest.fixture(scope="session")
+def parabank_server():
+    """
+    ParaBank local en memoria, en un puerto libre y en un hilo de fondo
+    Con pytest-xdist cada worker arranca el suyo
+    """
+    server = start_server()
+    print(f"✓ ParaBank local iniciado en {server.url}")
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="session")
+def app_url(request):
+    """
+    URL raíz de la aplicación ParaBank (termina en /)
+    Con --local-parabank apunta al servidor local en lugar del sitio público
+    """
+    if request.config.getoption("--local-parabank"):
+        return request.getfixturevalue("parabank_server").url
+    url = request.config.getoption("--parabank-url")
+    return url if url.endswith("/") else url + "/"
+
+
+@pytest.fixture(scope="session")
+def api_base_url(app_url):
+    """
+    URL base de los servicios REST de ParaBank
+    """
+    return f"{app_url}services/bank"
+
+
+@pytest.fixture(scope="session")
+def api_target(request, app_url):
+    """
+    Entorno contra el que se ejecuta: "local" con --local-parabank (el puerto cambia
+    en cada sesión) o el host de --parabank-url; identifica los resultados de los benchmarks
+    """
+    if request.config.getoption("--local-parabank"):
+        return "local"
+    return urlsplit(app_url).netloc
+
+
+@pytest.fixture(scope="session")
+def api_pool_size(request):
+    """
+    Tamaño del pool de conexiones de la API (--api-pool-size)
+    """
+    return request.config.getoption("--api-pool-size")
+
+
+@pytest.fixture(scope="session")
+def api_format(request):
+    """
+    Formato de las respuestas de la API: 'xml' o 'json' (--api-format)
+    """
+    return request.config.getoption("--api-format")
+
+
+@pytest.fixture(scope="session")
+def api_client(api_base_url, api_pool_size, api_format):
+    """
+    Cliente de la API REST compartido por toda la sesión
+    Reutiliza las conexiones keep-alive en lugar de abrir una por test
+    """
+    client = ParaBankClient(api_base_url, pool_size=api_pool_size, data_format=api_format)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def load_settings(request):
+    """
+    Parámetros y umbrales del modo de carga (línea de comandos > pytest.ini)
+    Los umbrales vacíos en pytest.ini no se comprueban
+    """
+    config = request.config
+    
+    def ini_float(name):
+        value = config.getini(name)
+        return float(value) if value not in ("", None) else None
+    
+    concurrency = config.getoption("--load-concurrency")
+    rate = config.getoption("--load-rate")
+    duration = config.getoption("--load-duration")
+    return {
+        "concurrency": concurrency if concurrency is not None else int(config.getini("load_concurrency")),
+        "rate": (rate if rate is not None else ini_float("load_rate")) or None,
+        "duration": duration if duration is not None else ini_float("load_duration"),
+        "thresholds": {
+            "max_error_rate": ini_float("load_max_error_rate"),
+            "max_p50_ms": ini_float("load_max_p50_ms"),
+            "max_p99_ms": ini_float("load_max_p99_ms"),
+            "min_throughput": ini_float("load_min_throughput"),
+        },
+    }
+
+
+@pytest.fixture(scope="session")
+def benchmark_session(request):
+    """
+    Resultados de los benchmarks de la sesión y baseline con el que se comparan
+    Con --benchmark-save se guardan al final como nuevo baseline (se fusionan con el existente)
+    """
+    config = request.config
+    session = BenchmarkSession(
+        baseline_path=config.getoption("--benchmark-baseline") or os.path.join(
+            str(config.rootpath), config.getini("benchmark_baseline")
+        ),
+        repeats=int(config.getini("benchmark_repeats")),
+        warmup=int(config.getini("benchmark_warmup")),
+        max_regression_pct=float(config.getini("benchmark_max_regression_pct")),
+        metrics=tuple(config.getini("benchmark_metrics")),
+        min_delta_ms=float(config.getini("benchmark_min_delta_ms")),
+    )
+    yield session
+    if config.getoption("--benchmark-save"):
+        session.save()
+        print(f"\n✓ Baseline de benchmarks guardado en {session.baseline_path}")
+
+
+@pytest.fixture(autouse=True)
+def api_latencies(request):
+    """
+    Con --results-jsonl, latencia de cada llamada del api_client durante el test
+    Se guardan en user_properties para que lleguen al fichero de resultados
+    """
+    if not request.config.getoption("--results-jsonl") or "api_client" not in request.fixturenames:
+        yield None
+        return
+    client = request.getfixturevalue("api_client")
+    calls = []
+    
+    def record(response, *args, **kwargs):
+        calls.append({
+            "method": response.request.method,
+            "url": response.url.split("?")[0],
+            "status": response.status_code,
+            "ms": round(response.elapsed.total_seconds() * 1000, 3),
+        })
+    
+    client.session.hooks["response"].append(record)
+    yield calls
+    client.session.hooks["response"].remove(record)
+    request.node.user_properties.append(("api_latencies", calls))
 
 
 @pytest.fixture(scope="function")
-def base_url():
+def base_url(app_url):
     """
     URL base de ParaBank
     """
-    return "https://parabank.parasoft.com/parabank/index.htm?ConnType=JDBC"
+    return f"{app_url}index.htm?ConnType=JDBC"
+
+
+@pytest.fixture(scope="session")
+def data_factory(api_client, app_url):
+    """
+    Fábrica de datos de prueba: clientes, cuentas, saldos y transacciones por HTTP/API
+    """
+    return DataFactory(api_client, app_url)
+
+
+@pytest.fixture(scope="session")
+def customer_data(request, data_factory):
+    """
+    Cliente con el que se ejecutan los tests (CustomerData: credenciales,
+    customer_id y números de cuenta, con al menos dos cuentas)
+    En paralelo cada worker registra su propio cliente para que los tests que
+    modifican saldos o perfil no se pisen entre sí
+    Con john/demo se garantiza por la API que tenga al menos dos cuentas
+    """
+    worker_id = get_worker_id()
+    if worker_id == "master" and not request.config.getoption("--isolated-customer"):
+        return data_factory.ensure_accounts(data_factory.load_customer("john", "demo"), 2)
+    return provision_customer(data_factory, worker_id)
+
+
+@pytest.fixture(scope="session")
+def credentials(customer_data):
+    """
+    Usuario y contraseña con los que se loguean los tests
+    """
+    return customer_data.username, customer_data.password
+
+
+@pytest.fixture(scope="session")
+def auth_session(driver_pool, app_url, credentials):
+    """
+    Sesión autenticada compartida: se hace login por la UI una sola vez por sesión
+    """
+    username, password = credentials
+    return AuthSession(driver_pool, app_url, username, password)
+
+
+@pytest.fixture(scope="function")
+def logged_in_driver(driver, auth_session):
+    """
+    Navegador ya logueado y abierto en el resumen de cuentas
+    Reutiliza la cookie JSESSIONID de la sesión en lugar de pasar por el login
+    """
+    auth_session.open_overview(driver)
+    return driver
+
+
+@pytest.fixture(scope="function")
+def open_page(driver, auth_session):
+    """
+    Abrir una página ya autenticada directamente por su URL, sin cargar el resumen
+    de cuentas ni pasar por el menú (eso queda para los tests marcados navigation)
+    Uso: transfer_page = open_page(TransferPage)
+    """
+    def open_(page_class):
+        return auth_session.open_page(driver, page_class(driver))
+    
+    return open_
@@ -7,38 +7,59 @@ class AccountsOverviewPage(BasePage):
     Page Object para la página de resumen de cuentas
     """
     
-    # Locators
-    ACCOUNTS_OVERVIEW_TITLE = (By.XPATH, "//h1[contains(text(), 'Accounts Overview')]")
+    PATH = "overview.htm"
+    
+    # Locators (CSS/id: sin búsquedas por texto, ver pages/locator_registry.py)
+    ACCOUNTS_OVERVIEW_TITLE = (By.CSS_SELECTOR, "#showOverview h1.title")
     ACCOUNT_TABLE = (By.ID, "accountTable")
-    ACCOUNT_LINKS = (By.XPATH, "//table[@id='accountTable']//a")
-    BALANCE_TOTAL = (By.XPATH, "//b[contains(text(), 'Balance')]/following-sibling::b")
-    AVAILABLE_AMOUNT_TOTAL = (By.XPATH, "//b[contains(text(), 'Available Amount')]/following-sibling::b")
-    
-    # Menu items
-    OPEN_NEW_ACCOUNT_LINK = (By.LINK_TEXT, "Open New Account")
-    ACCOUNTS_OVERVIEW_LINK = (By.LINK_TEXT, "Accounts Overview")
-    TRANSFER_FUNDS_LINK = (By.LINK_TEXT, "Transfer Funds")
-    BILL_PAY_LINK = (By.LINK_TEXT, "Bill Pay")
-    FIND_TRANSACTIONS_LINK = (By.LINK_TEXT, "Find Transactions")
-    UPDATE_CONTACT_INFO_LINK = (By.LINK_TEXT, "Update Contact Info")
-    REQUEST_LOAN_LINK = (By.LINK_TEXT, "Request Loan")
-    LOG_OUT_LINK = (By.LINK_TEXT, "Log Out")
-    
-    def __init__(self, driver):
-        super().__init__(driver)
+    ACCOUNT_LINKS = (By.CSS_SELECTOR, "#accountTable a")
+    # La última fila de la tabla es la de totales
+    BALANCE_TOTAL = (By.CSS_SELECTOR, "#accountTable tbody tr:last-child td:nth-child(2) b")
+    AVAILABLE_AMOUNT_TOTAL = (By.CSS_SELECTOR, "#accountTable tbody tr:last-child td:nth-child(3)")
+    
+    # Menu items (por href: ParaBank puede añadir ;jsessionid=... a la URL)
+    OPEN_NEW_ACCOUNT_LINK = (By.CSS_SELECTOR, "#leftPanel a[href*='openaccount.htm']")
+    ACCOUNTS_OVERVIEW_LINK = (By.CSS_SELECTOR, "#leftPanel a[href*='overview.htm']")
+    TRANSFER_FUNDS_LINK = (By.CSS_SELECTOR, "#leftPanel a[href*='transfer.htm']")
+    BILL_PAY_LINK = (By.CSS_SELECTOR, "#leftPanel a[href*='billpay.htm']")
+    FIND_TRANSACTIONS_LINK = (By.CSS_SELECTOR, "#leftPanel a[href*='findtrans.htm']")
+    UPDATE_CONTACT_INFO_LINK = (By.CSS_SELECTOR, "#leftPanel a[href*='updateprofile.htm']")
+    REQUEST_LOAN_LINK = (By.CSS_SELECTOR, "#leftPanel a[href*='requestloan.htm']")
+    LOG_OUT_LINK = (By.CSS_SELECTOR, "#leftPanel a[href*='logout.htm']")
+    
+    def __init__(self, driver, timeout=None):
+        super().__init__(driver, timeout)
     
     def is_accounts_overview_displayed(self):
         """Verificar si la página de resumen de cuentas está visible"""
         return self.is_element_visible(self.ACCOUNTS_OVERVIEW_TITLE)
     
     def get_account_numbers(self):
-        """Obtener lista de números de cuenta"""
-        account_elements = self.find_elements(self.ACCOUNT_LINKS)
-        return [element.text for element in account_elements]
+        """Obtener lista de números de cuenta (una sola llamada al navegador)"""
+        return self.extract_texts(self.ACCOUNT_LINKS)
+    
+    def get_accounts(self):
+        """
+        Obtener todas las cuentas de la tabla en una sola llamada al navegador
+        Devuelve una lista de dicts con account, balance y available
+        """
+        def loaded_accounts(driver):
+            # Lectura sin espera: la única espera es la de fuera, que sigue sondeando
+            # mientras la tabla no existe o aún no tiene cuentas
+            rows = self.read_table(self.ACCOUNT_TABLE)
+            # La fila de totales puede estar antes de que lleguen las cuentas por AJAX
+            accounts = [
+                {"account": row[0], "balance": row[1], "available": row[2]}
+                for row in rows
+                if len(row) >= 3 and row[0] and row[0] != "Total"
+            ]
+            return accounts or False
+        
+        return self.wait.until(loaded_accounts)
     
     def click_account(self, account_number):
         """Hacer click en una cuenta específica"""
-        locator = (By.LINK_TEXT, str(account_number))
+        locator = (By.CSS_SELECTOR, f"#accountTable a[href$='id={account_number}']")
         self.click(locator)
     
     def get_total_balance(self):
@@ -1,8 +1,9 @@
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
-import time
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
+from pages.page_snapshot import PageSnapshot
+from utils.retry import RetryPolicy
 
 
 class BasePage:
@@ -11,54 +12,354 @@ class BasePage:
     Contiene métodos comunes utilizados en todas las páginas
     """
     
-    def __init__(self, driver):
+    # Documento cargado y sin peticiones jQuery en curso
+    PAGE_READY_SCRIPT = (
+        "return document.readyState === 'complete' && "
+        "(!window.jQuery || window.jQuery.active === 0);"
+    )
+    
+    # Funciones JS para leer el DOM en un solo round-trip: resuelven un locator
+    # de Selenium (By.*, valor) dentro del navegador y leen texto o valor
+    DOM_HELPERS_SCRIPT = """
+        function quote(value) {
+            return '"' + String(value).replace(/["\\\\]/g, '\\\\$&') + '"';
+        }
+        function resolve(by, value, root) {
+            root = root || document;
+            switch (by) {
+                case 'id': return Array.from(root.querySelectorAll('[id=' + quote(value) + ']'));
+                case 'name': return Array.from(root.querySelectorAll('[name=' + quote(value) + ']'));
+                case 'class name': return Array.from(root.querySelectorAll('.' + CSS.escape(value)));
+                case 'tag name':
+                case 'css selector': return Array.from(root.querySelectorAll(value));
+                case 'link text':
+                    return Array.from(root.querySelectorAll('a')).filter(a => a.innerText.trim() === value);
+                case 'partial link text':
+                    return Array.from(root.querySelectorAll('a')).filter(a => a.innerText.includes(value));
+                case 'xpath':
+                    const found = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                    const nodes = [];
+                    for (let i = 0; i < found.snapshotLength; i++) nodes.push(found.snapshotItem(i));
+                    return nodes;
+            }
+            throw new Error('Locator no soportado: ' + by);
+        }
+        function read(element) {
+            const tag = element.tagName.toLowerCase();
+            if (tag === 'select') {
+                const option = element.options[element.selectedIndex];
+                return option ? option.text.trim() : '';
+            }
+            if (tag === 'input' || tag === 'textarea') return element.value;
+            return (element.innerText || '').trim();
+        }
+    """
+    
+    # Rellenar varios campos a la vez: primero se resuelven todos (inputs y opciones
+    # de los selects) y solo si están todos se asignan los valores y se disparan
+    # los eventos input/change; devuelve los campos que todavía no existen
+    FILL_FORM_SCRIPT = """
+        const missing = [];
+        const targets = [];
+        for (const [by, value, text] of arguments[0]) {
+            const element = resolve(by, value)[0];
+            if (!element) { missing.push(by + '=' + value); continue; }
+            if (element.tagName.toLowerCase() === 'select') {
+                const option = Array.from(element.options)
+                    .find(o => o.value === text || o.text.trim() === text);
+                if (!option) { missing.push(by + '=' + value + ' (opción ' + text + ')'); continue; }
+                targets.push([element, option.value]);
+            } else {
+                targets.push([element, text]);
+            }
+        }
+        if (missing.length) return missing;
+        for (const [element, text] of targets) {
+            element.value = text;
+            element.dispatchEvent(new Event('input', {bubbles: true}));
+            element.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+        return [];
+    """
+    
+    # Timeout por defecto de las esperas explícitas (cada página puede cambiarlo)
+    TIMEOUT = 10
+    
+    # Timeout corto para comprobar que algo NO aparece (caminos negativos)
+    ABSENT_TIMEOUT = 1
+    
+    # Reintentos de click, type y find_element ante fallos transitorios (elemento
+    # stale, click interceptado...); el timeout de la página es el presupuesto total
+    RETRY_POLICY = RetryPolicy()
+    
+    # Campos que fill_form escribe tecla a tecla en vez de asignarlos por JS
+    # (cada página declara los suyos; REALISTIC_TYPING lo aplica a todos)
+    TYPED_FIELDS = ()
+    REALISTIC_TYPING = False
+    
+    # Ruta de la página relativa a app_url (p. ej. "transfer.htm") para abrirla con open()
+    PATH = None
+    
+    def __init__(self, driver, timeout=None):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.timeout = self.TIMEOUT if timeout is None else timeout
+        self.wait = WebDriverWait(driver, self.timeout)
+        self._snapshot = None
+    
+    def _wait(self, timeout=None):
+        """WebDriverWait con el timeout de la página o con uno concreto para esta llamada"""
+        if timeout is None:
+            return self.wait
+        return WebDriverWait(self.driver, timeout)
     
     def navigate_to(self, url):
         """Navegar a una URL"""
+        self.invalidate_snapshot()
         self.driver.get(url)
+        self.record_page_timing()
+    
+    def open(self, app_url):
+        """
+        Abrir la página directamente por su URL (PATH), sin pasar por el menú
+        Con la sesión ya inyectada es una sola carga de página; devuelve la propia página
+        """
+        if self.PATH is None:
+            raise ValueError(f"{type(self).__name__} no define PATH")
+        self.navigate_to(f"{app_url}{self.PATH}")
+        self.wait_for_page_ready()
+        return self
+    
+    def _retry(self, action, timeout=None, max_attempts=None):
+        """
+        Ejecutar action(tiempo_restante) con RETRY_POLICY
+        El timeout (el de la página por defecto) es el tiempo total para todos los intentos
+        """
+        deadline = self.timeout if timeout is None else timeout
+        return self.RETRY_POLICY.run(action, deadline, max_attempts)
     
-    def find_element(self, locator):
+    def find_element(self, locator, timeout=None):
         """Encontrar un elemento"""
-        return self.wait.until(EC.presence_of_element_located(locator))
+        return self._retry(
+            lambda remaining: self._wait(remaining).until(EC.presence_of_element_located(locator)), timeout,
+        )
     
-    def find_elements(self, locator):
+    def find_elements(self, locator, timeout=None):
         """Encontrar múltiples elementos"""
-        return self.wait.until(EC.presence_of_all_elements_located(locator))
+        return self._wait(timeout).until(EC.presence_of_all_elements_located(locator))
     
-    def click(self, locator, retry=3):
+    def click(self, locator, retry=None, timeout=None):
         """
-        Hacer click en un elemento con retry para evitar StaleElementReferenceException
+        Hacer click en un elemento reintentando los fallos transitorios (RETRY_POLICY)
+        retry limita el número de intentos; por defecto, los que quepan en el timeout
         """
-        for attempt in range(retry):
+        self.invalidate_snapshot()
+        # La página actual se mide antes de que el click pueda sacarnos de ella
+        self.record_page_timing()
+        
+        def attempt(remaining):
+            self._wait(remaining).until(EC.element_to_be_clickable(locator)).click()
+        
+        self._retry(attempt, timeout, retry)
+    
+    def type(self, locator, text, timeout=None):
+        """Escribir texto en un campo (reintentando si el elemento se vuelve stale)"""
+        self.invalidate_snapshot()
+        
+        def attempt(remaining):
+            element = self._wait(remaining).until(EC.presence_of_element_located(locator))
+            element.clear()
+            element.send_keys(text)
+        
+        self._retry(attempt, timeout)
+    
+    def fill_form(self, fields, typed=None, timeout=None):
+        """
+        Rellenar varios campos (inputs y selects) en una sola llamada JS
+        Recibe {locator: valor}; los selects se eligen por texto visible o por value
+        y los valores None se ignoran. Espera (hasta el timeout) a que existan todos
+        los campos y las opciones de los selects, que ParaBank carga por AJAX
+        typed (por defecto TYPED_FIELDS) son los locators que se escriben tecla a tecla
+        con send_keys, para campos que reaccionan a eventos de teclado; con
+        REALISTIC_TYPING se escriben así todos
+        """
+        self.invalidate_snapshot()
+        typed = set(self.TYPED_FIELDS if typed is None else typed)
+        fields = {locator: value for locator, value in fields.items() if value is not None}
+        keystrokes = {
+            locator: value for locator, value in fields.items()
+            if self.REALISTIC_TYPING or locator in typed
+        }
+        entries = [[*locator, str(value)] for locator, value in fields.items() if locator not in keystrokes]
+        if entries:
+            script = self.DOM_HELPERS_SCRIPT + self.FILL_FORM_SCRIPT
+            missing = []
+            
+            def filled(driver):
+                missing[:] = driver.execute_script(script, entries)
+                return not missing
+            
             try:
-                element = self.wait.until(EC.element_to_be_clickable(locator))
-                element.click()
-                return
-            except StaleElementReferenceException:
-                if attempt == retry - 1:
-                    raise
-                time.sleep(0.5)
+                self._wait(timeout).until(filled)
+            except TimeoutException:
+                raise TimeoutException(f"No se encontraron los campos del formulario: {', '.join(missing)}")
+        for locator, value in keystrokes.items():
+            self._type_field(locator, str(value), timeout)
     
-    def type(self, locator, text):
-        """Escribir texto en un campo"""
-        element = self.find_element(locator)
-        element.clear()
-        element.send_keys(text)
+    def _type_field(self, locator, text, timeout=None):
+        """Escribir un campo como un usuario: send_keys en inputs, Select en los selects"""
+        element = self.find_element(locator, timeout)
+        if element.tag_name.lower() != "select":
+            self.type(locator, text, timeout)
+            return
+        select = Select(element)
+        try:
+            select.select_by_visible_text(text)
+        except NoSuchElementException:
+            select.select_by_value(text)
     
-    def get_text(self, locator):
+    def get_text(self, locator, timeout=None):
         """Obtener el texto de un elemento"""
-        return self.find_element(locator).text
+        return self.find_element(locator, timeout).text
+    
+    def is_element_visible(self, locator, timeout=None):
+        """Verificar si un elemento es visible (esperando hasta el timeout)"""
+        try:
+            self._wait(timeout).until(EC.visibility_of_element_located(locator))
+            return True
+        except TimeoutException:
+            return False
+    
+    def is_element_displayed_now(self, locator):
+        """Verificar si un elemento es visible en este momento, sin esperar"""
+        for element in self.driver.find_elements(*locator):
+            try:
+                if element.is_displayed():
+                    return True
+            except StaleElementReferenceException:
+                pass
+        return False
     
-    def is_element_visible(self, locator):
-        """Verificar si un elemento es visible"""
+    def is_element_absent(self, locator, timeout=None):
+        """
+        Verificar que un elemento NO es visible
+        Si no está vuelve en seguida; si está, espera como mucho ABSENT_TIMEOUT a que desaparezca
+        """
+        if not self.is_element_displayed_now(locator):
+            return True
+        timeout = self.ABSENT_TIMEOUT if timeout is None else timeout
         try:
-            self.wait.until(EC.visibility_of_element_located(locator))
+            self._wait(timeout).until(EC.invisibility_of_element_located(locator))
             return True
-        except:
+        except TimeoutException:
             return False
     
+    def extract_texts(self, locator, timeout=None):
+        """
+        Obtener el texto de todos los elementos de un locator en una sola llamada JS
+        Espera hasta que haya al menos un elemento (como find_elements)
+        """
+        script = self.DOM_HELPERS_SCRIPT + "return resolve(arguments[0], arguments[1]).map(read);"
+        return self._wait(timeout).until(lambda driver: driver.execute_script(script, *locator) or False)
+    
+    def read_table(self, locator):
+        """
+        Filas de una tabla en este momento, sin esperar, como listas de textos de celda
+        en una sola llamada JS. Solo las filas con celdas <td> (se omite la cabecera);
+        lista vacía si la tabla no existe
+        """
+        script = self.DOM_HELPERS_SCRIPT + """
+            const table = resolve(arguments[0], arguments[1])[0];
+            if (!table) return [];
+            return Array.from(table.querySelectorAll('tr'))
+                .map(row => Array.from(row.querySelectorAll('td')).map(read))
+                .filter(cells => cells.length > 0);
+        """
+        return self.driver.execute_script(script, *locator)
+    
+    def extract_table(self, locator, timeout=None):
+        """
+        Obtener todas las filas de una tabla (ver read_table)
+        Espera hasta que la tabla tenga al menos una fila
+        """
+        return self._wait(timeout).until(lambda driver: self.read_table(locator) or False)
+    
+    def extract_fields(self, locators):
+        """
+        Leer varios campos a la vez en una sola llamada JS
+        Recibe {nombre: locator} y devuelve {nombre: texto o valor} (None si no existe)
+        """
+        script = self.DOM_HELPERS_SCRIPT + """
+            const result = {};
+            for (const [key, locator] of Object.entries(arguments[0])) {
+                const element = resolve(locator[0], locator[1])[0];
+                result[key] = element ? read(element) : null;
+            }
+            return result;
+        """
+        return self.driver.execute_script(script, {name: list(locator) for name, locator in locators.items()})
+    
+    def wait_for_url_contains(self, fragment, timeout=None):
+        """Esperar a que la URL actual contenga un texto"""
+        self.invalidate_snapshot()
+        self._wait(timeout).until(EC.url_contains(fragment))
+    
+    def wait_for_url_change(self, old_url, timeout=None):
+        """Esperar a que la URL deje de ser la indicada (p. ej. después de un click)"""
+        self.invalidate_snapshot()
+        self._wait(timeout).until(EC.url_changes(old_url))
+    
+    def wait_for_page_ready(self, timeout=None):
+        """
+        Esperar a que el documento esté cargado y no queden peticiones AJAX pendientes
+        ParaBank carga cuentas y resultados con jQuery, por eso se revisa jQuery.active
+        """
+        self._wait(timeout).until(lambda driver: driver.execute_script(self.PAGE_READY_SCRIPT))
+        self.record_page_timing()
+    
+    def wait_for_navigation(self, fragment, timeout=None):
+        """Esperar a llegar a una página (por su URL) y a que termine de cargar"""
+        self.wait_for_url_contains(fragment, timeout)
+        self.wait_for_page_ready(timeout)
+    
+    def wait_for_any_visible(self, *locators, timeout=None):
+        """
+        Esperar a que se vea alguno de los elementos (p. ej. panel de resultado o de error)
+        Devuelve el locator que apareció o None si no apareció ninguno
+        """
+        self.invalidate_snapshot()
+        def any_visible(driver):
+            for locator in locators:
+                if self.is_element_displayed_now(locator):
+                    return locator
+            return False
+        
+        try:
+            return self._wait(timeout).until(any_visible)
+        except TimeoutException:
+            return None
+    
+    def record_page_timing(self):
+        """
+        Registrar la Navigation Timing de la página actual si la medición está activa
+        (--page-timings: el fixture driver deja un PageTimingRecorder en driver.page_timing_recorder)
+        """
+        recorder = getattr(self.driver, "page_timing_recorder", None)
+        if recorder is not None:
+            recorder.capture(self.driver)
+    
+    def snapshot(self, refresh=False):
+        """
+        Copia local del DOM (PageSnapshot) para hacer varias consultas con un solo page_source
+        Se reutiliza hasta la siguiente navegación, interacción o espera de esta página
+        """
+        if refresh or self._snapshot is None:
+            self._snapshot = PageSnapshot(self.driver.page_source)
+        return self._snapshot
+    
+    def invalidate_snapshot(self):
+        """Descartar la copia del DOM (la página cambió o va a cambiar)"""
+        self._snapshot = None
+    
     def get_current_url(self):
         """Obtener la URL actual"""
         return self.driver.current_url
@@ -0,0 +1,69 @@
+from selenium.webdriver.common.by import By
+from pages.form_page import FormPage
+from pages.results import BillPayResult, parse_money
+
+
+class BillPayPage(FormPage):
+    """
+    Page Object para la página de pago de facturas (billpay.htm)
+    """
+    
+    PATH = "billpay.htm"
+    
+    # Locators (los campos del beneficiario solo tienen name)
+    PAYEE_NAME_INPUT = (By.NAME, "payee.name")
+    STREET_INPUT = (By.NAME, "payee.address.street")
+    CITY_INPUT = (By.NAME, "payee.address.city")
+    STATE_INPUT = (By.NAME, "payee.address.state")
+    ZIP_CODE_INPUT = (By.NAME, "payee.address.zipCode")
+    PHONE_INPUT = (By.NAME, "payee.phoneNumber")
+    ACCOUNT_NUMBER_INPUT = (By.NAME, "payee.accountNumber")
+    VERIFY_ACCOUNT_INPUT = (By.NAME, "verifyAccount")
+    AMOUNT_INPUT = (By.NAME, "amount")
+    FROM_ACCOUNT_SELECT = (By.NAME, "fromAccountId")
+    SUBMIT_BUTTON = (By.CSS_SELECTOR, "input[value='Send Payment']")
+    RESULT_PANEL = (By.ID, "billpayResult")
+    ERROR_PANEL = (By.ID, "billpayError")
+    
+    # El panel de resultado repite ids de campos (amount, fromAccountId): se buscan dentro de él
+    RESULT_FIELDS = {
+        "payee_name": (By.CSS_SELECTOR, "#billpayResult #payeeName"),
+        "amount": (By.CSS_SELECTOR, "#billpayResult #amount"),
+        "from_account_id": (By.CSS_SELECTOR, "#billpayResult #fromAccountId"),
+    }
+    
+    def __init__(self, driver, timeout=None):
+        super().__init__(driver, timeout)
+    
+    def get_account_options(self):
+        """Números de cuenta desde los que se puede pagar"""
+        return self.get_options(self.FROM_ACCOUNT_SELECT)
+    
+    def pay(self, payee_name=None, street=None, city=None, state=None, zip_code=None, phone=None,
+            account_number=None, verify_account=None, amount=None, from_account=None):
+        """
+        Completar y enviar el formulario de pago en una sola llamada JS
+        verify_account es account_number si no se indica; los campos None quedan vacíos
+        """
+        if verify_account is None:
+            verify_account = account_number
+        self.fill_form({
+            self.PAYEE_NAME_INPUT: payee_name,
+            self.STREET_INPUT: street,
+            self.CITY_INPUT: city,
+            self.STATE_INPUT: state,
+            self.ZIP_CODE_INPUT: zip_code,
+            self.PHONE_INPUT: phone,
+            self.ACCOUNT_NUMBER_INPUT: account_number,
+            self.VERIFY_ACCOUNT_INPUT: verify_account,
+            self.AMOUNT_INPUT: amount,
+            self.FROM_ACCOUNT_SELECT: from_account,
+        })
+        outcome = self.submit()
+        values = outcome["values"]
+        return BillPayResult(
+            outcome["success"], outcome["title"], outcome["errors"],
+            payee_name=values["payee_name"] or None,
+            amount=parse_money(values["amount"]),
+            from_account_id=values["from_account_id"] or None,
+        )
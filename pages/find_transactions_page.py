@@ -0,0 +1,66 @@
+from selenium.webdriver.common.by import By
+from pages.form_page import FormPage
+from pages.results import TransactionSearchResult, parse_money
+
+
+class FindTransactionsPage(FormPage):
+    """
+    Page Object para la página de buscar transacciones (findtrans.htm)
+    Cada criterio de búsqueda tiene su propio campo y su propio botón
+    """
+    
+    PATH = "findtrans.htm"
+    
+    # Locators
+    ACCOUNT_SELECT = (By.ID, "accountId")
+    TRANSACTION_ID_INPUT = (By.ID, "transactionId")
+    DATE_INPUT = (By.ID, "transactionDate")
+    FROM_DATE_INPUT = (By.ID, "fromDate")
+    TO_DATE_INPUT = (By.ID, "toDate")
+    AMOUNT_INPUT = (By.ID, "amount")
+    FIND_BY_ID_BUTTON = (By.ID, "findById")
+    FIND_BY_DATE_BUTTON = (By.ID, "findByDate")
+    FIND_BY_DATE_RANGE_BUTTON = (By.ID, "findByDateRange")
+    FIND_BY_AMOUNT_BUTTON = (By.ID, "findByAmount")
+    RESULT_PANEL = (By.ID, "resultContainer")
+    ERROR_PANEL = (By.ID, "errorContainer")
+    RESULT_TABLE = (By.CSS_SELECTOR, "#resultContainer #transactionTable")
+    
+    def __init__(self, driver, timeout=None):
+        super().__init__(driver, timeout)
+    
+    def get_selected_account(self):
+        """Cuenta seleccionada para la búsqueda (espera a que se carguen las cuentas)"""
+        self.get_options(self.ACCOUNT_SELECT)
+        return self.extract_fields({"account": self.ACCOUNT_SELECT})["account"]
+    
+    def find_by_id(self, transaction_id, account=None):
+        """Buscar una transacción por su ID"""
+        return self._find(self.FIND_BY_ID_BUTTON, {self.TRANSACTION_ID_INPUT: transaction_id}, account)
+    
+    def find_by_date(self, date, account=None):
+        """Buscar las transacciones de una fecha (MM-DD-YYYY)"""
+        return self._find(self.FIND_BY_DATE_BUTTON, {self.DATE_INPUT: date}, account)
+    
+    def find_by_date_range(self, from_date, to_date, account=None):
+        """Buscar las transacciones entre dos fechas (MM-DD-YYYY)"""
+        return self._find(
+            self.FIND_BY_DATE_RANGE_BUTTON, {self.FROM_DATE_INPUT: from_date, self.TO_DATE_INPUT: to_date}, account,
+        )
+    
+    def find_by_amount(self, amount, account=None):
+        """Buscar las transacciones de un monto"""
+        return self._find(self.FIND_BY_AMOUNT_BUTTON, {self.AMOUNT_INPUT: amount}, account)
+    
+    def _find(self, button, fields, account):
+        """Rellenar el criterio (y la cuenta si se indica), buscar y leer la tabla de resultados"""
+        self.fill_form({self.ACCOUNT_SELECT: account, **fields})
+        outcome = self.submit(button)
+        transactions = [
+            {"date": row[0], "description": row[1], "debit": parse_money(row[2]), "credit": parse_money(row[3])}
+            for row in outcome["rows"]
+            if len(row) >= 4
+        ]
+        return TransactionSearchResult(
+            outcome["success"], outcome["title"], outcome["errors"], transactions=transactions,
+        )
@@ -0,0 +1,78 @@
+from selenium.webdriver.common.by import By
+from pages.base_page import BasePage
+
+
+class FormPage(BasePage):
+    """
+    Base de las páginas de ParaBank con un formulario que, al enviarse, muestra
+    un panel de resultado o uno de error (transferencias, pagos, préstamos...)
+    Cada página define sus locators y los campos que se leen del resultado
+    """
+    
+    # Cada página define su botón de envío y sus paneles de resultado y de error
+    SUBMIT_BUTTON = None
+    RESULT_PANEL = None
+    ERROR_PANEL = None
+    # Mensajes de validación junto a los campos y mensajes de error de los paneles
+    ERROR_MESSAGES = (By.CSS_SELECTOR, "#rightPanel .error")
+    # Títulos de la página, del formulario y de los paneles (se lee el visible)
+    TITLES = (By.CSS_SELECTOR, "#rightPanel h1.title")
+    # {nombre: locator} que se leen del panel de resultado
+    RESULT_FIELDS = {}
+    # Tabla del panel de resultado que se lee fila por fila (None si no hay)
+    RESULT_TABLE = None
+    
+    # Lectura del resultado en un solo round-trip: campos, filas de la tabla,
+    # título visible y mensajes de error visibles (ParaBank deja ocultos en el
+    # DOM los paneles que no se usan, por eso se filtra por offsetParent)
+    OUTCOME_SCRIPT = """
+        const visible = element => element.offsetParent !== null;
+        const [fields, table, titles, errors] = arguments;
+        const values = {};
+        for (const [key, locator] of Object.entries(fields)) {
+            const element = resolve(locator[0], locator[1])[0];
+            values[key] = element ? read(element) : null;
+        }
+        const tableElement = table ? resolve(table[0], table[1])[0] : null;
+        const rows = tableElement ? Array.from(tableElement.querySelectorAll('tr'))
+            .map(row => Array.from(row.querySelectorAll('td')).map(read))
+            .filter(cells => cells.length > 0) : [];
+        const title = resolve(titles[0], titles[1]).filter(visible).map(read)[0] || '';
+        const messages = resolve(errors[0], errors[1]).filter(visible).map(read).filter(text => text);
+        return {values: values, rows: rows, title: title, errors: messages};
+    """
+    
+    def __init__(self, driver, timeout=None):
+        super().__init__(driver, timeout)
+    
+    def get_options(self, select_locator):
+        """Textos de las opciones de un select (espera a que ParaBank las cargue)"""
+        by, value = select_locator
+        if by == By.ID:
+            selector = f"[id='{value}'] option"
+        elif by == By.NAME:
+            selector = f"[name='{value}'] option"
+        else:
+            selector = f"{value} option"
+        return self.extract_texts((By.CSS_SELECTOR, selector))
+    
+    def submit(self, button=None, timeout=None):
+        """
+        Enviar el formulario y esperar al panel de resultado, al de error o a los
+        mensajes de validación; después se lee todo el resultado en una sola llamada JS
+        Devuelve un dict con success, values ({nombre: texto} de RESULT_FIELDS),
+        rows (filas de RESULT_TABLE), title y errors
+        """
+        self.click(button or self.SUBMIT_BUTTON)
+        outcomes = [locator for locator in (self.RESULT_PANEL, self.ERROR_PANEL, self.ERROR_MESSAGES) if locator]
+        shown = self.wait_for_any_visible(*outcomes, timeout=timeout)
+        script = self.DOM_HELPERS_SCRIPT + self.OUTCOME_SCRIPT
+        outcome = self.driver.execute_script(
+            script,
+            {name: list(locator) for name, locator in self.RESULT_FIELDS.items()},
+            list(self.RESULT_TABLE) if self.RESULT_TABLE else None,
+            list(self.TITLES),
+            list(self.ERROR_MESSAGES),
+        )
+        outcome["success"] = shown is not None and shown == self.RESULT_PANEL
+        return outcome
@@ -0,0 +1,268 @@
+import importlib
+import pkgutil
+import re
+import time
+from dataclasses import dataclass, field
+
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from selenium.webdriver.common.by import By
+
+import pages
+from pages.base_page import BasePage
+
+
+# Patrones de locator lentos o frágiles: (estrategia, regex sobre el valor, motivo)
+SLOW_PATTERNS = (
+    (By.XPATH, re.compile(r"^//.*(text\(\)|contains\(\.)"),
+     "búsqueda por texto en todo el documento"),
+    (By.XPATH, re.compile(r"(following|preceding)(-sibling)?::|ancestor::"),
+     "eje XPath relativo (following/preceding/ancestor)"),
+    (By.LINK_TEXT, re.compile(r""), "recorre todos los enlaces y calcula su texto visible"),
+    (By.PARTIAL_LINK_TEXT, re.compile(r""), "recorre todos los enlaces y calcula su texto visible"),
+)
+
+# Un paso XPath sencillo: tag (o *) con predicados de atributo exactos
+_XPATH_STEP = re.compile(r"^(\w+|\*)((?:\[@[\w.-]+='[^']*'\])*)$")
+_XPATH_PREDICATE = re.compile(r"\[@([\w.-]+)='([^']*)'\]")
+
+
+def _css_ident(value):
+    """Escapar un identificador para CSS (los ids de ParaBank llevan puntos: customer.firstName)"""
+    return re.sub(r"([^\w-])", r"\\\1", value)
+
+
+def _css_step(tag, predicates):
+    css = "" if tag == "*" else tag
+    for name, value in _XPATH_PREDICATE.findall(predicates):
+        if name == "id":
+            css += "#" + _css_ident(value)
+        elif name == "class" and " " not in value:
+            css += "." + _css_ident(value)
+        else:
+            css += f"[{name}='{value}']"
+    return css or "*"
+
+
+def css_equivalent(locator):
+    """
+    CSS equivalente a un locator, o None si no lo hay (texto, ejes, funciones)
+    Traduce By.ID/NAME/CLASS_NAME/TAG_NAME y XPath de pasos simples (//tag[@attr='v']//tag)
+    """
+    by, value = locator
+    if by == By.CSS_SELECTOR:
+        return value
+    if by == By.ID:
+        return "#" + _css_ident(value)
+    if by == By.NAME:
+        return f"[name='{value}']"
+    if by == By.CLASS_NAME:
+        return "." + _css_ident(value)
+    if by == By.TAG_NAME:
+        return value
+    if by != By.XPATH or not value.startswith("//"):
+        return None
+    parts = []
+    # Separadores: '//' (descendiente) y '/' (hijo directo)
+    for separator, step in re.findall(r"(//|/)([^/]+)", value):
+        match = _XPATH_STEP.match(step)
+        if match is None:
+            return None
+        if parts:
+            parts.append(" " if separator == "//" else " > ")
+        parts.append(_css_step(*match.groups()))
+    return "".join(parts) or None
+
+
+def locator_warnings(locator):
+    """Motivos por los que un locator es lento o mejorable (lista vacía si no hay ninguno)"""
+    by, value = locator
+    warnings = [reason for strategy, pattern, reason in SLOW_PATTERNS if by == strategy and pattern.search(value)]
+    if by == By.XPATH and not warnings and css_equivalent(locator):
+        warnings.append("XPath con equivalente CSS directo")
+    return warnings
+
+
+def compile_locator(locator):
+    """
+    Compilar un locator de Selenium a una función que busca en un árbol lxml
+    Se compila una sola vez y se reutiliza en todas las validaciones y mediciones
+    """
+    by, value = locator
+    if by == By.XPATH:
+        return etree.XPath(value)
+    if by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+        condition = "normalize-space(string(.)) = $text" if by == By.LINK_TEXT else "contains(string(.), $text)"
+        query = etree.XPath(f"//a[{condition}]")
+        return lambda tree: query(tree, text=value)
+    css = css_equivalent(locator)
+    if css is None:
+        raise ValueError(f"Locator no soportado: {locator}")
+    return CSSSelector(css)
+
+
+def _is_locator(value):
+    return isinstance(value, tuple) and len(value) == 2 and all(isinstance(part, str) for part in value)
+
+
+def page_locators(page_class):
+    """
+    Locators de un page object: atributos en MAYÚSCULAS que son tuplas (By, valor)
+    Los mapas {nombre: locator} (RESULT_FIELDS...) se aplanan como RESULT_FIELDS.amount
+    """
+    locators = {}
+    for cls in reversed(page_class.__mro__):
+        for name, value in vars(cls).items():
+            if not name.isupper():
+                continue
+            if _is_locator(value):
+                locators[name] = value
+            elif isinstance(value, dict):
+                locators.update(
+                    (f"{name}.{key}", locator) for key, locator in value.items() if _is_locator(locator)
+                )
+    return locators
+
+
+def discover_pages():
+    """Importar todos los módulos de pages/ y devolver los page objects (subclases de BasePage)"""
+    for module in pkgutil.iter_modules(pages.__path__):
+        importlib.import_module(f"pages.{module.name}")
+    found = []
+    pending = list(BasePage.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        found.append(cls)
+        pending.extend(cls.__subclasses__())
+    return sorted(found, key=lambda cls: cls.__name__)
+
+
+def _dom_suggestion(element):
+    """Selector corto para un elemento concreto del DOM: su id, su href o su ancestro con id"""
+    if element.get("id"):
+        return "#" + _css_ident(element.get("id"))
+    if element.tag == "a" and element.get("href"):
+        target = element.get("href").split(";")[0].split("?")[0].rsplit("/", 1)[-1]
+        if target:
+            return f"a[href*='{target}']"
+    step = element.tag + "".join("." + _css_ident(c) for c in (element.get("class") or "").split())
+    for ancestor in element.iterancestors():
+        if ancestor.get("id"):
+            return f"#{_css_ident(ancestor.get('id'))} {step}"
+    return None
+
+
+@dataclass
+class LocatorReport:
+    """Resultado de validar un locator contra los DOM capturados"""
+    page: str
+    name: str
+    locator: tuple
+    matches: int = 0
+    warnings: list = field(default_factory=list)
+    suggestion: str = None
+    error: str = None
+    cost_ms: float = None
+
+
+class LocatorRegistry:
+    """
+    Registro de los locators de todos los page objects
+    Valida cada locator una vez contra DOM capturados (PageSnapshot), marca los
+    patrones lentos, propone equivalentes CSS/id y mide el coste de cada búsqueda
+    """
+    
+    def __init__(self, page_classes=None):
+        self.pages = {cls.__name__: page_locators(cls) for cls in (page_classes or discover_pages())}
+        self._compiled = {}
+    
+    def compiled(self, locator):
+        if locator not in self._compiled:
+            self._compiled[locator] = compile_locator(locator)
+        return self._compiled[locator]
+    
+    def analyze(self):
+        """Análisis estático (sin DOM): locators con patrones lentos"""
+        reports = []
+        for page, locators in self.pages.items():
+            for name, locator in locators.items():
+                warnings = locator_warnings(locator)
+                if warnings:
+                    suggestion = css_equivalent(locator) if locator[0] != By.CSS_SELECTOR else None
+                    reports.append(LocatorReport(page, name, locator, warnings=warnings, suggestion=suggestion))
+        return reports
+    
+    def validate(self, page, snapshots):
+        """
+        Validar los locators de una página contra uno o varios DOM capturados
+        (p. ej. la página antes y después de enviar un formulario)
+        matches es el máximo de elementos encontrados en alguno de los DOM
+        """
+        reports = []
+        for name, locator in self.pages[page].items():
+            report = LocatorReport(page, name, locator, warnings=locator_warnings(locator))
+            try:
+                query = self.compiled(locator)
+            except (ValueError, etree.XPathSyntaxError) as e:
+                report.error = str(e)
+                reports.append(report)
+                continue
+            first = None
+            for snapshot in snapshots:
+                found = query(snapshot.tree)
+                report.matches = max(report.matches, len(found))
+                if found and first is None:
+                    first = found[0]
+            if report.warnings:
+                report.suggestion = css_equivalent(locator) if locator[0] != By.CSS_SELECTOR else None
+                if report.suggestion is None and first is not None:
+                    report.suggestion = _dom_suggestion(first)
+            reports.append(report)
+        return reports
+    
+    def benchmark_snapshot(self, reports, snapshot, repeats=200):
+        """Coste medio (ms) de cada búsqueda sobre un DOM capturado, con los locators compilados"""
+        for report in reports:
+            if report.error:
+                continue
+            query = self.compiled(report.locator)
+            start = time.perf_counter()
+            for _ in range(repeats):
+                query(snapshot.tree)
+            report.cost_ms = (time.perf_counter() - start) / repeats * 1000
+        return reports
+    
+    def benchmark_browser(self, driver, reports, repeats=200):
+        """
+        Coste medio (ms) de cada búsqueda en el navegador, sobre la página abierta
+        Todas las mediciones se hacen en una sola llamada JS con performance.now()
+        """
+        script = BasePage.DOM_HELPERS_SCRIPT + """
+            const [locators, repeats] = arguments;
+            const costs = {};
+            for (const [key, locator] of Object.entries(locators)) {
+                const start = performance.now();
+                for (let i = 0; i < repeats; i++) resolve(locator[0], locator[1]);
+                costs[key] = (performance.now() - start) / repeats;
+            }
+            return costs;
+        """
+        measured = [report for report in reports if not report.error]
+        costs = driver.execute_script(
+            script, {str(i): list(report.locator) for i, report in enumerate(measured)}, repeats,
+        )
+        for i, report in enumerate(measured):
+            report.cost_ms = costs[str(i)]
+        return reports
+
+
+def format_reports(reports):
+    """Tabla de texto con el resultado de validate()/benchmark_*()"""
+    lines = [f"{'locator':<45}{'coinc.':>7}{'coste ms':>10}  avisos / sugerencia"]
+    for report in reports:
+        cost = f"{report.cost_ms:>10.4f}" if report.cost_ms is not None else f"{'-':>10}"
+        notes = report.error or "; ".join(report.warnings)
+        if report.suggestion:
+            notes += f" -> {report.suggestion}"
+        lines.append(f"{report.page + '.' + report.name:<45}{report.matches:>7}{cost}  {notes}")
+    return "\n".join(lines)
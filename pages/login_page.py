@@ -7,18 +7,20 @@ class LoginPage(BasePage):
     Page Object para la página de login de ParaBank
     """
     
+    PATH = "index.htm"
+    
     # Locators
     USERNAME_INPUT = (By.NAME, "username")
     PASSWORD_INPUT = (By.NAME, "password")
-    LOGIN_BUTTON = (By.XPATH, "//input[@value='Log In']")
-    REGISTER_LINK = (By.LINK_TEXT, "Register")
-    FORGOT_LOGIN_LINK = (By.LINK_TEXT, "Forgot login info?")
+    LOGIN_BUTTON = (By.CSS_SELECTOR, "input[value='Log In']")
+    REGISTER_LINK = (By.CSS_SELECTOR, "a[href*='register.htm']")
+    FORGOT_LOGIN_LINK = (By.CSS_SELECTOR, "a[href*='lookup.htm']")
     ERROR_MESSAGE = (By.CLASS_NAME, "error")
-    ERROR_TITLE = (By.XPATH, "//h1[@class='title']")
-    WELCOME_MESSAGE = (By.XPATH, "//p[@class='smallText']")
+    ERROR_TITLE = (By.CSS_SELECTOR, "#rightPanel h1.title")
+    WELCOME_MESSAGE = (By.CSS_SELECTOR, "#leftPanel p.smallText")
     
-    def __init__(self, driver):
-        super().__init__(driver)
+    def __init__(self, driver, timeout=None):
+        super().__init__(driver, timeout)
     
     def enter_username(self, username):
         """Ingresar nombre de usuario"""
@@ -33,29 +35,29 @@ class LoginPage(BasePage):
         self.click(self.LOGIN_BUTTON)
     
     def login(self, username, password):
-        """Realizar login completo"""
-        self.enter_username(username)
-        self.enter_password(password)
+        """Realizar login completo (usuario y contraseña en una sola llamada JS)"""
+        self.fill_form({
+            self.USERNAME_INPUT: username,
+            self.PASSWORD_INPUT: password,
+        })
         self.click_login()
     
     def click_register(self):
         """Hacer click en el enlace de registro"""
         self.click(self.REGISTER_LINK)
     
-    def is_error_displayed(self):
+    def is_error_displayed(self, timeout=None):
         """Verificar si se muestra un mensaje de error"""
-        # ParaBank puede mostrar el error en diferentes elementos
-        return (self.is_element_visible(self.ERROR_MESSAGE) or 
-                self.is_element_visible(self.ERROR_TITLE))
+        # ParaBank puede mostrar el error en diferentes elementos: se esperan ambos a la vez
+        return self.wait_for_any_visible(self.ERROR_MESSAGE, self.ERROR_TITLE, timeout=timeout) is not None
     
-    def get_error_message(self):
+    def get_error_message(self, timeout=None):
         """Obtener el mensaje de error"""
-        if self.is_element_visible(self.ERROR_MESSAGE):
-            return self.get_text(self.ERROR_MESSAGE)
-        elif self.is_element_visible(self.ERROR_TITLE):
-            return self.get_text(self.ERROR_TITLE)
-        return ""
+        locator = self.wait_for_any_visible(self.ERROR_MESSAGE, self.ERROR_TITLE, timeout=timeout)
+        if locator is None:
+            return ""
+        return self.get_text(locator)
     
-    def is_login_successful(self):
+    def is_login_successful(self, timeout=None):
         """Verificar si el login fue exitoso"""
-        return self.is_element_visible(self.WELCOME_MESSAGE)
+        return self.is_element_visible(self.WELCOME_MESSAGE, timeout)
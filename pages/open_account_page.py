@@ -0,0 +1,45 @@
+from selenium.webdriver.common.by import By
+from pages.form_page import FormPage
+from pages.results import OpenAccountResult
+
+
+class OpenAccountPage(FormPage):
+    """
+    Page Object para la página de abrir nueva cuenta (openaccount.htm)
+    """
+    
+    PATH = "openaccount.htm"
+    
+    # Locators
+    TYPE_SELECT = (By.ID, "type")
+    FROM_ACCOUNT_SELECT = (By.ID, "fromAccountId")
+    SUBMIT_BUTTON = (By.CSS_SELECTOR, "input[value='Open New Account']")
+    RESULT_PANEL = (By.ID, "openAccountResult")
+    ERROR_PANEL = (By.ID, "openAccountError")
+    
+    RESULT_FIELDS = {
+        "account_id": (By.ID, "newAccountId"),
+    }
+    
+    def __init__(self, driver, timeout=None):
+        super().__init__(driver, timeout)
+    
+    def get_selected_type(self):
+        """Tipo de cuenta seleccionado (CHECKING por defecto)"""
+        self.find_element(self.TYPE_SELECT)
+        return self.extract_fields({"type": self.TYPE_SELECT})["type"]
+    
+    def open_account(self, account_type=None, from_account=None):
+        """
+        Abrir una cuenta del tipo indicado (CHECKING, SAVINGS) con fondos de from_account
+        Los valores None dejan la selección por defecto del formulario
+        """
+        self.fill_form({
+            self.TYPE_SELECT: account_type,
+            self.FROM_ACCOUNT_SELECT: from_account,
+        })
+        outcome = self.submit()
+        return OpenAccountResult(
+            outcome["success"], outcome["title"], outcome["errors"],
+            account_id=outcome["values"]["account_id"] or None,
+        )
@@ -0,0 +1,54 @@
+from functools import cached_property
+
+from lxml import html as lxml_html
+
+
+class PageSnapshot:
+    """
+    Copia local del DOM de una página
+    Se descarga una sola vez con driver.page_source y todas las consultas
+    (texto, substrings, XPath) se resuelven en local sin volver al navegador
+    """
+    
+    def __init__(self, html):
+        self.html = html
+    
+    @cached_property
+    def lower_html(self):
+        """HTML en minúsculas para búsquedas sin distinguir mayúsculas"""
+        return self.html.lower()
+    
+    @cached_property
+    def tree(self):
+        """Árbol lxml del HTML (se parsea solo la primera vez que se usa)"""
+        return lxml_html.fromstring(self.html)
+    
+    @cached_property
+    def text(self):
+        """Texto de la página sin etiquetas, scripts ni estilos"""
+        nodes = self.tree.xpath("//text()[not(ancestor::script) and not(ancestor::style)]")
+        return " ".join(" ".join(nodes).split())
+    
+    def contains(self, needle, ignore_case=False):
+        """Verificar si el HTML contiene un texto"""
+        if ignore_case:
+            return needle.lower() in self.lower_html
+        return needle in self.html
+    
+    def contains_any(self, *needles, ignore_case=False):
+        """Verificar si el HTML contiene alguno de los textos"""
+        return any(self.contains(needle, ignore_case) for needle in needles)
+    
+    def count(self, needle, ignore_case=False):
+        """Contar las apariciones de un texto en el HTML"""
+        if ignore_case:
+            return self.lower_html.count(needle.lower())
+        return self.html.count(needle)
+    
+    def xpath(self, expression):
+        """Evaluar una expresión XPath sobre la copia local"""
+        return self.tree.xpath(expression)
+    
+    def xpath_texts(self, expression):
+        """Textos (sin espacios sobrantes) de los elementos que cumplen un XPath"""
+        return [" ".join(element.text_content().split()) for element in self.xpath(expression)]
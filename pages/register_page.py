@@ -0,0 +1,57 @@
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from pages.base_page import BasePage
+
+
+class RegisterPage(BasePage):
+    """
+    Page Object para la página de registro de clientes
+    """
+    
+    PATH = "register.htm"
+    
+    # Locators
+    FIRST_NAME_INPUT = (By.ID, "customer.firstName")
+    LAST_NAME_INPUT = (By.ID, "customer.lastName")
+    STREET_INPUT = (By.ID, "customer.address.street")
+    CITY_INPUT = (By.ID, "customer.address.city")
+    STATE_INPUT = (By.ID, "customer.address.state")
+    ZIP_CODE_INPUT = (By.ID, "customer.address.zipCode")
+    PHONE_INPUT = (By.ID, "customer.phoneNumber")
+    SSN_INPUT = (By.ID, "customer.ssn")
+    USERNAME_INPUT = (By.ID, "customer.username")
+    PASSWORD_INPUT = (By.ID, "customer.password")
+    CONFIRM_PASSWORD_INPUT = (By.ID, "repeatedPassword")
+    REGISTER_BUTTON = (By.CSS_SELECTOR, "input[value='Register']")
+    # Párrafo del panel derecho; el texto de éxito se comprueba en is_registration_successful
+    SUCCESS_MESSAGE = (By.CSS_SELECTOR, "#rightPanel > p")
+    SUCCESS_TEXT = "Your account was created successfully"
+    
+    def __init__(self, driver, timeout=None):
+        super().__init__(driver, timeout)
+    
+    def register(self, username, password, first_name="QA", last_name="Worker"):
+        """Completar el formulario de registro en una sola llamada JS y enviarlo"""
+        self.fill_form({
+            self.FIRST_NAME_INPUT: first_name,
+            self.LAST_NAME_INPUT: last_name,
+            self.STREET_INPUT: "1 Test Street",
+            self.CITY_INPUT: "Testville",
+            self.STATE_INPUT: "TS",
+            self.ZIP_CODE_INPUT: "12345",
+            self.PHONE_INPUT: "555-0100",
+            self.SSN_INPUT: "123-45-6789",
+            self.USERNAME_INPUT: username,
+            self.PASSWORD_INPUT: password,
+            self.CONFIRM_PASSWORD_INPUT: password,
+        })
+        self.click(self.REGISTER_BUTTON)
+    
+    def is_registration_successful(self):
+        """Verificar si el registro fue exitoso (ParaBank deja al usuario logueado)"""
+        try:
+            self.wait.until(EC.text_to_be_present_in_element(self.SUCCESS_MESSAGE, self.SUCCESS_TEXT))
+            return True
+        except TimeoutException:
+            return False
@@ -0,0 +1,51 @@
+from selenium.webdriver.common.by import By
+from pages.form_page import FormPage
+from pages.results import LoanResult
+
+
+class RequestLoanPage(FormPage):
+    """
+    Page Object para la página de solicitar préstamo (requestloan.htm)
+    """
+    
+    PATH = "requestloan.htm"
+    
+    # Locators
+    AMOUNT_INPUT = (By.ID, "amount")
+    DOWN_PAYMENT_INPUT = (By.ID, "downPayment")
+    FROM_ACCOUNT_SELECT = (By.ID, "fromAccountId")
+    SUBMIT_BUTTON = (By.CSS_SELECTOR, "input[value='Apply Now']")
+    RESULT_PANEL = (By.ID, "requestLoanResult")
+    ERROR_PANEL = (By.ID, "requestLoanError")
+    
+    RESULT_FIELDS = {
+        "provider": (By.ID, "loanProviderName"),
+        "status": (By.ID, "loanStatus"),
+        "account_id": (By.ID, "newAccountId"),
+    }
+    
+    def __init__(self, driver, timeout=None):
+        super().__init__(driver, timeout)
+    
+    def get_account_options(self):
+        """Números de cuenta desde los que se puede pagar el anticipo"""
+        return self.get_options(self.FROM_ACCOUNT_SELECT)
+    
+    def request_loan(self, amount=None, down_payment=None, from_account=None):
+        """
+        Solicitar un préstamo; los campos None quedan vacíos (o con la cuenta por defecto)
+        El préstamo puede ser aprobado o denegado: ver LoanResult.approved
+        """
+        self.fill_form({
+            self.AMOUNT_INPUT: amount,
+            self.DOWN_PAYMENT_INPUT: down_payment,
+            self.FROM_ACCOUNT_SELECT: from_account,
+        })
+        outcome = self.submit()
+        values = outcome["values"]
+        return LoanResult(
+            outcome["success"], outcome["title"], outcome["errors"],
+            provider=values["provider"] or None,
+            status=values["status"] or None,
+            account_id=values["account_id"] or None,
+        )
@@ -0,0 +1,66 @@
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+
+
+def parse_money(text):
+    """Convertir un monto de la página ('$1,050.00', '-$10.00', '10.00') a Decimal (None si no hay)"""
+    cleaned = (text or "").replace("$", "").replace(",", "").strip()
+    if not cleaned:
+        return None
+    try:
+        return Decimal(cleaned)
+    except InvalidOperation:
+        return None
+
+
+@dataclass
+class FormResult:
+    """
+    Resultado de enviar un formulario de ParaBank
+    success indica si apareció el panel de resultado; errors son los mensajes de
+    validación o del panel de error visibles y title el título que se muestra
+    """
+    success: bool
+    title: str = ""
+    errors: list = field(default_factory=list)
+
+
+@dataclass
+class TransferResult(FormResult):
+    amount: Decimal = None
+    from_account_id: str = None
+    to_account_id: str = None
+
+
+@dataclass
+class BillPayResult(FormResult):
+    payee_name: str = None
+    amount: Decimal = None
+    from_account_id: str = None
+
+
+@dataclass
+class OpenAccountResult(FormResult):
+    account_id: str = None
+
+
+@dataclass
+class TransactionSearchResult(FormResult):
+    # Filas de la tabla de resultados: dicts con date, description, debit y credit
+    transactions: list = field(default_factory=list)
+
+
+@dataclass
+class UpdateProfileResult(FormResult):
+    pass
+
+
+@dataclass
+class LoanResult(FormResult):
+    provider: str = None
+    status: str = None
+    account_id: str = None
+    
+    @property
+    def approved(self):
+        return self.status == "Approved"
@@ -0,0 +1,51 @@
+from selenium.webdriver.common.by import By
+from pages.form_page import FormPage
+from pages.results import TransferResult, parse_money
+
+
+class TransferPage(FormPage):
+    """
+    Page Object para la página de transferencia de fondos (transfer.htm)
+    """
+    
+    PATH = "transfer.htm"
+    
+    # Locators
+    AMOUNT_INPUT = (By.ID, "amount")
+    FROM_ACCOUNT_SELECT = (By.ID, "fromAccountId")
+    TO_ACCOUNT_SELECT = (By.ID, "toAccountId")
+    SUBMIT_BUTTON = (By.CSS_SELECTOR, "input[value='Transfer']")
+    RESULT_PANEL = (By.ID, "showResult")
+    ERROR_PANEL = (By.ID, "showError")
+    
+    RESULT_FIELDS = {
+        "amount": (By.ID, "amountResult"),
+        "from_account_id": (By.ID, "fromAccountIdResult"),
+        "to_account_id": (By.ID, "toAccountIdResult"),
+    }
+    
+    def __init__(self, driver, timeout=None):
+        super().__init__(driver, timeout)
+    
+    def get_account_options(self):
+        """Números de cuenta disponibles como origen"""
+        return self.get_options(self.FROM_ACCOUNT_SELECT)
+    
+    def transfer(self, amount, from_account=None, to_account=None):
+        """
+        Transferir un monto entre cuentas (las cuentas None quedan como estén)
+        Un monto vacío deja el campo vacío, p. ej. para probar la validación
+        """
+        self.fill_form({
+            self.AMOUNT_INPUT: amount,
+            self.FROM_ACCOUNT_SELECT: from_account,
+            self.TO_ACCOUNT_SELECT: to_account,
+        })
+        outcome = self.submit()
+        values = outcome["values"]
+        return TransferResult(
+            outcome["success"], outcome["title"], outcome["errors"],
+            amount=parse_money(values["amount"]),
+            from_account_id=values["from_account_id"] or None,
+            to_account_id=values["to_account_id"] or None,
+        )
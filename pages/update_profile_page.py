@@ -0,0 +1,63 @@
+from selenium.webdriver.common.by import By
+from pages.form_page import FormPage
+from pages.results import UpdateProfileResult
+
+
+class UpdateProfilePage(FormPage):
+    """
+    Page Object para la página de actualizar información de contacto (updateprofile.htm)
+    """
+    
+    PATH = "updateprofile.htm"
+    
+    # Locators
+    FIRST_NAME_INPUT = (By.ID, "customer.firstName")
+    LAST_NAME_INPUT = (By.ID, "customer.lastName")
+    STREET_INPUT = (By.ID, "customer.address.street")
+    CITY_INPUT = (By.ID, "customer.address.city")
+    STATE_INPUT = (By.ID, "customer.address.state")
+    ZIP_CODE_INPUT = (By.ID, "customer.address.zipCode")
+    PHONE_INPUT = (By.ID, "customer.phoneNumber")
+    SUBMIT_BUTTON = (By.CSS_SELECTOR, "input[value='Update Profile']")
+    RESULT_PANEL = (By.ID, "updateProfileResult")
+    ERROR_PANEL = (By.ID, "updateProfileError")
+    
+    # Campos del perfil por nombre (el mismo que usan get_profile y update_profile)
+    PROFILE_FIELDS = {
+        "first_name": FIRST_NAME_INPUT,
+        "last_name": LAST_NAME_INPUT,
+        "street": STREET_INPUT,
+        "city": CITY_INPUT,
+        "state": STATE_INPUT,
+        "zip_code": ZIP_CODE_INPUT,
+        "phone": PHONE_INPUT,
+    }
+    
+    def __init__(self, driver, timeout=None):
+        super().__init__(driver, timeout)
+    
+    def get_profile(self):
+        """
+        Leer todos los campos del perfil en una sola llamada JS
+        ParaBank los rellena por AJAX: se espera a que el nombre tenga valor
+        """
+        def loaded_profile(driver):
+            profile = self.extract_fields(self.PROFILE_FIELDS)
+            return profile if profile["first_name"] else False
+        
+        return self.wait.until(loaded_profile)
+    
+    def update_profile(self, **changes):
+        """
+        Cambiar los campos indicados (first_name, street, phone...) y enviar el formulario
+        Los demás campos se quedan con el valor que ya tienen. Antes de rellenar se
+        espera a que ParaBank cargue el perfil por AJAX: si la carga llegara después
+        pisaría los valores nuevos
+        """
+        unknown = set(changes) - set(self.PROFILE_FIELDS)
+        if unknown:
+            raise ValueError(f"Campos de perfil desconocidos: {', '.join(sorted(unknown))}")
+        self.get_profile()
+        self.fill_form({self.PROFILE_FIELDS[name]: value for name, value in changes.items()})
+        outcome = self.submit()
+        return UpdateProfileResult(outcome["success"], outcome["title"], outcome["errors"])
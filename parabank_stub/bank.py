@@ -0,0 +1,283 @@
+import itertools
+import threading
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from decimal import Decimal, InvalidOperation
+
+
+ACCOUNT_TYPES = ["CHECKING", "SAVINGS", "LOAN"]
+
+# Depósito mínimo que ParaBank mueve de la cuenta origen al abrir una cuenta nueva
+MINIMUM_OPENING_DEPOSIT = Decimal("100.00")
+
+# Saldo con el que ParaBank crea la primera cuenta de un cliente recién registrado
+NEW_CUSTOMER_BALANCE = Decimal("515.50")
+
+
+class BankError(Exception):
+    """Error de negocio (cuenta inexistente, monto inválido...) con el mensaje que da ParaBank"""
+
+
+@dataclass
+class Address:
+    street: str = ""
+    city: str = ""
+    state: str = ""
+    zipCode: str = ""
+
+
+@dataclass
+class Customer:
+    id: int
+    firstName: str
+    lastName: str
+    address: Address
+    phoneNumber: str
+    ssn: str
+    username: str
+    password: str
+
+
+@dataclass
+class Account:
+    id: int
+    customerId: int
+    type: str
+    balance: Decimal
+
+
+@dataclass
+class Transaction:
+    id: int
+    accountId: int
+    type: str  # Credit / Debit
+    date: date
+    amount: Decimal
+    description: str
+
+
+@dataclass
+class Bank:
+    """
+    Estado en memoria del banco de pruebas
+    Todas las operaciones se hacen bajo un lock porque el servidor atiende en varios hilos
+    """
+    customers: dict = field(default_factory=dict)
+    accounts: dict = field(default_factory=dict)
+    transactions: list = field(default_factory=list)
+    
+    def __post_init__(self):
+        self._lock = threading.RLock()
+        self._customer_ids = itertools.count(12323, 111)
+        self._account_ids = itertools.count(13677, 111)
+        self._transaction_ids = itertools.count(14476, 111)
+    
+    @classmethod
+    def with_demo_data(cls):
+        """Banco con el cliente john/demo y las cuentas que usan los tests"""
+        bank = cls()
+        john = Customer(
+            12212, "John", "Smith", Address("1431 Main St", "Beverly Hills", "CA", "90210"),
+            "310-447-4121", "622-11-9999", "john", "demo",
+        )
+        bank.customers[john.id] = john
+        today = date.today()
+        for account_id, account_type, balance in [
+            (13344, "CHECKING", Decimal("1000.00")),
+            (13455, "CHECKING", Decimal("500.00")),
+            (13566, "SAVINGS", Decimal("2500.00")),
+        ]:
+            bank.accounts[account_id] = Account(account_id, john.id, account_type, balance)
+            bank._record(account_id, "Credit", balance, "Funds Transfer Received", today - timedelta(days=10))
+        bank._record(13344, "Debit", Decimal("100.00"), "Funds Transfer Sent", today - timedelta(days=2))
+        bank._record(13344, "Credit", Decimal("100.00"), "Deposit via Web Service", today)
+        return bank
+    
+    # --- Utilidades -------------------------------------------------------
+    
+    @staticmethod
+    def parse_amount(value):
+        """Convertir un monto recibido como texto, o lanzar BankError"""
+        try:
+            amount = Decimal(str(value).strip())
+        except (InvalidOperation, ValueError):
+            raise BankError(f"Invalid amount: {value}")
+        if not amount.is_finite():
+            raise BankError(f"Invalid amount: {value}")
+        return amount
+    
+    def _record(self, account_id, kind, amount, description, on=None):
+        transaction = Transaction(
+            next(self._transaction_ids), account_id, kind, on or date.today(), amount, description,
+        )
+        self.transactions.append(transaction)
+        return transaction
+    
+    # --- Clientes -------------------------------------------------------
+    
+    def login(self, username, password):
+        with self._lock:
+            for customer in self.customers.values():
+                if customer.username == username and customer.password == password:
+                    return customer
+        raise BankError("Invalid username and/or password")
+    
+    def get_customer(self, customer_id):
+        try:
+            customer_id = int(customer_id)
+        except (TypeError, ValueError):
+            raise BankError(f"Could not find customer #{customer_id}")
+        with self._lock:
+            customer = self.customers.get(customer_id)
+        if customer is None:
+            raise BankError(f"Could not find customer #{customer_id}")
+        return customer
+    
+    def username_exists(self, username):
+        with self._lock:
+            return any(customer.username == username for customer in self.customers.values())
+    
+    def register(self, first_name, last_name, address, phone, ssn, username, password):
+        """Alta de cliente con su primera cuenta, como en register.htm"""
+        with self._lock:
+            if self.username_exists(username):
+                raise BankError("This username already exists.")
+            customer = Customer(
+                next(self._customer_ids), first_name, last_name, address, phone, ssn, username, password,
+            )
+            self.customers[customer.id] = customer
+            account = Account(next(self._account_ids), customer.id, "CHECKING", NEW_CUSTOMER_BALANCE)
+            self.accounts[account.id] = account
+            self._record(account.id, "Credit", NEW_CUSTOMER_BALANCE, "Funds Transfer Received")
+            return customer
+    
+    def update_customer(self, customer_id, **fields):
+        with self._lock:
+            customer = self.get_customer(customer_id)
+            for name in ("firstName", "lastName", "phoneNumber", "ssn"):
+                if name in fields:
+                    setattr(customer, name, fields[name])
+            for name in ("street", "city", "state", "zipCode"):
+                if name in fields:
+                    setattr(customer.address, name, fields[name])
+            return customer
+    
+    # --- Cuentas y movimientos -----------------------------------------
+    
+    def get_account(self, account_id):
+        try:
+            account_id = int(account_id)
+        except (TypeError, ValueError):
+            raise BankError(f"Could not find account #{account_id}")
+        with self._lock:
+            account = self.accounts.get(account_id)
+        if account is None:
+            raise BankError(f"Could not find account #{account_id}")
+        return account
+    
+    def accounts_for(self, customer_id):
+        customer = self.get_customer(customer_id)
+        with self._lock:
+            return [account for account in self.accounts.values() if account.customerId == customer.id]
+    
+    def transactions_for(self, account_id):
+        account = self.get_account(account_id)
+        with self._lock:
+            return [transaction for transaction in self.transactions if transaction.accountId == account.id]
+    
+    def get_transaction(self, transaction_id):
+        with self._lock:
+            for transaction in self.transactions:
+                if str(transaction.id) == str(transaction_id):
+                    return transaction
+        raise BankError(f"Could not find transaction #{transaction_id}")
+    
+    def deposit(self, account_id, amount, description="Deposit via Web Service"):
+        amount = self.parse_amount(amount)
+        if amount <= 0:
+            raise BankError(f"Invalid amount: {amount}")
+        with self._lock:
+            account = self.get_account(account_id)
+            account.balance += amount
+            self._record(account.id, "Credit", amount, description)
+        return account
+    
+    def withdraw(self, account_id, amount, description="Withdrawal via Web Service"):
+        amount = self.parse_amount(amount)
+        if amount <= 0:
+            raise BankError(f"Invalid amount: {amount}")
+        with self._lock:
+            account = self.get_account(account_id)
+            account.balance -= amount
+            self._record(account.id, "Debit", amount, description)
+        return account
+    
+    def transfer(self, from_account_id, to_account_id, amount):
+        amount = self.parse_amount(amount)
+        if amount <= 0:
+            raise BankError(f"Invalid amount: {amount}")
+        with self._lock:
+            source = self.get_account(from_account_id)
+            target = self.get_account(to_account_id)
+            source.balance -= amount
+            self._record(source.id, "Debit", amount, "Funds Transfer Sent")
+            target.balance += amount
+            self._record(target.id, "Credit", amount, "Funds Transfer Received")
+        return source, target
+    
+    def bill_pay(self, account_id, amount, payee_name):
+        account = self.withdraw(account_id, amount, f"Bill Payment to {payee_name}")
+        return account
+    
+    def create_account(self, customer_id, account_type, from_account_id):
+        """Abrir cuenta moviendo el depósito mínimo desde otra cuenta del cliente"""
+        if str(account_type).isdigit():
+            account_type = ACCOUNT_TYPES[int(account_type)] if int(account_type) < len(ACCOUNT_TYPES) else None
+        if account_type not in ACCOUNT_TYPES:
+            raise BankError(f"Invalid account type: {account_type}")
+        with self._lock:
+            customer = self.get_customer(customer_id)
+            source = self.get_account(from_account_id)
+            account = Account(next(self._account_ids), customer.id, account_type, MINIMUM_OPENING_DEPOSIT)
+            self.accounts[account.id] = account
+            source.balance -= MINIMUM_OPENING_DEPOSIT
+            self._record(source.id, "Debit", MINIMUM_OPENING_DEPOSIT, "Funds Transfer Sent")
+            self._record(account.id, "Credit", MINIMUM_OPENING_DEPOSIT, "Funds Transfer Received")
+            return account
+    
+    def request_loan(self, customer_id, amount, down_payment, from_account_id):
+        """
+        Solicitud de préstamo: se aprueba si la cuenta origen cubre el pago inicial
+        Devuelve (aprobado, cuenta_nueva_o_None)
+        """
+        amount = self.parse_amount(amount)
+        down_payment = self.parse_amount(down_payment)
+        if amount <= 0 or down_payment < 0:
+            raise BankError("Invalid loan amount")
+        with self._lock:
+            source = self.get_account(from_account_id)
+            if down_payment > source.balance or down_payment > amount:
+                return False, None
+            loan = Account(next(self._account_ids), int(customer_id), "LOAN", amount)
+            self.accounts[loan.id] = loan
+            source.balance -= down_payment
+            self._record(source.id, "Debit", down_payment, "Down Payment for Loan")
+            self._record(loan.id, "Credit", amount, "Funds Transfer Received")
+            return True, loan
+    
+    def find_transactions(self, account_id, transaction_id=None, on=None, from_date=None, to_date=None, amount=None):
+        """Búsqueda de movimientos como en findtrans.htm"""
+        if transaction_id is not None:
+            transaction = self.get_transaction(transaction_id)
+            if transaction.accountId != int(account_id):
+                raise BankError(f"Could not find transaction #{transaction_id}")
+            return [transaction]
+        result = self.transactions_for(account_id)
+        if on is not None:
+            result = [transaction for transaction in result if transaction.date == on]
+        if from_date is not None and to_date is not None:
+            result = [transaction for transaction in result if from_date <= transaction.date <= to_date]
+        if amount is not None:
+            amount = self.parse_amount(amount)
+            result = [transaction for transaction in result if transaction.amount == amount]
+        return result
@@ -0,0 +1,451 @@
+from html import escape
+
+
+def money(amount):
+    """Formato de montos en las páginas: $1,234.50"""
+    sign = "-" if amount < 0 else ""
+    return f"{sign}${abs(amount):,.2f}"
+
+
+def layout(title, content, customer=None, error=""):
+    """
+    Estructura común de todas las páginas: cabecera, panel izquierdo
+    (login o menú de servicios) y contenido
+    """
+    if customer is None:
+        left_panel = """
+        <h2>Customer Login</h2>
+        <form name="login" method="post" action="login.htm">
+          <div class="login"><p>Username</p><input type="text" class="input" name="username"></div>
+          <div class="login"><p>Password</p><input type="password" class="input" name="password"></div>
+          <div class="login"><input type="submit" class="button" value="Log In"></div>
+        </form>
+        <p><a href="lookup.htm">Forgot login info?</a></p>
+        <p><a href="register.htm">Register</a></p>"""
+    else:
+        left_panel = f"""
+        <p class="smallText"><b>Welcome</b> {escape(customer.firstName)} {escape(customer.lastName)}</p>
+        <h2>Account Services</h2>
+        <ul>
+          <li><a href="openaccount.htm">Open New Account</a></li>
+          <li><a href="overview.htm">Accounts Overview</a></li>
+          <li><a href="transfer.htm">Transfer Funds</a></li>
+          <li><a href="billpay.htm">Bill Pay</a></li>
+          <li><a href="findtrans.htm">Find Transactions</a></li>
+          <li><a href="updateprofile.htm">Update Contact Info</a></li>
+          <li><a href="requestloan.htm">Request Loan</a></li>
+          <li><a href="logout.htm">Log Out</a></li>
+        </ul>"""
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>ParaBank | {escape(title)}</title>
+  <link href="style.css" rel="stylesheet" type="text/css">
+</head>
+<body>
+  <div id="mainPanel">
+    <div id="topPanel"><p class="caption">Experience the difference</p></div>
+    <div id="bodyPanel">
+      <div id="leftPanel">{left_panel}
+      </div>
+      <div id="rightPanel">{error}{content}
+      </div>
+    </div>
+    <div id="footerPanel"><p class="copyright">&copy; Parasoft. All rights reserved.</p></div>
+  </div>
+</body>
+</html>"""
+
+
+def error_page(message, customer=None):
+    return layout("Error", f"""
+        <h1 class="title">Error!</h1>
+        <p class="error">{escape(message)}</p>""", customer)
+
+
+def field_error(errors, name):
+    """Mensaje de validación junto a un campo (como los <span class="error"> de ParaBank)"""
+    if name not in errors:
+        return ""
+    return f' <span id="{escape(name)}.errors" class="error">{escape(errors[name])}</span>'
+
+
+def error_panel(panel_id, message):
+    """Panel de error de un formulario (#showError, #billpayError...) como el de ParaBank"""
+    return f"""
+        <div id="{panel_id}">
+          <h1 class="title">Error!</h1>
+          <p class="error">{escape(message)}</p>
+        </div>"""
+
+
+def hidden_panels(result_id, error_id, result_content=""):
+    """
+    Paneles de resultado y de error ocultos junto al formulario: ParaBank los deja
+    en el DOM con display: none (con su título y sus campos vacíos) hasta que se
+    envía el formulario; result_content es el contenido del panel de resultado
+    """
+    return f"""
+        <div id="{result_id}" style="display: none;">{result_content}</div>
+        <div id="{error_id}" style="display: none;">
+          <h1 class="title">Error!</h1>
+          <p class="error">An internal error has occurred and has been logged.</p>
+        </div>"""
+
+
+def account_options(accounts, selected=None):
+    return "".join(
+        f'<option value="{account.id}"{" selected" if str(account.id) == str(selected) else ""}>{account.id}</option>'
+        for account in accounts
+    )
+
+
+def index_page():
+    return layout("Welcome | Online Banking", """
+        <h1 class="title">ATM Services</h1>
+        <ul class="services">
+          <li><a href="services.htm">Withdraw Funds</a></li>
+          <li><a href="services.htm">Transfer Funds</a></li>
+          <li><a href="services.htm">Check Balances</a></li>
+          <li><a href="services.htm">Make Deposits</a></li>
+        </ul>""")
+
+
+def lookup_page():
+    return layout("Customer Lookup", """
+        <h1 class="title">Customer Lookup</h1>
+        <p>Please fill out the following information in order to validate your account.</p>""")
+
+
+def register_page(values=None, errors=None):
+    values = values or {}
+    errors = errors or {}
+    fields = [
+        ("customer.firstName", "First Name"), ("customer.lastName", "Last Name"),
+        ("customer.address.street", "Address"), ("customer.address.city", "City"),
+        ("customer.address.state", "State"), ("customer.address.zipCode", "Zip Code"),
+        ("customer.phoneNumber", "Phone #"), ("customer.ssn", "SSN"),
+        ("customer.username", "Username"), ("customer.password", "Password"),
+        ("repeatedPassword", "Confirm"),
+    ]
+    rows = "".join(
+        f"""
+          <tr><td align="right">{label}:</td>
+              <td><input id="{name}" name="{name}" class="input" type="{"password" if "assword" in name else "text"}" value="{escape(values.get(name, ""))}"></td>
+              <td>{field_error(errors, name)}</td></tr>"""
+        for name, label in fields
+    )
+    return layout("Register for Free Online Account Access", f"""
+        <h1 class="title">Signing up is easy!</h1>
+        <p>If you have an account with us you can sign-up for free instant online access.</p>
+        <form id="customerForm" method="post" action="register.htm">
+          <table class="form2">{rows}
+            <tr><td></td><td colspan="2"><input type="submit" class="button" value="Register"></td></tr>
+          </table>
+        </form>""")
+
+
+def register_success_page(customer):
+    return layout("Customer Created", f"""
+        <h1 class="title">Welcome {escape(customer.username)}</h1>
+        <p>Your account was created successfully. You are now logged in.</p>""", customer)
+
+
+def overview_page(customer, accounts):
+    rows = "".join(
+        f"""
+            <tr><td><a href="activity.htm?id={account.id}">{account.id}</a></td>
+                <td>{money(account.balance)}</td><td>{money(max(account.balance, 0))}</td></tr>"""
+        for account in accounts
+    )
+    total = sum((account.balance for account in accounts), 0)
+    return layout("Accounts Overview", f"""
+        <div id="showOverview">
+          <h1 class="title">Accounts Overview</h1>
+          <table id="accountTable" class="gridtable">
+            <thead><tr><th>Account</th><th>Balance*</th><th>Available Amount</th></tr></thead>
+            <tbody>{rows}
+            <tr><td align="right"><b>Total</b></td><td><b>{money(total)}</b></td><td>&nbsp;</td></tr>
+            </tbody>
+          </table>
+          <p class="smallText">*Balance includes deposits that may be subject to holds</p>
+        </div>""", customer)
+
+
+def activity_page(customer, account, transactions):
+    rows = "".join(
+        f"""
+            <tr><td>{transaction.date.strftime("%m-%d-%Y")}</td><td>{escape(transaction.description)}</td>
+                <td>{money(transaction.amount) if transaction.type == "Debit" else ""}</td>
+                <td>{money(transaction.amount) if transaction.type == "Credit" else ""}</td></tr>"""
+        for transaction in transactions
+    )
+    return layout("Account Activity", f"""
+        <h1 class="title">Account Details</h1>
+        <table><tr><td>Account Number:</td><td id="accountId">{account.id}</td></tr>
+               <tr><td>Account Type:</td><td id="accountType">{account.type}</td></tr>
+               <tr><td>Balance:</td><td id="balance">{money(account.balance)}</td></tr></table>
+        <h1 class="title">Account Activity</h1>
+        <table id="transactionTable" class="gridtable">
+          <thead><tr><th>Date</th><th>Transaction</th><th>Debit (-)</th><th>Credit (+)</th></tr></thead>
+          <tbody>{rows}
+          </tbody>
+        </table>""", customer)
+
+
+def transfer_result(amount="", source="", target=""):
+    return f"""
+          <h1 class="title">Transfer Complete!</h1>
+          <p>$<span id="amountResult">{amount}</span> has been transferred from account
+             #<span id="fromAccountIdResult">{source}</span> to account
+             #<span id="toAccountIdResult">{target}</span>.</p>
+          <p>See <a href="overview.htm">Account Activity</a> for more details.</p>"""
+
+
+def transfer_page(customer, accounts, values=None, errors=None, result=None, error=None):
+    values = values or {}
+    errors = errors or {}
+    if error is not None:
+        return layout("Transfer Funds", error_panel("showError", error), customer)
+    if result is not None:
+        amount, source, target = result
+        return layout("Transfer Funds", f"""
+        <div id="showResult">{transfer_result(f"{amount:.2f}", source, target)}
+        </div>""", customer)
+    return layout("Transfer Funds", f"""
+        <div id="showForm">
+          <h1 class="title">Transfer Funds</h1>
+          <form method="post" action="transfer.htm">
+            <p><b>Amount:</b> $<input id="amount" name="amount" class="input" type="text" value="{escape(values.get("amount", ""))}">{field_error(errors, "amount")}</p>
+            <div>From account #<select id="fromAccountId" name="fromAccountId" class="input">{account_options(accounts, values.get("fromAccountId"))}</select>
+                 to account #<select id="toAccountId" name="toAccountId" class="input">{account_options(accounts, values.get("toAccountId"))}</select></div>
+            <div><input type="submit" class="button" value="Transfer"></div>
+          </form>
+        </div>{hidden_panels("showResult", "showError", transfer_result())}""", customer)
+
+
+BILL_PAY_FIELDS = [
+    ("payee.name", "Payee Name", "Payee name is required."),
+    ("payee.address.street", "Address", "Address is required."),
+    ("payee.address.city", "City", "City is required."),
+    ("payee.address.state", "State", "State is required."),
+    ("payee.address.zipCode", "Zip Code", "Zip Code is required."),
+    ("payee.phoneNumber", "Phone #", "Phone number is required."),
+    ("payee.accountNumber", "Account #", "Account number is required."),
+    ("verifyAccount", "Verify Account #", "Account number is required."),
+    ("amount", "Amount: $", "The amount cannot be empty."),
+]
+
+
+def bill_pay_result(payee="", amount="", account_id=""):
+    return f"""
+          <h1 class="title">Bill Payment Complete</h1>
+          <p>Bill Payment to <span id="payeeName">{escape(payee)}</span> in the amount of
+             <span id="amount">{amount}</span> from account <span id="fromAccountId">{account_id}</span> was successful.</p>
+          <p>See <a href="overview.htm">Account Activity</a> for more details.</p>"""
+
+
+def bill_pay_page(customer, accounts, values=None, errors=None, result=None, error=None):
+    values = values or {}
+    errors = errors or {}
+    if error is not None:
+        return layout("Bill Pay", error_panel("billpayError", error), customer)
+    if result is not None:
+        payee, amount, account_id = result
+        return layout("Bill Pay", f"""
+        <div id="billpayResult">{bill_pay_result(payee, money(amount), account_id)}
+        </div>""", customer)
+    rows = "".join(
+        f"""
+            <tr><td align="right">{label}</td>
+                <td><input name="{name}" class="input" type="text" value="{escape(values.get(name, ""))}"></td>
+                <td>{field_error(errors, name)}</td></tr>"""
+        for name, label, _ in BILL_PAY_FIELDS
+    )
+    return layout("Bill Pay", f"""
+        <div id="billpayForm">
+          <h1 class="title">Bill Payment Service</h1>
+          <p>Enter payee information</p>
+          <form method="post" action="billpay.htm">
+            <table class="form2">{rows}
+              <tr><td align="right">From account #:</td>
+                  <td><select name="fromAccountId" class="input">{account_options(accounts, values.get("fromAccountId"))}</select></td></tr>
+              <tr><td></td><td><input type="submit" class="button" value="Send Payment"></td></tr>
+            </table>
+          </form>
+        </div>{hidden_panels("billpayResult", "billpayError", bill_pay_result())}""", customer)
+
+
+def open_account_result(account_id=""):
+    return f"""
+          <h1 class="title">Account Opened!</h1>
+          <p>Congratulations, your account is now open.</p>
+          <p><b>Your new account number:</b> <a id="newAccountId" href="activity.htm?id={account_id}">{account_id}</a></p>"""
+
+
+def open_account_page(customer, accounts, result=None, error=None):
+    if error is not None:
+        return layout("Open Account", error_panel("openAccountError", error), customer)
+    if result is not None:
+        return layout("Open Account", f"""
+        <div id="openAccountResult">{open_account_result(result.id)}
+        </div>""", customer)
+    return layout("Open Account", f"""
+        <div id="openAccountForm">
+          <h1 class="title">Open New Account</h1>
+          <form method="post" action="openaccount.htm">
+            <p><b>What type of Account would you like to open?</b></p>
+            <select id="type" name="type" class="input"><option value="0">CHECKING</option><option value="1">SAVINGS</option></select>
+            <p><b>A minimum of $100.00 must be deposited into this account at time of opening. Please choose an existing account to transfer funds into the new account.</b></p>
+            <select id="fromAccountId" name="fromAccountId" class="input">{account_options(accounts)}</select>
+            <div><input type="submit" class="button" value="Open New Account"></div>
+          </form>
+        </div>{hidden_panels("openAccountResult", "openAccountError", open_account_result())}""", customer)
+
+
+def transaction_results(rows=""):
+    return f"""
+          <h1 class="title">Transaction Results</h1>
+          <table id="transactionTable" class="gridtable">
+            <thead><tr><th>Date</th><th>Transaction</th><th>Debit (-)</th><th>Credit (+)</th></tr></thead>
+            <tbody>{rows}
+            </tbody>
+          </table>"""
+
+
+def find_transactions_page(customer, accounts, values=None, errors=None, results=None, error=None):
+    values = values or {}
+    errors = errors or {}
+    if error is not None:
+        return layout("Find Transactions", f"""
+        <div id="errorContainer">
+          <h1 class="title">Error!</h1>
+          <p class="error">{escape(error)}</p>
+        </div>""", customer)
+    if results is not None:
+        rows = "".join(
+            f"""
+              <tr><td>{transaction.date.strftime("%m-%d-%Y")}</td>
+                  <td><a href="transaction.htm?id={transaction.id}">{escape(transaction.description)}</a></td>
+                  <td>{money(transaction.amount) if transaction.type == "Debit" else ""}</td>
+                  <td>{money(transaction.amount) if transaction.type == "Credit" else ""}</td></tr>"""
+            for transaction in results
+        )
+        empty = "" if results else '<p id="noTransactions">No transactions found.</p>'
+        return layout("Find Transactions", f"""
+        <div id="resultContainer">{transaction_results(rows)}{empty}
+        </div>""", customer)
+    return layout("Find Transactions", f"""
+        <div id="formContainer">
+          <h1 class="title">Find Transactions</h1>
+          <form method="post" action="findtrans.htm">
+            <p>Select an account: <select id="accountId" name="accountId" class="input">{account_options(accounts, values.get("accountId"))}</select></p>
+            <div><b>Find by Transaction ID</b>
+                 <input id="transactionId" name="transactionId" class="input" type="text">{field_error(errors, "transactionId")}
+                 <button type="submit" class="button" id="findById" name="criteria" value="ID">Find Transactions</button></div>
+            <div><b>Find by Date</b>
+                 <input id="transactionDate" name="transactionDate" class="input" type="text" placeholder="MM-DD-YYYY">{field_error(errors, "transactionDate")}
+                 <button type="submit" class="button" id="findByDate" name="criteria" value="DATE">Find Transactions</button></div>
+            <div><b>Find by Date Range</b>
+                 Between <input id="fromDate" name="fromDate" class="input" type="text" placeholder="MM-DD-YYYY">
+                 and <input id="toDate" name="toDate" class="input" type="text" placeholder="MM-DD-YYYY">{field_error(errors, "dateRange")}
+                 <button type="submit" class="button" id="findByDateRange" name="criteria" value="DATE_RANGE">Find Transactions</button></div>
+            <div><b>Find by Amount</b>
+                 <input id="amount" name="amount" class="input" type="text">{field_error(errors, "amount")}
+                 <button type="submit" class="button" id="findByAmount" name="criteria" value="AMOUNT">Find Transactions</button></div>
+          </form>
+        </div>{hidden_panels("resultContainer", "errorContainer", transaction_results())}""", customer)
+
+
+PROFILE_FIELDS = [
+    ("customer.firstName", "First Name", "First name is required."),
+    ("customer.lastName", "Last Name", "Last name is required."),
+    ("customer.address.street", "Address", "Address is required."),
+    ("customer.address.city", "City", "City is required."),
+    ("customer.address.state", "State", "State is required."),
+    ("customer.address.zipCode", "Zip Code", "Zip Code is required."),
+    ("customer.phoneNumber", "Phone #", None),
+]
+
+
+def profile_values(customer):
+    return {
+        "customer.firstName": customer.firstName,
+        "customer.lastName": customer.lastName,
+        "customer.address.street": customer.address.street,
+        "customer.address.city": customer.address.city,
+        "customer.address.state": customer.address.state,
+        "customer.address.zipCode": customer.address.zipCode,
+        "customer.phoneNumber": customer.phoneNumber,
+    }
+
+
+PROFILE_UPDATED = """
+          <h1 class="title">Profile Updated</h1>
+          <p>Your updated address and phone number have been added to the system.</p>"""
+
+
+def update_profile_page(customer, values=None, errors=None, updated=False):
+    if updated:
+        return layout("Update Profile", f"""
+        <div id="updateProfileResult">{PROFILE_UPDATED}
+        </div>""", customer)
+    values = values or profile_values(customer)
+    errors = errors or {}
+    rows = "".join(
+        f"""
+            <tr><td align="right">{label}:</td>
+                <td><input id="{name}" name="{name}" class="input" type="text" value="{escape(values.get(name, ""))}"></td>
+                <td>{field_error(errors, name)}</td></tr>"""
+        for name, label, _ in PROFILE_FIELDS
+    )
+    return layout("Update Profile", f"""
+        <div id="updateProfileForm">
+          <h1 class="title">Update Profile</h1>
+          <form method="post" action="updateprofile.htm">
+            <table class="form2">{rows}
+              <tr><td></td><td><input type="submit" class="button" value="Update Profile"></td></tr>
+            </table>
+          </form>
+        </div>{hidden_panels("updateProfileResult", "updateProfileError", PROFILE_UPDATED)}""", customer)
+
+
+def loan_result(status="", details=""):
+    return f"""
+          <h1 class="title">Loan Request Processed</h1>
+          <table class="form">
+            <tr><td align="right"><b>Loan Provider:</b></td><td id="loanProviderName">{"Wealth Securities Dynamic Loans (WSDL)" if status else ""}</td></tr>
+            <tr><td align="right"><b>Status:</b></td><td id="loanStatus">{status}</td></tr>
+          </table>
+          {details}"""
+
+
+def loan_status(approved, account_id=""):
+    if approved:
+        return f"""<p id="loanRequestApproved">Congratulations, your loan has been approved.</p>
+          <p><b>Your new account number:</b> <a id="newAccountId" href="activity.htm?id={account_id}">{account_id}</a></p>"""
+    return '<p id="loanRequestDenied" class="error">We cannot grant a loan in that amount with your available funds.</p>'
+
+
+def request_loan_page(customer, accounts, values=None, errors=None, result=None):
+    values = values or {}
+    errors = errors or {}
+    if result is not None:
+        approved, loan = result
+        status = loan_status(True, loan.id) if approved else loan_status(False)
+        return layout("Loan Request", f"""
+        <div id="requestLoanResult">{loan_result("Approved" if approved else "Denied", status)}
+        </div>""", customer)
+    return layout("Loan Request", f"""
+        <div id="requestLoanForm">
+          <h1 class="title">Apply for a Loan</h1>
+          <form method="post" action="requestloan.htm">
+            <table class="form2">
+              <tr><td align="right"><b>Loan Amount:</b></td><td>$<input id="amount" name="amount" class="input" type="text" value="{escape(values.get("amount", ""))}">{field_error(errors, "amount")}</td></tr>
+              <tr><td align="right"><b>Down Payment:</b></td><td>$<input id="downPayment" name="downPayment" class="input" type="text" value="{escape(values.get("downPayment", ""))}">{field_error(errors, "downPayment")}</td></tr>
+              <tr><td align="right"><b>From account #:</b></td><td><select id="fromAccountId" name="fromAccountId" class="input">{account_options(accounts, values.get("fromAccountId"))}</select></td></tr>
+              <tr><td></td><td><input type="submit" class="button" value="Apply Now"></td></tr>
+            </table>
+          </form>
+        </div>{hidden_panels("requestLoanResult", "requestLoanError", loan_result(details=loan_status(True) + loan_status(False)))}""", customer)
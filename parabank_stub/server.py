@@ -0,0 +1,439 @@
+"""
+Servidor local que imita ParaBank para ejecutar la suite sin internet
+
+Sirve las páginas que usan los page objects (index, register, overview, transfer,
+billpay, openaccount, findtrans, updateprofile, requestloan...) y los endpoints
+XML de /parabank/services/bank, con los datos de demo de john/demo en memoria.
+
+Uso independiente:
+    python -m parabank_stub.server --port 8080
+"""
+import argparse
+import secrets
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from parabank_stub import pages
+from parabank_stub.bank import Address, Bank, BankError
+from parabank_stub.services import BankService
+
+
+CONTEXT = "/parabank/"
+SERVICES = CONTEXT + "services/bank/"
+COOKIE_NAME = "JSESSIONID"
+
+
+def _first_values(query_string):
+    return {key: values[0] for key, values in parse_qs(query_string, keep_blank_values=True).items()}
+
+
+def _parse_date(value):
+    return datetime.strptime(value.strip(), "%m-%d-%Y").date()
+
+
+class ParaBankHandler(BaseHTTPRequestHandler):
+    """Atiende páginas .htm y servicios REST; el estado vive en self.server"""
+    
+    protocol_version = "HTTP/1.1"
+    server_version = "ParaBankStub/1.0"
+    # Cabeceras y cuerpo salen en dos escrituras: sin esto Nagle + delayed ACK suman ~40 ms
+    disable_nagle_algorithm = True
+    
+    # --- Infraestructura HTTP -------------------------------------------
+    
+    def log_message(self, format, *args):
+        # Sin log por petición: con cientos de peticiones ensucia la salida de pytest
+        pass
+    
+    def do_GET(self):
+        self._dispatch("GET")
+    
+    def do_POST(self):
+        self._dispatch("POST")
+    
+    def _dispatch(self, method):
+        url = urlsplit(self.path)
+        self.query = _first_values(url.query)
+        length = int(self.headers.get("Content-Length") or 0)
+        self.body = self.rfile.read(length) if length else b""
+        self.form = _first_values(self.body.decode("utf-8", "replace")) if method == "POST" else {}
+        
+        if url.path.startswith(SERVICES):
+            parts = [part for part in url.path[len(SERVICES):].split("/") if part]
+            status, content_type, body = self.server.service.handle(
+                method, parts, self.query, self.body, self.headers.get("Accept"),
+            )
+            self._send(status, content_type, body)
+            return
+        
+        if not url.path.startswith(CONTEXT):
+            self._send(404, "text/plain", b"Not Found")
+            return
+        
+        page = url.path[len(CONTEXT):] or "index.htm"
+        handler = getattr(self, "page_" + page.replace(".htm", "").replace(".css", "_css"), None)
+        if handler is None:
+            self._send(404, "text/html", pages.error_page(f"Page not found: {page}").encode())
+            return
+        handler(method)
+    
+    def _send(self, status, content_type, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type};charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _html(self, html, headers=None):
+        self._send(200, "text/html", html.encode("utf-8"), headers)
+    
+    def _redirect(self, page, headers=None):
+        headers = dict(headers or {})
+        headers["Location"] = CONTEXT + page
+        self._send(302, "text/html", b"", headers)
+    
+    # --- Sesión -----------------------------------------------------------
+    
+    def _session_id(self):
+        for cookie in (self.headers.get("Cookie") or "").split(";"):
+            name, _, value = cookie.strip().partition("=")
+            if name == COOKIE_NAME:
+                return value
+        return None
+    
+    def _customer(self):
+        customer_id = self.server.sessions.get(self._session_id())
+        return None if customer_id is None else self.server.bank.get_customer(customer_id)
+    
+    def _start_session(self, customer):
+        session_id = secrets.token_hex(16).upper()
+        self.server.sessions[session_id] = customer.id
+        return {"Set-Cookie": f"{COOKIE_NAME}={session_id}; Path=/parabank; HttpOnly"}
+    
+    def _require_customer(self):
+        """Cliente logueado o None (y redirección al login)"""
+        customer = self._customer()
+        if customer is None:
+            self._redirect("index.htm")
+        return customer
+    
+    def _own_account(self, accounts, account_id):
+        """
+        Id de una cuenta del cliente logueado; BankError si no existe o es de otro cliente
+        (ParaBank no deja operar con cuentas ajenas desde las páginas)
+        """
+        for account in accounts:
+            if str(account.id) == str(account_id).strip():
+                return account.id
+        raise BankError(f"Could not find account #{account_id}")
+    
+    # --- Páginas públicas -----------------------------------------------
+    
+    def page_index(self, method):
+        customer = self._customer()
+        if customer is not None:
+            self._redirect("overview.htm")
+            return
+        self._html(pages.index_page())
+    
+    def page_style_css(self, method):
+        self._send(200, "text/css", b"body { font-family: Arial, sans-serif; } .error { color: red; }")
+    
+    def page_lookup(self, method):
+        self._html(pages.lookup_page())
+    
+    def page_login(self, method):
+        username = self.form.get("username", "").strip()
+        password = self.form.get("password", "").strip()
+        if not username or not password:
+            self._html(pages.error_page("Please enter a username and password."))
+            return
+        try:
+            customer = self.server.bank.login(username, password)
+        except BankError:
+            self._html(pages.error_page("The username and password could not be verified."))
+            return
+        self._redirect("overview.htm", self._start_session(customer))
+    
+    def page_logout(self, method):
+        self.server.sessions.pop(self._session_id(), None)
+        self._redirect("index.htm", {"Set-Cookie": f"{COOKIE_NAME}=; Path=/parabank; Max-Age=0"})
+    
+    def page_register(self, method):
+        if method == "GET":
+            self._html(pages.register_page())
+            return
+        values = self.form
+        labels = {
+            "customer.firstName": "First name", "customer.lastName": "Last name",
+            "customer.address.street": "Address", "customer.address.city": "City",
+            "customer.address.state": "State", "customer.address.zipCode": "Zip Code",
+            "customer.ssn": "Social Security Number", "customer.username": "Username",
+            "customer.password": "Password", "repeatedPassword": "Password confirmation",
+        }
+        errors = {name: f"{label} is required." for name, label in labels.items() if not values.get(name, "").strip()}
+        if not errors and values["customer.password"] != values["repeatedPassword"]:
+            errors["repeatedPassword"] = "Passwords did not match."
+        if not errors and self.server.bank.username_exists(values["customer.username"]):
+            errors["customer.username"] = "This username already exists."
+        if errors:
+            self._html(pages.register_page(values, errors))
+            return
+        customer = self.server.bank.register(
+            values["customer.firstName"], values["customer.lastName"],
+            Address(values["customer.address.street"], values["customer.address.city"],
+                    values["customer.address.state"], values["customer.address.zipCode"]),
+            values.get("customer.phoneNumber", ""), values["customer.ssn"],
+            values["customer.username"], values["customer.password"],
+        )
+        self._html(pages.register_success_page(customer), self._start_session(customer))
+    
+    # --- Páginas autenticadas -------------------------------------------
+    
+    def page_overview(self, method):
+        customer = self._require_customer()
+        if customer:
+            self._html(pages.overview_page(customer, self.server.bank.accounts_for(customer.id)))
+    
+    def page_activity(self, method):
+        customer = self._require_customer()
+        if not customer:
+            return
+        try:
+            account = self.server.bank.get_account(self.query.get("id"))
+        except BankError as e:
+            self._html(pages.error_page(str(e), customer))
+            return
+        self._html(pages.activity_page(customer, account, self.server.bank.transactions_for(account.id)))
+    
+    def page_transfer(self, method):
+        customer = self._require_customer()
+        if not customer:
+            return
+        accounts = self.server.bank.accounts_for(customer.id)
+        if method == "GET":
+            self._html(pages.transfer_page(customer, accounts))
+            return
+        amount = self.form.get("amount", "").strip()
+        errors = {}
+        if not amount:
+            errors["amount"] = "The amount cannot be empty."
+        else:
+            try:
+                parsed = self.server.bank.parse_amount(amount)
+                if parsed <= 0:
+                    raise BankError("Please enter a valid amount.")
+            except BankError:
+                errors["amount"] = "Please enter a valid amount."
+        if errors:
+            self._html(pages.transfer_page(customer, accounts, self.form, errors))
+            return
+        try:
+            source, target = self.server.bank.transfer(
+                self._own_account(accounts, self.form.get("fromAccountId")),
+                self._own_account(accounts, self.form.get("toAccountId")),
+                parsed,
+            )
+        except BankError as e:
+            self._html(pages.transfer_page(customer, accounts, error=str(e)))
+            return
+        self._html(pages.transfer_page(customer, accounts, result=(parsed, source.id, target.id)))
+    
+    def page_billpay(self, method):
+        customer = self._require_customer()
+        if not customer:
+            return
+        accounts = self.server.bank.accounts_for(customer.id)
+        if method == "GET":
+            self._html(pages.bill_pay_page(customer, accounts))
+            return
+        values = self.form
+        errors = {name: message for name, _, message in pages.BILL_PAY_FIELDS if not values.get(name, "").strip()}
+        if "amount" not in errors:
+            try:
+                amount = self.server.bank.parse_amount(values["amount"])
+            except BankError:
+                errors["amount"] = "Please enter a valid amount."
+        if not errors and values["payee.accountNumber"] != values["verifyAccount"]:
+            errors["verifyAccount"] = "The account numbers do not match."
+        if errors:
+            self._html(pages.bill_pay_page(customer, accounts, values, errors))
+            return
+        try:
+            account = self.server.bank.bill_pay(
+                self._own_account(accounts, values.get("fromAccountId")), amount, values["payee.name"],
+            )
+        except BankError as e:
+            self._html(pages.bill_pay_page(customer, accounts, error=str(e)))
+            return
+        self._html(pages.bill_pay_page(customer, accounts, result=(values["payee.name"], amount, account.id)))
+    
+    def page_openaccount(self, method):
+        customer = self._require_customer()
+        if not customer:
+            return
+        accounts = self.server.bank.accounts_for(customer.id)
+        if method == "GET":
+            self._html(pages.open_account_page(customer, accounts))
+            return
+        try:
+            account = self.server.bank.create_account(
+                customer.id, self.form.get("type", "0"), self._own_account(accounts, self.form.get("fromAccountId")),
+            )
+        except BankError as e:
+            self._html(pages.open_account_page(customer, accounts, error=str(e)))
+            return
+        self._html(pages.open_account_page(customer, accounts, result=account))
+    
+    def page_findtrans(self, method):
+        customer = self._require_customer()
+        if not customer:
+            return
+        bank = self.server.bank
+        accounts = bank.accounts_for(customer.id)
+        if method == "GET":
+            self._html(pages.find_transactions_page(customer, accounts))
+            return
+        values = self.form
+        criteria = values.get("criteria", "ID")
+        errors = {}
+        try:
+            account_id = self._own_account(accounts, values.get("accountId"))
+            if criteria == "ID":
+                if not values.get("transactionId", "").strip():
+                    errors["transactionId"] = "Invalid transaction ID"
+                else:
+                    results = bank.find_transactions(account_id, transaction_id=values["transactionId"].strip())
+            elif criteria == "DATE":
+                try:
+                    results = bank.find_transactions(account_id, on=_parse_date(values.get("transactionDate", "")))
+                except ValueError:
+                    errors["transactionDate"] = "Invalid date format"
+            elif criteria == "DATE_RANGE":
+                try:
+                    results = bank.find_transactions(
+                        account_id,
+                        from_date=_parse_date(values.get("fromDate", "")),
+                        to_date=_parse_date(values.get("toDate", "")),
+                    )
+                except ValueError:
+                    errors["dateRange"] = "Invalid date format"
+            else:
+                try:
+                    results = bank.find_transactions(account_id, amount=values.get("amount", ""))
+                except BankError:
+                    errors["amount"] = "Invalid amount"
+        except BankError as e:
+            self._html(pages.find_transactions_page(customer, accounts, error=str(e)))
+            return
+        if errors:
+            self._html(pages.find_transactions_page(customer, accounts, values, errors))
+            return
+        self._html(pages.find_transactions_page(customer, accounts, results=results))
+    
+    def page_updateprofile(self, method):
+        customer = self._require_customer()
+        if not customer:
+            return
+        if method == "GET":
+            self._html(pages.update_profile_page(customer))
+            return
+        values = self.form
+        errors = {
+            name: message
+            for name, _, message in pages.PROFILE_FIELDS
+            if message and not values.get(name, "").strip()
+        }
+        if errors:
+            self._html(pages.update_profile_page(customer, values, errors))
+            return
+        self.server.bank.update_customer(
+            customer.id,
+            firstName=values["customer.firstName"], lastName=values["customer.lastName"],
+            street=values["customer.address.street"], city=values["customer.address.city"],
+            state=values["customer.address.state"], zipCode=values["customer.address.zipCode"],
+            phoneNumber=values.get("customer.phoneNumber", ""),
+        )
+        self._html(pages.update_profile_page(customer, updated=True))
+    
+    def page_requestloan(self, method):
+        customer = self._require_customer()
+        if not customer:
+            return
+        bank = self.server.bank
+        accounts = bank.accounts_for(customer.id)
+        if method == "GET":
+            self._html(pages.request_loan_page(customer, accounts))
+            return
+        values = self.form
+        errors = {}
+        for name, label in (("amount", "Loan amount"), ("downPayment", "Down payment")):
+            try:
+                bank.parse_amount(values.get(name, ""))
+            except BankError:
+                errors[name] = f"{label} is required."
+        if errors:
+            self._html(pages.request_loan_page(customer, accounts, values, errors))
+            return
+        try:
+            result = bank.request_loan(
+                customer.id, values["amount"], values["downPayment"],
+                self._own_account(accounts, values.get("fromAccountId")),
+            )
+        except BankError:
+            result = (False, None)
+        self._html(pages.request_loan_page(customer, accounts, result=result))
+
+
+class ParaBankServer(ThreadingHTTPServer):
+    """Servidor HTTP con el banco en memoria y las sesiones web"""
+    
+    daemon_threads = True
+    
+    def __init__(self, address, bank=None):
+        super().__init__(address, ParaBankHandler)
+        self.bank = bank or Bank.with_demo_data()
+        self.service = BankService(self.bank)
+        self.sessions = {}
+    
+    @property
+    def url(self):
+        """URL raíz de la aplicación, equivalente a https://parabank.parasoft.com/parabank/"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{CONTEXT}"
+
+
+def start_server(host="127.0.0.1", port=0):
+    """
+    Arrancar el servidor en un hilo en segundo plano
+    Con port=0 el sistema elige un puerto libre (útil con varios workers de xdist)
+    """
+    server = ParaBankServer((host, port))
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, name="parabank-stub", daemon=True,
+    )
+    thread.start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local que imita ParaBank")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+    server = ParaBankServer((args.host, args.port))
+    print(f"ParaBank local en {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
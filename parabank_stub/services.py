@@ -0,0 +1,200 @@
+import json
+import xml.etree.ElementTree as ET
+from decimal import Decimal
+
+from parabank_stub.bank import BankError
+
+
+def format_amount(amount):
+    """Montos en XML sin ceros de relleno: 100, 515.5, -2300"""
+    text = format(amount.normalize(), "f")
+    return text
+
+
+def _text(value):
+    if isinstance(value, bool):
+        return str(value).lower()
+    return format_amount(value) if isinstance(value, Decimal) else str(value)
+
+
+def _element(tag, fields):
+    element = ET.Element(tag)
+    for name, value in fields.items():
+        if isinstance(value, dict):
+            element.append(_element(name, value))
+        else:
+            ET.SubElement(element, name).text = _text(value)
+    return element
+
+
+def _json_default(value):
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def customer_fields(customer):
+    return {
+        "id": customer.id,
+        "firstName": customer.firstName,
+        "lastName": customer.lastName,
+        "address": {
+            "street": customer.address.street,
+            "city": customer.address.city,
+            "state": customer.address.state,
+            "zipCode": customer.address.zipCode,
+        },
+        "phoneNumber": customer.phoneNumber,
+        "ssn": customer.ssn,
+    }
+
+
+def account_fields(account):
+    return {
+        "id": account.id,
+        "customerId": account.customerId,
+        "type": account.type,
+        "balance": account.balance,
+    }
+
+
+def transaction_fields(transaction):
+    return {
+        "id": transaction.id,
+        "accountId": transaction.accountId,
+        "type": transaction.type,
+        "date": transaction.date.isoformat(),
+        "amount": transaction.amount,
+        "description": transaction.description,
+    }
+
+
+def to_xml(tag, fields):
+    return ET.tostring(_element(tag, fields), encoding="utf-8", xml_declaration=True)
+
+
+def list_to_xml(tag, item_tag, items):
+    root = ET.Element(tag)
+    for fields in items:
+        root.append(_element(item_tag, fields))
+    return ET.tostring(root, encoding="utf-8", xml_declaration=True)
+
+
+def to_json(value):
+    """Como ParaBank (Jackson): el objeto sin elemento raíz y los números como números"""
+    return json.dumps(value, default=_json_default, separators=(",", ":")).encode()
+
+
+def wants_json(accept):
+    """La primera de application/json o application/xml en Accept decide; por defecto XML"""
+    for media_type in (accept or "").split(","):
+        media_type = media_type.split(";")[0].strip().lower()
+        if media_type == "application/json":
+            return True
+        if media_type in ("application/xml", "text/xml"):
+            return False
+    return False
+
+
+def parse_payee(body):
+    """Leer el XML <payee> que recibe /billpay"""
+    try:
+        root = ET.fromstring(body)
+    except ET.ParseError:
+        raise BankError("Invalid payee")
+    name = root.findtext("name")
+    if not name:
+        raise BankError("Payee name is required")
+    return name
+
+
+class BankService:
+    """
+    Endpoints REST de /services/bank con el mismo formato XML que ParaBank
+    Con "Accept: application/json" responde en JSON, igual que el servicio real
+    handle() devuelve (status, content_type, body)
+    """
+    
+    XML = "application/xml"
+    JSON = "application/json"
+    TEXT = "text/plain"
+    
+    def __init__(self, bank):
+        self.bank = bank
+    
+    def handle(self, method, parts, query, body, accept=None):
+        as_json = wants_json(accept)
+        try:
+            return self._route(method, parts, query, body, as_json)
+        except BankError as e:
+            if as_json:
+                return 400, self.JSON, to_json({"error": str(e)})
+            return 400, self.XML, to_xml("error", {"message": str(e)})
+    
+    def _route(self, method, parts, query, body, as_json):
+        bank = self.bank
+        
+        if method == "GET":
+            if len(parts) == 3 and parts[0] == "login":
+                return self._object(as_json, "customer", customer_fields(bank.login(parts[1], parts[2])))
+            if len(parts) == 2 and parts[0] == "customers":
+                return self._object(as_json, "customer", customer_fields(bank.get_customer(parts[1])))
+            if len(parts) == 3 and parts[0] == "customers" and parts[2] == "accounts":
+                accounts = bank.accounts_for(parts[1])
+                return self._list(as_json, "accounts", "account", [account_fields(a) for a in accounts])
+            if len(parts) == 2 and parts[0] == "accounts":
+                return self._object(as_json, "account", account_fields(bank.get_account(parts[1])))
+            if len(parts) == 3 and parts[0] == "accounts" and parts[2] == "transactions":
+                transactions = bank.transactions_for(parts[1])
+                return self._list(as_json, "transactions", "transaction", [transaction_fields(t) for t in transactions])
+            if len(parts) == 2 and parts[0] == "transactions":
+                return self._object(as_json, "transaction", transaction_fields(bank.get_transaction(parts[1])))
+        
+        if method == "POST":
+            if parts == ["deposit"]:
+                account = bank.deposit(query.get("accountId"), query.get("amount"))
+                return self._message(as_json, f"Successfully deposited ${query.get('amount')} to account #{account.id}")
+            if parts == ["withdraw"]:
+                account = bank.withdraw(query.get("accountId"), query.get("amount"))
+                return self._message(as_json, f"Successfully withdrew ${query.get('amount')} from account #{account.id}")
+            if parts == ["transfer"]:
+                source, target = bank.transfer(query.get("fromAccountId"), query.get("toAccountId"), query.get("amount"))
+                return self._message(
+                    as_json,
+                    f"Successfully transferred ${query.get('amount')} from account #{source.id} to account #{target.id}"
+                )
+            if parts == ["createAccount"]:
+                account = bank.create_account(query.get("customerId"), query.get("newAccountType"), query.get("fromAccountId"))
+                return self._object(as_json, "account", account_fields(account))
+            if parts == ["billpay"]:
+                payee_name = parse_payee(body)
+                account = bank.bill_pay(query.get("accountId"), query.get("amount"), payee_name)
+                return self._object(as_json, "billPayResult", {
+                    "accountId": account.id,
+                    "amount": Decimal(query.get("amount")),
+                    "payeeName": payee_name,
+                })
+            if parts == ["requestLoan"]:
+                approved, loan = bank.request_loan(
+                    query.get("customerId"), query.get("amount"), query.get("downPayment"), query.get("fromAccountId"),
+                )
+                fields = {"approved": approved, "loanProviderName": "Wealth Securities Dynamic Loans (WSDL)"}
+                if loan is not None:
+                    fields["accountId"] = loan.id
+                return self._object(as_json, "loanResponse", fields)
+        
+        return 404, self.TEXT, b"Not Found"
+    
+    def _object(self, as_json, tag, fields):
+        if as_json:
+            return 200, self.JSON, to_json(fields)
+        return 200, self.XML, to_xml(tag, fields)
+    
+    def _list(self, as_json, tag, item_tag, items):
+        if as_json:
+            return 200, self.JSON, to_json(items)
+        return 200, self.XML, list_to_xml(tag, item_tag, items)
+    
+    def _message(self, as_json, message):
+        # ParaBank responde estas operaciones con texto plano pero con la cabecera negociada
+        return 200, self.JSON if as_json else self.XML, message.encode()
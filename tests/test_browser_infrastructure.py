@@ -0,0 +1,63 @@
+import pytest
+from utils.browser_options import blocked_url_patterns
+from utils.network_blocking import STYLESHEET_PATTERN, set_blocked_urls, supports_url_blocking
+from utils.asset_cache import cached_url_patterns, serve_from_cache
+
+
+class TestBrowserInfrastructure:
+    """
+    Bloqueo y caché de recursos por CDP en los navegadores del pool
+    Cada test cambia la configuración del navegador a mano y la restaura al
+    terminar, porque el navegador vuelve al pool para el siguiente test
+    """
+    
+    def test_block_css_blocks_stylesheets(self, driver, base_url, browser_settings, asset_cache):
+        """
+        Con --block-css la hoja de estilos de ParaBank no llega a cargarse
+        """
+        if not supports_url_blocking(driver):
+            pytest.skip("El navegador no soporta el bloqueo de URLs por CDP")
+        
+        # Los mismos patrones que usaría el fixture driver con --block-css
+        patterns = blocked_url_patterns(dict(browser_settings, block_css=True), browser_settings["blocked_urls"])
+        set_blocked_urls(driver, patterns)
+        # Lo bloqueado no se sirve desde la caché local (--cache-assets)
+        serve_from_cache(driver, asset_cache, cached_url_patterns(browser_settings["cached_urls"], patterns))
+        try:
+            driver.get(base_url)
+            # link.sheet es null si la petición de la hoja de estilos falló
+            loaded = driver.execute_script(
+                "return Array.from(document.querySelectorAll('link[rel=stylesheet]')).map(l => l.sheet !== null);"
+            )
+        finally:
+            # El navegador vuelve al pool: se deja el bloqueo configurado para la sesión
+            set_blocked_urls(driver, browser_settings["blocked_urls"])
+            serve_from_cache(driver, asset_cache, cached_url_patterns(
+                browser_settings["cached_urls"], browser_settings["blocked_urls"],
+            ))
+        
+        assert loaded, "La página no tiene hojas de estilo enlazadas"
+        assert not any(loaded), f"Se cargaron hojas de estilo con *.css bloqueado: {loaded}"
+    
+    @pytest.mark.visual
+    def test_cache_assets_serves_stylesheets(self, driver, base_url, browser_settings, asset_cache):
+        """
+        Con --cache-assets la hoja de estilos se intercepta por CDP y se
+        sirve desde la caché local
+        """
+        interceptor = serve_from_cache(driver, asset_cache, [STYLESHEET_PATTERN])
+        if interceptor is None:
+            pytest.skip("El navegador no soporta la intercepción de peticiones por CDP")
+        try:
+            driver.get(base_url)
+            sheets = driver.execute_script(
+                "return Array.from(document.querySelectorAll('link[rel=stylesheet]')).map(l => [l.href, l.sheet !== null]);"
+            )
+        finally:
+            # Test visual: sin bloqueo, se vuelve a los patrones de cached_urls
+            serve_from_cache(driver, asset_cache, browser_settings["cached_urls"])
+        
+        assert sheets, "La página no tiene hojas de estilo enlazadas"
+        for href, loaded in sheets:
+            assert href in asset_cache, f"La hoja de estilos no pasó por la caché local: {href}"
+            assert loaded, f"La hoja de estilos servida desde la caché no se aplicó: {href}"
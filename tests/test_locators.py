@@ -0,0 +1,104 @@
+import pytest
+from pages.login_page import LoginPage
+from pages.accounts_overview_page import AccountsOverviewPage
+from pages.register_page import RegisterPage
+from pages.form_page import FormPage
+from pages.transfer_page import TransferPage
+from pages.bill_pay_page import BillPayPage
+from pages.open_account_page import OpenAccountPage
+from pages.request_loan_page import RequestLoanPage
+from pages.locator_registry import LocatorRegistry, compile_locator, discover_pages, format_reports
+from utils.worker_customer import new_username
+
+
+class TestLocatorRegistry:
+    """
+    Validación de los locators de todos los page objects
+    """
+    
+    @pytest.fixture(scope="class")
+    def registry(self):
+        return LocatorRegistry()
+    
+    def test_page_locators_compile(self, registry):
+        """
+        Todos los locators se pueden compilar (XPath y CSS válidos)
+        """
+        for page, locators in registry.pages.items():
+            for name, locator in locators.items():
+                compile_locator(locator)
+    
+    def test_page_locators_have_no_slow_patterns(self, registry):
+        """
+        Ningún locator usa búsquedas por texto en todo el documento, ejes XPath
+        relativos, link text o XPath que tenga un equivalente CSS directo
+        """
+        reports = registry.analyze()
+        assert not reports, "Locators lentos:\n" + format_reports(reports)
+    
+    def test_locators_match_captured_dom(self, registry, driver, base_url, app_url, credentials, customer_data, open_page):
+        """
+        Cada locator encuentra al menos un elemento en el DOM real de su página
+        (capturado en los estados en que se usa) y se mide su coste en el navegador
+        """
+        documents = {"LoginPage": [], "AccountsOverviewPage": [], "RegisterPage": []}
+        
+        # Login: formulario y mensaje de error
+        login_page = LoginPage(driver)
+        login_page.navigate_to(base_url)
+        documents["LoginPage"].append(login_page.snapshot())
+        login_page.login("usuario_inexistente", "clave_incorrecta")
+        login_page.is_error_displayed()
+        documents["LoginPage"].append(login_page.snapshot())
+        
+        # Resumen de cuentas (con las cuentas ya cargadas por AJAX)
+        username, password = credentials
+        login_page.navigate_to(base_url)
+        login_page.login(username, password)
+        accounts_page = AccountsOverviewPage(driver)
+        accounts_page.get_accounts()
+        overview = accounts_page.snapshot()
+        documents["LoginPage"].append(overview)
+        documents["AccountsOverviewPage"].append(overview)
+        overview_reports = registry.benchmark_browser(
+            driver, registry.validate("AccountsOverviewPage", [overview]),
+        )
+        accounts_page.click_logout()
+        
+        # Registro: formulario y mensaje de éxito
+        register_page = RegisterPage(driver)
+        register_page.navigate_to(f"{app_url}register.htm")
+        documents["RegisterPage"].append(register_page.snapshot())
+        register_page.register(new_username("loc"), "demo")
+        register_page.is_registration_successful()
+        documents["RegisterPage"].append(register_page.snapshot())
+        
+        # Páginas de formulario: el formulario recién abierto (ParaBank deja en el
+        # DOM, ocultos, los paneles de resultado y de error)
+        for page_class in discover_pages():
+            if issubclass(page_class, FormPage) and page_class.PATH:
+                documents[page_class.__name__] = [open_page(page_class).snapshot()]
+        
+        # Paneles de resultado ya rellenados, de los que se leen los RESULT_FIELDS
+        from_account, to_account = customer_data.account_ids[:2]
+        submissions = {
+            TransferPage: lambda page: page.transfer("1.00", from_account, to_account),
+            BillPayPage: lambda page: page.pay(
+                "Locator Payee", "1 Test Street", "Testville", "CA", "90210", "555-0100",
+                "12345", amount="1.00", from_account=from_account,
+            ),
+            OpenAccountPage: lambda page: page.open_account("CHECKING", from_account),
+            RequestLoanPage: lambda page: page.request_loan("100", "10", from_account),
+        }
+        for page_class, submit in submissions.items():
+            page = open_page(page_class)
+            submit(page)
+            documents[page_class.__name__].append(page.snapshot(refresh=True))
+        
+        reports = []
+        for page, snapshots in documents.items():
+            reports += overview_reports if page == "AccountsOverviewPage" else registry.validate(page, snapshots)
+        print("\n" + format_reports(reports))
+        
+        missing = [report for report in reports if report.error or report.matches == 0]
+        assert not missing, "Locators sin coincidencias:\n" + format_reports(missing)
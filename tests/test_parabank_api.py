@@ -2,16 +2,20 @@
 Test suite for ParaBank API endpoints
 Based on Postman collection data
 """
+import asyncio
+import time
+from decimal import Decimal
+
 import pytest
-import requests
-import xml.etree.ElementTree as ET
+
+from api.client import ParaBankClient
+from api.models import Account, BillPayResult, Customer, Transaction
+from api.parsing import parse_model, parse_models
 
 
 class TestParaBankAPI:
     """Tests for ParaBank REST API"""
     
-    BASE_URL = "https://parabank.parasoft.com/parabank/services/bank"
-    
     # Test data from Postman collection
     USERNAME = "john"
     PASSWORD = "demo"
@@ -19,105 +23,83 @@ class TestParaBankAPI:
     ACCOUNT_ID = "13344"
     
     @pytest.fixture(autouse=True)
-    def setup(self):
-        """Setup for each test"""
-        self.session = requests.Session()
-        yield
-        self.session.close()
+    def setup(self, api_client):
+        """Setup for each test: share the session-wide pooled client"""
+        self.client = api_client
     
     def test_login_success(self):
         """Test LOGIN endpoint - Status 200 OK and response not empty"""
-        url = f"{self.BASE_URL}/login/{self.USERNAME}/{self.PASSWORD}"
-        
-        response = self.session.get(url)
+        response = self.client.login(self.USERNAME, self.PASSWORD)
         
         # Assertions from Postman tests
         assert response.status_code == 200, "Expected status code 200"
         assert len(response.text) > 0, "Response body should not be empty"
-        assert "application/xml" in response.headers.get("Content-Type", "")
-        
-        # Verify XML structure
-        root = ET.fromstring(response.text)
-        assert root.tag == "customer"
-        assert root.find("id").text == self.CUSTOMER_ID
-        assert root.find("firstName").text == "John"
-        assert root.find("lastName").text == "Smith"
+        assert self.client.content_type in response.headers.get("Content-Type", "")
+        
+        # Verify structure (<customer> in XML, a customer object in JSON)
+        customer = parse_model(response, Customer)
+        assert customer.id == self.CUSTOMER_ID
+        assert customer.first_name == "John"
+        assert customer.last_name == "Smith"
     
     def test_get_account_by_id(self):
         """Test ACCOUNT_ID endpoint - Get account details"""
-        url = f"{self.BASE_URL}/accounts/{self.ACCOUNT_ID}"
-        
-        response = self.session.get(url)
+        response = self.client.get_account(self.ACCOUNT_ID)
         
         # Assertions
         assert response.status_code == 200
-        assert "application/xml" in response.headers.get("Content-Type", "")
-        
-        # Parse and validate XML
-        root = ET.fromstring(response.text)
-        assert root.tag == "account"
-        assert root.find("id").text == self.ACCOUNT_ID
-        assert root.find("customerId").text == self.CUSTOMER_ID
-        assert root.find("type") is not None
-        assert root.find("balance") is not None
+        assert self.client.content_type in response.headers.get("Content-Type", "")
+        
+        # Parse and validate
+        account = parse_model(response, Account)
+        assert account.id == self.ACCOUNT_ID
+        assert account.customer_id == self.CUSTOMER_ID
+        assert account.type is not None
+        assert account.balance is not None
     
     def test_get_customer_accounts(self):
         """Test CUSTOMER_ID_ACCOUNTS endpoint - Get all accounts for customer"""
-        url = f"{self.BASE_URL}/customers/{self.CUSTOMER_ID}/accounts"
-        
-        response = self.session.get(url)
+        response = self.client.get_customer_accounts(self.CUSTOMER_ID)
         
         # Assertions
         assert response.status_code == 200
-        assert "application/xml" in response.headers.get("Content-Type", "")
+        assert self.client.content_type in response.headers.get("Content-Type", "")
         
-        # Parse XML and verify accounts
-        root = ET.fromstring(response.text)
-        assert root.tag == "accounts"
-        accounts = root.findall("account")
+        # Parse and verify accounts
+        accounts = parse_models(response, Account)
         assert len(accounts) > 0, "Should have at least one account"
         
         # Verify each account has required fields
         for account in accounts:
-            assert account.find("id") is not None
-            assert account.find("customerId").text == self.CUSTOMER_ID
-            assert account.find("type") is not None
-            assert account.find("balance") is not None
+            assert account.id is not None
+            assert account.customer_id == self.CUSTOMER_ID
+            assert account.type is not None
+            assert account.balance is not None
     
     def test_get_account_transactions(self):
         """Test ACC_iD_TRANSACTION endpoint - Get transactions for account"""
-        url = f"{self.BASE_URL}/accounts/{self.ACCOUNT_ID}/transactions"
-        
-        response = self.session.get(url)
-        
-        # Assertions
-        assert response.status_code == 200
-        assert "application/xml" in response.headers.get("Content-Type", "")
-        
-        # Parse XML
-        root = ET.fromstring(response.text)
-        assert root.tag == "transactions"
-        transactions = root.findall("transaction")
-        assert len(transactions) > 0, "Should have at least one transaction"
-        
-        # Verify transaction fields
-        for transaction in transactions:
-            assert transaction.find("id") is not None
-            assert transaction.find("accountId").text == self.ACCOUNT_ID
-            assert transaction.find("type") is not None
-            assert transaction.find("amount") is not None
-            assert transaction.find("description") is not None
+        # Streamed: raises for non-200 or unexpected content types, parses as bytes arrive
+        count = 0
+        for transaction in self.client.iter_transactions(self.ACCOUNT_ID):
+            count += 1
+            # Verify transaction fields
+            assert transaction.id is not None
+            assert transaction.account_id == self.ACCOUNT_ID
+            assert transaction.type is not None
+            assert transaction.amount is not None
+            assert transaction.description is not None
+        
+        assert count > 0, "Should have at least one transaction"
     
     def test_deposit_to_account(self):
         """Test DEPOSIT endpoint - Deposit money to account"""
         amount = 200
-        url = f"{self.BASE_URL}/deposit?accountId={self.ACCOUNT_ID}&amount={amount}"
         
-        response = self.session.post(url)
+        response = self.client.deposit(self.ACCOUNT_ID, amount)
         
         # Assertions from Postman tests
         assert response.status_code == 200
-        assert "application/xml" in response.headers.get("Content-Type", "")
+        assert self.client.content_type in response.headers.get("Content-Type", "")
         assert "error" not in response.text.lower()
         assert "Successfully deposited" in response.text
         assert str(amount) in response.text
@@ -125,64 +107,52 @@ class TestParaBankAPI:
     
     def test_create_account(self):
         """Test CREATEACCOUNT endpoint - Create new account"""
-        url = f"{self.BASE_URL}/createAccount"
-        params = {
-            "customerId": self.CUSTOMER_ID,
-            "newAccountType": "1",  # 0=CHECKING, 1=SAVINGS
-            "fromAccountId": self.ACCOUNT_ID
-        }
-        
-        response = self.session.post(url, params=params)
+        response = self.client.create_account(
+            self.CUSTOMER_ID,
+            "SAVINGS",  # sent as newAccountType=1 (0=CHECKING, 1=SAVINGS)
+            self.ACCOUNT_ID
+        )
         
         # Assertions
         assert response.status_code == 200
-        assert "application/xml" in response.headers.get("Content-Type", "")
+        assert self.client.content_type in response.headers.get("Content-Type", "")
         
         # Parse response
-        root = ET.fromstring(response.text)
-        assert root.tag == "account"
-        assert root.find("customerId").text == self.CUSTOMER_ID
+        account = parse_model(response, Account)
+        assert account.customer_id == self.CUSTOMER_ID
         # Account type 1 = SAVINGS
-        assert root.find("type").text in ["SAVINGS", "CHECKING", "LOAN"]
-        assert root.find("id") is not None
+        assert account.type in ["SAVINGS", "CHECKING", "LOAN"]
+        assert account.id is not None
     
     def test_bill_pay(self):
         """Test BILLPAY endpoint - Pay a bill"""
-        url = f"{self.BASE_URL}/billpay"
-        params = {
-            "accountId": self.ACCOUNT_ID,
-            "amount": "100"
+        # Payee information (sent as XML body)
+        payee = {
+            "name": "John Smith",
+            "address": {
+                "street": "My street",
+                "city": "My city",
+                "state": "My state",
+                "zipCode": "90210",
+            },
+            "phoneNumber": "0123456789",
+            "accountNumber": "12345",
         }
         
-        # XML body with payee information
-        payee_xml = """<payee>
-    <name>John Smith</name>
-    <address>
-        <street>My street</street>
-        <city>My city</city>
-        <state>My state</state>
-        <zipCode>90210</zipCode>
-    </address>
-    <phoneNumber>0123456789</phoneNumber>
-    <accountNumber>12345</accountNumber>
-</payee>"""
-        
-        headers = {"Content-Type": "application/xml"}
-        response = self.session.post(url, params=params, data=payee_xml, headers=headers)
+        response = self.client.bill_pay(self.ACCOUNT_ID, "100", payee)
         
         # Assertions from Postman tests
         assert response.status_code == 200
-        assert "application/xml" in response.headers.get("Content-Type", "")
+        assert self.client.content_type in response.headers.get("Content-Type", "")
         assert "error" not in response.text.lower()
         assert response.headers.get("Server") is not None
         assert response.elapsed.total_seconds() < 5, "Response time should be less than 5 seconds"
         
         # Verify response structure
-        root = ET.fromstring(response.text)
-        assert root.tag == "billPayResult"
-        assert root.find("accountId").text == self.ACCOUNT_ID
-        assert root.find("amount").text == "100"
-        assert root.find("payeeName").text == "John Smith"
+        result = parse_model(response, BillPayResult)
+        assert result.account_id == self.ACCOUNT_ID
+        assert result.amount == Decimal("100")
+        assert result.payee_name == "John Smith"
     
     def test_transfer_funds(self):
         """Test transfer-from-to_account endpoint - Transfer between accounts"""
@@ -190,29 +160,35 @@ class TestParaBankAPI:
         to_account = "13455"
         amount = 100
         
-        url = f"{self.BASE_URL}/transfer"
-        params = {
-            "fromAccountId": from_account,
-            "toAccountId": to_account,
-            "amount": amount
-        }
-        
-        response = self.session.post(url, params=params)
+        response = self.client.transfer(from_account, to_account, amount)
         
         # Assertions
         assert response.status_code == 200
-        assert "application/xml" in response.headers.get("Content-Type", "")
+        assert self.client.content_type in response.headers.get("Content-Type", "")
         
         # Verify amount and accounts are different
         assert from_account != to_account, "From and To accounts should be different"
         assert amount > 0, "Amount should be positive"
     
+    def test_data_factory_provisions_customer(self, data_factory):
+        """Data factory - new customer with funded accounts and transfer history, all over HTTP"""
+        data = data_factory.provision_customer(accounts=3, balance=Decimal("250"), transfers=4)
+        
+        assert len(data.account_ids) == 3
+        accounts = parse_models(self.client.get_customer_accounts(data.customer_id), Account)
+        assert sorted(account.id for account in accounts) == sorted(data.account_ids)
+        assert all(account.balance >= Decimal("250") for account in accounts)
+        
+        transactions = list(self.client.iter_transactions(data.account_ids[0]))
+        # 4 alternating transfers of $1 between the first two accounts: 2 sent from the first
+        sent = [t for t in transactions if t.description == "Funds Transfer Sent" and t.amount == Decimal("1")]
+        assert len(sent) == 2
+    
     def test_deposit_negative_amount(self):
         """Test DEPOSIT with negative amount - should handle gracefully"""
         amount = -50
-        url = f"{self.BASE_URL}/deposit?accountId={self.ACCOUNT_ID}&amount={amount}"
         
-        response = self.session.post(url)
+        response = self.client.deposit(self.ACCOUNT_ID, amount)
         
         # Negative amounts should be rejected (expect error or bad request)
         # This test validates error handling
@@ -223,9 +199,8 @@ class TestParaBankAPI:
     def test_invalid_account_id(self):
         """Test with invalid account ID - should handle error"""
         invalid_account = "99999999"
-        url = f"{self.BASE_URL}/accounts/{invalid_account}"
         
-        response = self.session.get(url)
+        response = self.client.get_account(invalid_account)
         
         # Should return error or 404
         assert response.status_code in [200, 400, 404, 500]
@@ -235,9 +210,8 @@ class TestParaBankAPI:
     def test_invalid_customer_id(self):
         """Test with invalid customer ID - should handle error"""
         invalid_customer = "99999999"
-        url = f"{self.BASE_URL}/customers/{invalid_customer}/accounts"
         
-        response = self.session.get(url)
+        response = self.client.get_customer_accounts(invalid_customer)
         
         # Should return error or empty list
         assert response.status_code in [200, 400, 404, 500]
@@ -246,21 +220,120 @@ class TestParaBankAPI:
 class TestParaBankAPIPerformance:
     """Performance tests for ParaBank API"""
     
-    BASE_URL = "https://parabank.parasoft.com/parabank/services/bank"
     CUSTOMER_ID = "12212"
+    ACCOUNT_ID = "13344"
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, api_client):
+        """Setup for each test: share the session-wide pooled client"""
+        self.client = api_client
     
     def test_response_time_login(self):
         """Test that login response time is acceptable"""
-        url = f"{self.BASE_URL}/login/john/demo"
-        
-        response = requests.get(url)
+        response = self.client.login("john", "demo")
         
         assert response.elapsed.total_seconds() < 5, "Login should respond in less than 5 seconds"
     
     def test_response_time_accounts(self):
         """Test that accounts retrieval is fast"""
-        url = f"{self.BASE_URL}/customers/{self.CUSTOMER_ID}/accounts"
-        
-        response = requests.get(url)
+        response = self.client.get_customer_accounts(self.CUSTOMER_ID)
         
         assert response.elapsed.total_seconds() < 5, "Accounts retrieval should be fast"
+    
+    @pytest.mark.parametrize("path, model", [
+        (f"customers/{CUSTOMER_ID}/accounts", Account),
+        (f"accounts/{ACCOUNT_ID}/transactions", Transaction),
+    ])
+    def test_xml_vs_json_payload_and_parse_time(self, api_base_url, path, model):
+        """XML vs JSON - same models from both formats; payload size and parse time are reported, not asserted"""
+        repeats = 50
+        results = {}
+        for data_format in ("xml", "json"):
+            with ParaBankClient(api_base_url, pool_size=1, data_format=data_format) as client:
+                response = client.session.get(client.url(path), timeout=client.timeout)
+            assert response.status_code == 200
+            assert client.content_type in response.headers.get("Content-Type", "")
+            
+            start = time.perf_counter()
+            for _ in range(repeats):
+                models = parse_models(response, model)
+            parse_ms = (time.perf_counter() - start) / repeats * 1000
+            results[data_format] = (len(response.content), parse_ms, models)
+        
+        for data_format, (size, parse_ms, models) in results.items():
+            print(f"\n{path} [{data_format}]: {size} bytes, {len(models)} items, parse {parse_ms:.3f} ms")
+        # Size and parse time depend on the server and the data: compared in the output only
+        (xml_size, xml_ms, _), (json_size, json_ms, _) = results["xml"], results["json"]
+        print(f"{path} json/xml: size {json_size / xml_size:.0%}, parse {json_ms / xml_ms:.0%}")
+        
+        assert results["xml"][2] == results["json"][2], "XML and JSON should describe the same data"
+    
+    def test_concurrent_account_reads_async(self, api_base_url, api_pool_size, api_format):
+        """Async client - concurrent calls share one keep-alive connection pool"""
+        pytest.importorskip("aiohttp")
+        from api.async_client import AsyncParaBankClient
+        
+        async def read_accounts():
+            async with AsyncParaBankClient(api_base_url, pool_size=api_pool_size, data_format=api_format) as client:
+                return await asyncio.gather(*(client.get_customer_accounts(self.CUSTOMER_ID) for _ in range(20)))
+        
+        responses = asyncio.run(read_accounts())
+        
+        assert all(response.status_code == 200 for response in responses)
+        assert all(len(parse_models(response, Account)) > 0 for response in responses)
+    
+    @pytest.mark.load
+    def test_load_mixed_operations(self, api_base_url, api_pool_size, api_format, load_settings):
+        """Load mode - login, accounts, deposit and transfer under sustained concurrency"""
+        pytest.importorskip("aiohttp")
+        from api.load import check_thresholds, default_operations, run_load
+        
+        accounts = parse_models(self.client.get_customer_accounts(self.CUSTOMER_ID), Account)
+        account_ids = [account.id for account in accounts]
+        assert len(account_ids) >= 2, "Load scenario needs two accounts to transfer between"
+        
+        result = run_load(
+            api_base_url,
+            default_operations(self.CUSTOMER_ID, account_ids[0], account_ids[1]),
+            concurrency=load_settings["concurrency"],
+            rate=load_settings["rate"],
+            duration=load_settings["duration"],
+            pool_size=max(api_pool_size, load_settings["concurrency"]),
+            data_format=api_format,
+        )
+        print("\n" + result.report())
+        
+        assert result.total_requests > 0, "Load run did not issue any request"
+        failures = check_thresholds(result, **load_settings["thresholds"])
+        assert not failures, "Load thresholds exceeded: " + "; ".join(failures)
+
+
+@pytest.mark.benchmark
+class TestParaBankAPIBenchmark:
+    """Latency benchmarks: N timed calls after warmup, compared against the stored baseline"""
+    
+    CUSTOMER_ID = "12212"
+    ACCOUNT_ID = "13344"
+    
+    ENDPOINTS = {
+        "login": lambda client, test: client.login("john", "demo"),
+        "customer": lambda client, test: client.get_customer(test.CUSTOMER_ID),
+        "customer_accounts": lambda client, test: client.get_customer_accounts(test.CUSTOMER_ID),
+        "account": lambda client, test: client.get_account(test.ACCOUNT_ID),
+        "transactions": lambda client, test: client.get_transactions(test.ACCOUNT_ID),
+    }
+    
+    @pytest.mark.parametrize("endpoint", list(ENDPOINTS))
+    def test_endpoint_latency(self, api_client, api_format, api_target, benchmark_session, endpoint):
+        """Distribution of the endpoint latency must not regress beyond the configured percentage"""
+        call = self.ENDPOINTS[endpoint]
+        
+        # The baseline is keyed per target: local and public latencies are not comparable
+        name = f"{endpoint}[{api_format}@{api_target}]"
+        summary, regressions = benchmark_session.run(name, lambda: call(api_client, self))
+        print(
+            f"\n{name}: n={summary['count']} p50={summary['p50']:.1f} "
+            f"p90={summary['p90']:.1f} p99={summary['p99']:.1f} max={summary['max']:.1f} ms"
+        )
+        
+        assert not regressions, f"{endpoint} regressed: " + "; ".join(regressions)
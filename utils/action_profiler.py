@@ -0,0 +1,248 @@
+import functools
+import inspect
+import time
+
+import pytest
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.wait import WebDriverWait
+
+from pages.base_page import BasePage
+
+
+class ProfileNode:
+    """
+    Nodo del árbol de llamadas (estilo flame graph): las llamadas repetidas a la
+    misma acción desde el mismo padre se acumulan en un único nodo
+    """
+    
+    __slots__ = ("name", "calls", "total", "max", "retries", "children")
+    
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.retries = 0
+        self.children = {}
+    
+    def child(self, name):
+        node = self.children.get(name)
+        if node is None:
+            node = self.children[name] = ProfileNode(name)
+        return node
+    
+    @property
+    def self_time(self):
+        """Tiempo propio: el total menos lo que se fue en las llamadas hijas"""
+        return self.total - sum(child.total for child in self.children.values())
+    
+    def walk(self, depth=0):
+        yield depth, self
+        children = self.children.values()
+        if depth > 0:
+            # Las fases (setup, call, teardown) en orden; el resto de más a menos lento
+            children = sorted(children, key=lambda node: node.total, reverse=True)
+        for child in children:
+            yield from child.walk(depth + 1)
+
+
+class ActionProfiler:
+    """
+    Mide cada método de los page objects, cada espera y cada comando WebDriver
+    Un reintento es una excepción de una llamada hija que el padre absorbió y
+    terminó bien (p. ej. StaleElementReference en click, o un poll fallido de una espera)
+    """
+    
+    def __init__(self):
+        self.root = None
+        self._stack = []
+    
+    def begin(self, name):
+        """Empezar una fase (setup, call, teardown) como nodo raíz de la pila"""
+        if self.root is None:
+            self.root = ProfileNode("test")
+        self._stack = [[self.root.child(name), 0, time.perf_counter()]]
+    
+    def end(self):
+        if self._stack:
+            node, _, start = self._stack.pop()
+            elapsed = time.perf_counter() - start
+            node.calls += 1
+            node.total += elapsed
+            node.max = max(node.max, elapsed)
+        self._stack = []
+    
+    def take(self):
+        """Devolver el árbol del test actual y empezar uno nuevo"""
+        root, self.root = self.root, None
+        return root
+    
+    def call(self, name, func, *args, **kwargs):
+        if not self._stack:
+            return func(*args, **kwargs)
+        parent = self._stack[-1]
+        frame = [parent[0].child(name), 0, time.perf_counter()]
+        self._stack.append(frame)
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            parent[1] += 1
+            raise
+        else:
+            frame[0].retries += frame[1]
+            return result
+        finally:
+            node, _, start = self._stack.pop()
+            elapsed = time.perf_counter() - start
+            node.calls += 1
+            node.total += elapsed
+            node.max = max(node.max, elapsed)
+
+
+def format_tree(root):
+    """Desglose del test en texto, indentado por profundidad de llamada"""
+    lines = [f"{'acción':<60}{'llamadas':>9}{'total ms':>10}{'propio ms':>10}{'reint.':>7}"]
+    for depth, node in root.walk():
+        if node is root:
+            continue
+        label = "  " * (depth - 1) + node.name
+        lines.append(
+            f"{label:<60}{node.calls:>9}{node.total * 1000:>10.1f}"
+            f"{node.self_time * 1000:>10.1f}{node.retries:>7}"
+        )
+    return "\n".join(lines)
+
+
+def flatten(root):
+    """Totales por acción (sin importar desde dónde se llamó), serializables para xdist"""
+    actions = {}
+    for depth, node in root.walk():
+        if depth < 2:
+            # El nodo raíz y las fases no son acciones
+            continue
+        calls, total, maximum, retries = actions.get(node.name, (0, 0.0, 0.0, 0))
+        actions[node.name] = (calls + node.calls, total + node.total, max(maximum, node.max), retries + node.retries)
+    return [[name, *values] for name, values in actions.items()]
+
+
+class ActionProfilerPlugin:
+    """
+    Plugin de pytest de --profile-actions
+    Instala los wrappers al terminar la colección (cuando ya están importados todos
+    los page objects) y los quita al final; sin la opción no se toca nada
+    """
+    
+    PROPERTY = "action_profile"
+    
+    def __init__(self, top=15):
+        self.top = top
+        self.profiler = ActionProfiler()
+        self.actions = {}
+        self._patched = []
+    
+    # --- Wrappers ---------------------------------------------------------
+    
+    def _patch(self, owner, attribute, wrapper):
+        self._patched.append((owner, attribute, owner.__dict__[attribute]))
+        setattr(owner, attribute, wrapper)
+    
+    def _wrap_method(self, func, attribute):
+        profiler = self.profiler
+        
+        @functools.wraps(func)
+        def wrapper(page, *args, **kwargs):
+            return profiler.call(f"{type(page).__name__}.{attribute}", func, page, *args, **kwargs)
+        return wrapper
+    
+    def install(self):
+        pending = [BasePage]
+        while pending:
+            cls = pending.pop()
+            pending.extend(cls.__subclasses__())
+            for attribute, value in list(vars(cls).items()):
+                if not attribute.startswith("_") and inspect.isfunction(value):
+                    self._patch(cls, attribute, self._wrap_method(value, attribute))
+        
+        profiler = self.profiler
+        execute = WebDriver.execute
+        until = WebDriverWait.until
+        until_not = WebDriverWait.until_not
+        
+        @functools.wraps(execute)
+        def profiled_execute(driver, driver_command, params=None):
+            return profiler.call(f"WebDriver.{driver_command}", execute, driver, driver_command, params)
+        
+        @functools.wraps(until)
+        def profiled_until(wait, method, message=""):
+            return profiler.call("WebDriverWait.until", until, wait, method, message)
+        
+        @functools.wraps(until_not)
+        def profiled_until_not(wait, method, message=""):
+            return profiler.call("WebDriverWait.until_not", until_not, wait, method, message)
+        
+        self._patch(WebDriver, "execute", profiled_execute)
+        self._patch(WebDriverWait, "until", profiled_until)
+        self._patch(WebDriverWait, "until_not", profiled_until_not)
+    
+    def uninstall(self):
+        while self._patched:
+            owner, attribute, original = self._patched.pop()
+            setattr(owner, attribute, original)
+    
+    # --- Hooks ------------------------------------------------------------
+    
+    def pytest_collection_finish(self, session):
+        self.install()
+    
+    def pytest_unconfigure(self, config):
+        self.uninstall()
+    
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        self.profiler.begin("setup")
+        yield
+        self.profiler.end()
+    
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        self.profiler.begin("call")
+        yield
+        self.profiler.end()
+    
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        self.profiler.begin("teardown")
+        yield
+        self.profiler.end()
+        root = self.profiler.take()
+        if root is not None:
+            # Sección del informe (se ve en los fallos, con -rA y en report.html)
+            item.add_report_section("teardown", "perfil de acciones", format_tree(root))
+            item.user_properties.append((self.PROPERTY, flatten(root)))
+    
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        for name, value in report.user_properties:
+            if name != self.PROPERTY:
+                continue
+            for action, calls, total, maximum, retries in value:
+                stats = self.actions.setdefault(action, [0, 0.0, 0.0, 0])
+                stats[0] += calls
+                stats[1] += total
+                stats[2] = max(stats[2], maximum)
+                stats[3] += retries
+    
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.actions:
+            return
+        terminalreporter.section(f"acciones más lentas (top {self.top} por tiempo total)")
+        terminalreporter.write_line(
+            f"{'acción':<50}{'llamadas':>9}{'total ms':>11}{'media ms':>10}{'máx ms':>10}{'reint.':>7}"
+        )
+        ranking = sorted(self.actions.items(), key=lambda entry: entry[1][1], reverse=True)
+        for action, (calls, total, maximum, retries) in ranking[:self.top]:
+            terminalreporter.write_line(
+                f"{action:<50}{calls:>9}{total * 1000:>11.1f}{total / calls * 1000:>10.1f}"
+                f"{maximum * 1000:>10.1f}{retries:>7}"
+            )
@@ -0,0 +1,205 @@
+import base64
+import threading
+
+import requests
+import trio
+
+from utils.driver_pool import register_cleanup
+
+
+# Recursos estáticos que se sirven desde la caché local: hojas de estilo y scripts
+# (ParaBank los necesita para pintar y cargar los datos, así que no se bloquean)
+DEFAULT_CACHED_URLS = (
+    "*.css",
+    "*.js",
+)
+
+# Cabeceras de la respuesta original que no se reenvían: requests ya descomprimió
+# el cuerpo y la longitud la calcula el navegador
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+
+# Eventos Fetch.requestPaused que pueden esperar en cola mientras se atienden otros
+EVENT_BUFFER = 100
+
+
+class AssetCache:
+    """
+    Respuestas de los recursos estáticos, compartidas por todos los navegadores del proceso
+    Cada URL se descarga una sola vez (con requests) y después se sirve desde memoria
+    """
+
+    def __init__(self, timeout=10):
+        self.timeout = timeout
+        self._responses = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, url):
+        with self._lock:
+            return url in self._responses
+
+    def get(self, url):
+        """
+        (status, [(cabecera, valor)], cuerpo) de la URL, descargándola la primera vez
+        Devuelve None si no se pudo descargar (el navegador la pide a la red)
+        """
+        with self._lock:
+            cached = self._responses.get(url)
+        if cached is not None:
+            return cached
+        try:
+            response = requests.get(url, timeout=self.timeout)
+        except requests.RequestException:
+            return None
+        if response.status_code != 200:
+            return None
+        headers = [(name, value) for name, value in response.headers.items() if name.lower() not in DROPPED_HEADERS]
+        cached = (response.status_code, headers, response.content)
+        with self._lock:
+            self._responses[url] = cached
+        return cached
+
+
+class AssetInterceptor:
+    """
+    Intercepción de peticiones con el dominio Fetch del DevTools Protocol
+    Las peticiones cuya URL coincide con los patrones se pausan (Fetch.requestPaused)
+    y se responden desde la AssetCache con Fetch.fulfillRequest, sin ir a la red
+    La conexión CDP de driver.bidi_connection() es asíncrona (trio): vive en un
+    hilo propio durante toda la vida del navegador y se controla desde los tests
+    con set_patterns y stop. Solo intercepta la pestaña principal
+    """
+
+    def __init__(self, driver, cache, timeout=10):
+        self.driver = driver
+        self.cache = cache
+        self.timeout = timeout
+        self.patterns = []
+        self.error = None
+        self._session = None
+        self._devtools = None
+        self._browser_error = Exception
+        self._token = None
+        self._scope = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=trio.run, args=(self._run,), daemon=True)
+
+    def start(self, patterns):
+        """
+        Abrir la conexión CDP en el hilo de fondo y empezar a interceptar los patrones
+        Devuelve False si no se pudo conectar (error queda en self.error)
+        """
+        self.patterns = list(patterns)
+        self._thread.start()
+        if not self._ready.wait(self.timeout):
+            self.error = TimeoutError("No se abrió la conexión CDP")
+        return self.error is None
+
+    def set_patterns(self, patterns):
+        """Cambiar los patrones interceptados (lista vacía = Fetch.disable)"""
+        patterns = list(patterns)
+        if patterns == self.patterns or self._token is None:
+            return
+        trio.from_thread.run(self._enable, patterns, trio_token=self._token)
+        self.patterns = patterns
+
+    def stop(self):
+        """Cerrar la conexión CDP y terminar el hilo (antes de cerrar el navegador)"""
+        if self._token is not None:
+            try:
+                trio.from_thread.run_sync(self._scope.cancel, trio_token=self._token)
+            except trio.RunFinishedError:
+                pass
+            self._token = None
+        self._thread.join(self.timeout)
+
+    async def _run(self):
+        try:
+            async with self.driver.bidi_connection() as connection:
+                self._session, self._devtools = connection.session, connection.devtools
+                self._browser_error = connection.cdp.BrowserError
+                events = self._session.listen(self._devtools.fetch.RequestPaused, buffer_size=EVENT_BUFFER)
+                await self._enable(self.patterns)
+                with trio.CancelScope() as self._scope:
+                    self._token = trio.lowlevel.current_trio_token()
+                    self._ready.set()
+                    async with trio.open_nursery() as nursery:
+                        async for event in events:
+                            nursery.start_soon(self._serve, event)
+        except Exception as e:
+            self.error = e
+        finally:
+            self._token = None
+            self._ready.set()
+
+    async def _enable(self, patterns):
+        fetch = self._devtools.fetch
+        if not patterns:
+            await self._session.execute(fetch.disable())
+            return
+        await self._session.execute(fetch.enable(patterns=[
+            fetch.RequestPattern(url_pattern=pattern, request_stage=fetch.RequestStage.REQUEST)
+            for pattern in patterns
+        ]))
+
+    async def _serve(self, event):
+        """Responder una petición pausada desde la caché, o dejarla seguir si no se puede"""
+        fetch = self._devtools.fetch
+        cached = None
+        if event.request.method == "GET":
+            cached = await trio.to_thread.run_sync(self.cache.get, event.request.url)
+        try:
+            if cached is None:
+                await self._session.execute(fetch.continue_request(event.request_id))
+                return
+            status, headers, body = cached
+            await self._session.execute(fetch.fulfill_request(
+                event.request_id,
+                response_code=status,
+                response_headers=[fetch.HeaderEntry(name=name, value=value) for name, value in headers],
+                body=base64.b64encode(body).decode("ascii"),
+            ))
+        except self._browser_error:
+            # La petición se canceló mientras tanto (p. ej. el test navegó a otra página)
+            pass
+
+
+def cached_url_patterns(patterns, blocked):
+    """Patrones a servir desde la caché: los que están bloqueados no se interceptan, para que fallen"""
+    return [pattern for pattern in patterns if pattern not in blocked]
+
+
+def serve_from_cache(driver, cache, patterns):
+    """
+    Servir desde la caché las peticiones del navegador que coinciden con los patrones
+    El interceptor se crea la primera vez y queda en driver.asset_interceptor (los
+    navegadores del pool se reutilizan); después solo se cambian los patrones. La
+    conexión CDP se cierra antes de que el pool cierre el navegador
+    Devuelve el interceptor, o None si el navegador no soporta el DevTools Protocol
+    """
+    if not patterns and not hasattr(driver, "asset_interceptor"):
+        return None
+    if hasattr(driver, "asset_interceptor"):
+        # None: ya se intentó con este navegador y no se pudo (no se reintenta en cada test)
+        interceptor = driver.asset_interceptor
+        if interceptor is not None:
+            interceptor.set_patterns(patterns)
+        return interceptor
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return None
+    interceptor = AssetInterceptor(driver, cache)
+    if not interceptor.start(patterns):
+        print(f"✗ No se pudo interceptar peticiones por CDP, los recursos se piden a la red: {interceptor.error}")
+        interceptor.stop()
+        interceptor = None
+    else:
+        register_cleanup(driver, lambda: stop_interceptor(driver))
+    driver.asset_interceptor = interceptor
+    return interceptor
+
+
+def stop_interceptor(driver):
+    """Parar el interceptor del navegador, si tiene uno"""
+    interceptor = getattr(driver, "asset_interceptor", None)
+    if interceptor is not None:
+        interceptor.stop()
+        driver.asset_interceptor = None
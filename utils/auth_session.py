@@ -0,0 +1,99 @@
+from pages.login_page import LoginPage
+from pages.accounts_overview_page import AccountsOverviewPage
+
+
+class AuthSession:
+    """
+    Sesión autenticada de ParaBank compartida entre tests
+    Hace login por la UI una sola vez, guarda la cookie JSESSIONID y la inyecta
+    en cada navegador para que los tests empiecen directamente logueados
+    """
+
+    COOKIE_NAME = "JSESSIONID"
+
+    def __init__(self, driver_pool, app_url, username, password):
+        self.driver_pool = driver_pool
+        self.app_url = app_url
+        self.username = username
+        self.password = password
+        self._cookie = None
+
+    @property
+    def overview_url(self):
+        return f"{self.app_url}{AccountsOverviewPage.PATH}"
+
+    def get_cookie(self):
+        """Obtener la cookie de sesión, haciendo login solo si no hay una guardada"""
+        if self._cookie is None:
+            self._cookie = self._login()
+        return self._cookie
+
+    def invalidate(self):
+        """Olvidar la cookie guardada (p. ej. si la sesión expiró en el servidor)"""
+        self._cookie = None
+
+    def _login(self):
+        """Login por la UI con un navegador del pool para capturar la cookie"""
+        driver = self.driver_pool.acquire()
+        try:
+            driver.get(f"{self.app_url}{LoginPage.PATH}")
+            LoginPage(driver).login(self.username, self.password)
+            if not AccountsOverviewPage(driver).is_accounts_overview_displayed():
+                raise Exception(f"No se pudo hacer login con el usuario '{self.username}'")
+            cookie = driver.get_cookie(self.COOKIE_NAME)
+            if cookie is None:
+                raise Exception(f"El login no devolvió la cookie {self.COOKIE_NAME}")
+            return cookie
+        finally:
+            self.driver_pool.release(driver)
+
+    def inject(self, driver):
+        """
+        Cargar la cookie de sesión en el navegador
+        En Chrome/Edge se usa CDP para no tener que cargar ninguna página antes
+        """
+        cookie = self.get_cookie()
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.setCookie", {
+                "name": cookie["name"],
+                "value": cookie["value"],
+                "domain": cookie["domain"],
+                "path": cookie.get("path", "/"),
+                "secure": cookie.get("secure", False),
+                "httpOnly": cookie.get("httpOnly", False),
+            })
+        else:
+            # Selenium solo permite añadir cookies del dominio que está abierto
+            driver.get(self.app_url)
+            driver.add_cookie({
+                "name": cookie["name"],
+                "value": cookie["value"],
+                "path": cookie.get("path", "/"),
+            })
+
+    def open_overview(self, driver):
+        """
+        Inyectar la sesión y abrir el resumen de cuentas
+        Si la sesión guardada ya no es válida se hace login de nuevo una vez
+        """
+        for attempt in range(2):
+            self.inject(driver)
+            driver.get(self.overview_url)
+            if AccountsOverviewPage(driver).is_accounts_overview_displayed():
+                return
+            self.invalidate()
+        raise Exception("No se pudo abrir una sesión autenticada en ParaBank")
+    
+    def open_page(self, driver, page):
+        """
+        Inyectar la sesión y abrir un page object directamente por su URL (page.open)
+        Ahorra la carga del resumen de cuentas y el click en el menú; si la página
+        muestra el formulario de login la sesión expiró y se hace login de nuevo una vez
+        """
+        for attempt in range(2):
+            self.inject(driver)
+            page.open(self.app_url)
+            if not page.is_element_displayed_now(LoginPage.USERNAME_INPUT):
+                return page
+            self.invalidate()
+        raise Exception(f"No se pudo abrir {page.PATH} con una sesión autenticada en ParaBank")
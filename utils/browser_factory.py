@@ -0,0 +1,160 @@
+import os
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.common.selenium_manager import SeleniumManager
+from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.edge.service import Service as EdgeService
+from utils.browser_options import apply_browser_settings
+
+
+# Navegadores soportados, en el orden en que se prueban con --browser=auto
+BROWSERS = {
+    "chrome": (webdriver.Chrome, ChromeOptions, ChromeService),
+    "edge": (webdriver.Edge, EdgeOptions, EdgeService),
+}
+
+# Clave en la caché de pytest (.pytest_cache) donde se guarda el navegador resuelto
+CACHE_KEY = "parabank/browser"
+
+
+def add_browser_selection_option(parser):
+    """Registrar la opción --browser"""
+    parser.getgroup("browser").addoption(
+        "--browser",
+        choices=["auto", *BROWSERS],
+        default=os.environ.get("PARABANK_BROWSER", "auto"),
+        help="Navegador a usar (también con la variable PARABANK_BROWSER). "
+             "'auto' prueba Chrome y luego Edge una sola vez y guarda el resultado en .pytest_cache",
+    )
+
+
+def _base_options(name):
+    """Opciones fijas de cada navegador, independientes del perfil"""
+    options = BROWSERS[name][1]()
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    if name == "chrome":
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-extensions")
+    return options
+
+
+def _is_valid(choice):
+    """Una elección guardada sirve si sus binarios siguen existiendo"""
+    return (
+        isinstance(choice, dict)
+        and choice.get("browser") in BROWSERS
+        and os.path.isfile(choice.get("driver_path") or "")
+        and os.path.isfile(choice.get("browser_path") or "")
+    )
+
+
+def resolve_binaries(name):
+    """
+    Preguntar a Selenium Manager (una sola vez) dónde están el driver y el navegador
+    Lanza WebDriverException si el navegador no está disponible
+    """
+    browser_name = _base_options(name).capabilities["browserName"]
+    paths = SeleniumManager().binary_paths(["--browser", browser_name])
+    choice = {
+        "browser": name,
+        "driver_path": paths.get("driver_path"),
+        "browser_path": paths.get("browser_path"),
+    }
+    if not _is_valid(choice):
+        raise WebDriverException(f"Selenium Manager no encontró {name}: {paths}")
+    return choice
+
+
+def resolve_browser(config, exclude=()):
+    """
+    Resolver una sola vez por sesión qué navegador usar y dónde están sus binarios
+    El resultado se guarda en la caché de pytest para no consultar a Selenium Manager
+    en cada ejecución ni en cada worker (con -p no:cacheprovider se resuelve cada vez)
+    """
+    requested = config.getoption("--browser")
+    cache = getattr(config, "cache", None)
+    cached = cache.get(CACHE_KEY, {}) if cache is not None else {}
+    
+    candidates = list(BROWSERS) if requested == "auto" else [requested]
+    if requested == "auto" and _is_valid(cached.get("auto")):
+        # Probar primero el navegador que funcionó la última vez
+        candidates.remove(cached["auto"]["browser"])
+        candidates.insert(0, cached["auto"]["browser"])
+    candidates = [name for name in candidates if name not in exclude]
+    
+    errors = []
+    for name in candidates:
+        choice = cached.get(name)
+        if not _is_valid(choice):
+            try:
+                choice = resolve_binaries(name)
+            except WebDriverException as e:
+                errors.append(f"{name}: {e}")
+                continue
+            cached[name] = choice
+        if requested == "auto":
+            cached["auto"] = choice
+        if cache is not None:
+            cache.set(CACHE_KEY, cached)
+        return choice
+    
+    raise Exception(f"No se pudo encontrar ningún navegador ({', '.join(candidates)}): {errors}")
+
+
+def forget_browser(config, name):
+    """Borrar de la caché un navegador que no arrancó (p. ej. Chrome roto)"""
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        return
+    cached = cache.get(CACHE_KEY, {})
+    cached.pop(name, None)
+    if cached.get("auto", {}).get("browser") == name:
+        cached.pop("auto")
+    cache.set(CACHE_KEY, cached)
+
+
+def create_driver(choice, settings):
+    """
+    Inicializa un navegador nuevo con los binarios ya resueltos, sin pasar por Selenium Manager
+    settings es la configuración del perfil de navegador (ver utils/browser_options.py)
+    """
+    driver_class, _, service_class = BROWSERS[choice["browser"]]
+    options = apply_browser_settings(_base_options(choice["browser"]), settings)
+    options.binary_location = choice["browser_path"]
+    
+    driver = driver_class(options=options, service=service_class(executable_path=choice["driver_path"]))
+    print(f"✓ {choice['browser'].capitalize()} iniciado correctamente")
+    
+    # Sin timeout implícito: las esperas son explícitas en BasePage y así los
+    # chequeos de "no existe" no se quedan bloqueados esperando
+    driver.implicitly_wait(0)
+    
+    return driver
+
+
+def driver_factory(config, settings):
+    """
+    Función sin argumentos que crea navegadores para el DriverPool
+    Con --browser=auto, si el navegador elegido no arranca se descarta de la caché
+    y se pasa al siguiente (solo la primera vez, no en cada test)
+    """
+    state = {"choice": resolve_browser(config), "failed": []}
+    
+    def factory():
+        while True:
+            choice = state["choice"]
+            try:
+                return create_driver(choice, settings)
+            except WebDriverException as e:
+                if config.getoption("--browser") != "auto":
+                    raise
+                print(f"✗ No se pudo inicializar {choice['browser']}: {e}")
+                forget_browser(config, choice["browser"])
+                state["failed"].append(choice["browser"])
+                state["choice"] = resolve_browser(config, exclude=state["failed"])
+    
+    return factory
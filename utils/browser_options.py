@@ -0,0 +1,164 @@
+import os
+
+from utils.network_blocking import DEFAULT_BLOCKED_URLS, STYLESHEET_PATTERN
+from utils.asset_cache import DEFAULT_CACHED_URLS
+
+
+# Perfiles de navegador: "local" para ver el navegador mientras se desarrolla,
+# "ci" para agentes sin pantalla, ligero y sin recursos que no se usan en los tests
+BROWSER_PROFILES = {
+    "local": {
+        "headless": False,
+        "window_size": None,  # None = ventana maximizada
+        "block_images": False,
+        "block_css": False,
+        "block_assets": False,
+        "cache_assets": False,
+        "disable_background_networking": False,
+        "page_load_strategy": "normal",
+    },
+    "ci": {
+        "headless": True,
+        "window_size": "1366,768",
+        # Las imágenes se bloquean por CDP (block_assets) para que los tests
+        # marcados 'visual' puedan cargarlas
+        "block_images": False,
+        "block_css": False,
+        "block_assets": True,
+        # Hojas de estilo y scripts se sirven desde una caché local (Fetch por CDP)
+        "cache_assets": True,
+        "disable_background_networking": True,
+        "page_load_strategy": "eager",
+    },
+}
+
+DEFAULT_PROFILE = "local"
+
+
+def add_browser_options(parser):
+    """Registrar las opciones de línea de comandos del navegador"""
+    group = parser.getgroup("browser", "Opciones del navegador")
+    group.addoption(
+        "--browser-profile",
+        choices=sorted(BROWSER_PROFILES),
+        default=os.environ.get("PARABANK_BROWSER_PROFILE", DEFAULT_PROFILE),
+        help="Perfil de navegador (también con la variable PARABANK_BROWSER_PROFILE)",
+    )
+    group.addoption(
+        "--headless",
+        action="store_true",
+        default=None,
+        help="Ejecutar el navegador sin ventana (headless new)",
+    )
+    group.addoption(
+        "--window-size",
+        default=None,
+        help="Tamaño de ventana ANCHO,ALTO (por defecto maximizada)",
+    )
+    group.addoption(
+        "--block-images",
+        action="store_true",
+        default=None,
+        help="No descargar imágenes",
+    )
+    group.addoption(
+        "--block-css",
+        action="store_true",
+        default=None,
+        help="No descargar hojas de estilo (se bloquea *.css por CDP salvo en los tests marcados 'visual')",
+    )
+    group.addoption(
+        "--block-assets",
+        action="store_true",
+        default=None,
+        help="Bloquear por CDP las URLs de blocked_urls (pytest.ini) salvo en los tests marcados 'visual'",
+    )
+    group.addoption(
+        "--cache-assets",
+        action="store_true",
+        default=None,
+        help="Servir desde una caché local, interceptándolas por CDP, las URLs de cached_urls (pytest.ini)",
+    )
+    group.addoption(
+        "--page-load-strategy",
+        choices=["normal", "eager", "none"],
+        default=None,
+        help="Estrategia de carga de página de WebDriver",
+    )
+    parser.addini(
+        "blocked_urls",
+        "Patrones de URL (comodín *) que --block-assets bloquea en el navegador",
+        type="linelist",
+        default=list(DEFAULT_BLOCKED_URLS),
+    )
+    parser.addini(
+        "cached_urls",
+        "Patrones de URL (comodín *) que --cache-assets sirve desde la caché local",
+        type="linelist",
+        default=list(DEFAULT_CACHED_URLS),
+    )
+
+
+def get_browser_settings(config):
+    """
+    Configuración final del navegador: el perfil elegido más lo que se
+    indique explícitamente por línea de comandos
+    """
+    settings = dict(BROWSER_PROFILES[config.getoption("--browser-profile")])
+    overrides = {
+        "headless": config.getoption("--headless"),
+        "window_size": config.getoption("--window-size"),
+        "block_images": config.getoption("--block-images"),
+        "block_css": config.getoption("--block-css"),
+        "block_assets": config.getoption("--block-assets"),
+        "cache_assets": config.getoption("--cache-assets"),
+        "page_load_strategy": config.getoption("--page-load-strategy"),
+    }
+    settings.update({key: value for key, value in overrides.items() if value is not None})
+    # Patrones que el fixture driver bloquea por CDP en cada test (vacío = sin bloqueo)
+    settings["blocked_urls"] = blocked_url_patterns(settings, config.getini("blocked_urls"))
+    # Patrones que se sirven desde la caché local interceptando por CDP (vacío = sin caché)
+    settings["cached_urls"] = list(config.getini("cached_urls")) if settings["cache_assets"] else []
+    return settings
+
+
+def blocked_url_patterns(settings, patterns):
+    """
+    Patrones de URL a bloquear por CDP: los de blocked_urls con block_assets y
+    *.css con block_css (Chrome no tiene un ajuste de contenido para las hojas de estilo)
+    """
+    urls = list(patterns) if settings["block_assets"] else []
+    if settings["block_css"] and STYLESHEET_PATTERN not in urls:
+        urls.append(STYLESHEET_PATTERN)
+    return urls
+
+
+def apply_browser_settings(options, settings):
+    """
+    Aplicar la configuración a unas opciones de Chrome o Edge (ambos Chromium)
+    """
+    if settings["headless"]:
+        options.add_argument("--headless=new")
+    
+    if settings["window_size"]:
+        options.add_argument(f"--window-size={settings['window_size']}")
+    else:
+        options.add_argument("--start-maximized")
+    
+    # 2 = bloquear el tipo de contenido para todos los sitios
+    prefs = {}
+    if settings["block_images"]:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        prefs["profile.managed_default_content_settings.images"] = 2
+    if prefs:
+        options.add_experimental_option("prefs", prefs)
+    
+    if settings["disable_background_networking"]:
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-component-update")
+        options.add_argument("--disable-default-apps")
+        options.add_argument("--disable-sync")
+        options.add_argument("--no-first-run")
+    
+    options.page_load_strategy = settings["page_load_strategy"]
+    return options
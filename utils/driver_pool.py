@@ -0,0 +1,101 @@
+from selenium.common.exceptions import WebDriverException
+
+
+class DriverPool:
+    """
+    Pool de navegadores reutilizables durante toda la sesión de pytest
+    Con pytest-xdist cada worker es un proceso propio, así que cada worker
+    tiene su propio pool y sus propios navegadores
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._idle = []
+        self._drivers = []
+
+    def acquire(self):
+        """Entregar un navegador libre o crear uno nuevo si no hay ninguno"""
+        if self._idle:
+            return self._idle.pop()
+        driver = self._factory()
+        # La pestaña con la que arrancó el navegador es la que se conserva al limpiarlo
+        driver.main_window_handle = driver.current_window_handle
+        self._drivers.append(driver)
+        return driver
+
+    def release(self, driver):
+        """
+        Devolver un navegador al pool limpiando su estado
+        Si la limpieza falla el navegador se descarta para no contaminar el siguiente test
+        """
+        try:
+            reset_driver_state(driver)
+        except WebDriverException as e:
+            print(f"✗ No se pudo limpiar el navegador, se descarta: {e}")
+            self.discard(driver)
+            return
+        self._idle.append(driver)
+
+    def discard(self, driver):
+        """Cerrar un navegador y sacarlo del pool"""
+        if driver in self._drivers:
+            self._drivers.remove(driver)
+        if driver in self._idle:
+            self._idle.remove(driver)
+        # Limpiezas registradas con register_cleanup (p. ej. conexiones CDP abiertas)
+        for cleanup in getattr(driver, "pool_cleanups", []):
+            cleanup()
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def close(self):
+        """Cerrar todos los navegadores del pool"""
+        for driver in list(self._drivers):
+            self.discard(driver)
+
+
+def register_cleanup(driver, cleanup):
+    """Registrar una función que el pool llama antes de cerrar el navegador"""
+    if not hasattr(driver, "pool_cleanups"):
+        driver.pool_cleanups = []
+    driver.pool_cleanups.append(cleanup)
+
+
+def reset_driver_state(driver):
+    """
+    Dejar el navegador como recién abierto: una sola ventana, sin cookies,
+    sin localStorage/sessionStorage y en about:blank
+    """
+    # Cerrar alertas que hayan quedado abiertas
+    try:
+        driver.switch_to.alert.dismiss()
+    except WebDriverException:
+        pass
+
+    # Cerrar ventanas y pestañas extra y volver a la original (window_handles no
+    # garantiza el orden). Si un test la cerró, el navegador se descarta
+    handles = driver.window_handles
+    main_handle = getattr(driver, "main_window_handle", handles[0])
+    if main_handle not in handles:
+        raise WebDriverException("Se cerró la pestaña original del navegador")
+    for handle in handles:
+        if handle != main_handle:
+            driver.switch_to.window(handle)
+            driver.close()
+    driver.switch_to.window(main_handle)
+
+    # El storage solo se puede limpiar desde el origen que lo creó
+    try:
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except WebDriverException:
+        pass
+
+    # Chrome y Edge (Chromium) pueden borrar las cookies de todos los dominios
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    else:
+        driver.delete_all_cookies()
+
+    driver.get("about:blank")
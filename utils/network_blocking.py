@@ -0,0 +1,40 @@
+# Recursos estáticos que no influyen en las comprobaciones de la suite: imágenes,
+# iconos y fuentes. Los scripts no se bloquean por defecto porque ParaBank carga
+# cuentas y resultados con jQuery; se pueden añadir patrones en blocked_urls
+DEFAULT_BLOCKED_URLS = (
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.svg",
+    "*.ico",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+)
+
+# Patrón de las hojas de estilo (--block-css)
+STYLESHEET_PATTERN = "*.css"
+
+# Marker para los tests que necesitan la página completa (comprobaciones visuales)
+VISUAL_MARKER = "visual"
+
+
+def supports_url_blocking(driver):
+    """Solo Chrome y Edge (Chromium) exponen el DevTools Protocol en Selenium"""
+    return hasattr(driver, "execute_cdp_cmd")
+
+
+def set_blocked_urls(driver, patterns):
+    """
+    Bloquear en el navegador las peticiones cuya URL coincide con algún patrón
+    (comodín *, p. ej. "*.png") con Network.setBlockedURLs del DevTools Protocol
+    Las peticiones bloqueadas fallan al momento, sin esperar a la red, y la carga
+    de la página no las espera. Con una lista vacía se quita el bloqueo
+    Devuelve False si el navegador no lo soporta
+    """
+    if not supports_url_blocking(driver):
+        return False
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+    return True
@@ -0,0 +1,112 @@
+from urllib.parse import urlsplit
+
+from api.stats import summarize
+
+
+# Navigation Timing + Resource Timing del documento actual, en una sola llamada JS
+# Todos los tiempos en ms relativos al inicio de la navegación
+NAVIGATION_TIMING_SCRIPT = """
+    const nav = performance.getEntriesByType('navigation')[0];
+    if (!nav || !nav.loadEventEnd) return null;
+    const resources = performance.getEntriesByType('resource');
+    const slowest = resources.slice().sort((a, b) => b.duration - a.duration).slice(0, 3)
+        .map(r => ({name: r.name, duration: r.duration}));
+    return {
+        origin: performance.timeOrigin,
+        url: nav.name,
+        type: nav.type,
+        dns: nav.domainLookupEnd - nav.domainLookupStart,
+        connect: nav.connectEnd - nav.connectStart,
+        ttfb: nav.responseStart - nav.startTime,
+        response: nav.responseEnd - nav.responseStart,
+        dom_interactive: nav.domInteractive,
+        dom_content_loaded: nav.domContentLoadedEventEnd,
+        load: nav.loadEventEnd,
+        transfer_size: nav.transferSize,
+        resources: resources.length,
+        resource_bytes: resources.reduce((total, r) => total + (r.transferSize || 0), 0),
+        resources_end: resources.reduce((end, r) => Math.max(end, r.responseEnd), 0),
+        slowest_resources: slowest,
+    };
+"""
+
+# Métricas que se agregan por página en el resumen final
+SUMMARY_METRICS = ("ttfb", "dom_content_loaded", "load")
+
+
+def page_name(url):
+    """Nombre corto de la página a partir de la URL: .../parabank/overview.htm -> 'overview'"""
+    path = urlsplit(url).path.rstrip("/")
+    name = path.rsplit("/", 1)[-1]
+    return name.rsplit(".", 1)[0] or "index"
+
+
+class PageTimingRecorder:
+    """
+    Tiempos de carga de las páginas visitadas por un navegador durante un test
+    Cada documento se registra una sola vez (se identifica por performance.timeOrigin)
+    """
+    
+    def __init__(self):
+        self.records = []
+        self._seen = set()
+    
+    def capture(self, driver):
+        """
+        Leer los tiempos del documento actual si ya terminó de cargar y no se había registrado
+        Los errores del navegador (alertas, página a medio cargar) se ignoran: medir no debe romper el test
+        """
+        try:
+            timing = driver.execute_script(NAVIGATION_TIMING_SCRIPT)
+        except Exception:
+            return None
+        if not timing or timing["origin"] in self._seen:
+            return None
+        self._seen.add(timing.pop("origin"))
+        timing["page"] = page_name(timing["url"])
+        self.records.append(timing)
+        return timing
+
+
+class PageTimingPlugin:
+    """
+    Plugin de pytest que junta los tiempos de todos los tests y los resume por página
+    Los tiempos viajan en report.user_properties, así que también funciona con pytest-xdist
+    """
+    
+    PROPERTY = "page_timings"
+    
+    def __init__(self):
+        self.records = []
+    
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        for name, value in report.user_properties:
+            if name == self.PROPERTY:
+                self.records.extend(value)
+    
+    def summary(self):
+        """{página: {métrica: resumen estadístico}}"""
+        pages = {}
+        for record in self.records:
+            pages.setdefault(record["page"], []).append(record)
+        return {
+            page: {metric: summarize([record[metric] for record in records]) for metric in SUMMARY_METRICS}
+            for page, records in sorted(pages.items())
+        }
+    
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.records:
+            return
+        terminalreporter.section("tiempos de carga por página (ms)")
+        terminalreporter.write_line(
+            f"{'página':<22}{'cargas':>7}{'ttfb p50':>10}{'dcl p50':>10}{'load p50':>10}{'load p90':>10}{'load máx':>10}"
+        )
+        for page, metrics in self.summary().items():
+            load = metrics["load"]
+            terminalreporter.write_line(
+                f"{page:<22}{load['count']:>7}{metrics['ttfb']['p50']:>10.0f}"
+                f"{metrics['dom_content_loaded']['p50']:>10.0f}{load['p50']:>10.0f}"
+                f"{load['p90']:>10.0f}{load['max']:>10.0f}"
+            )
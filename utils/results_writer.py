@@ -0,0 +1,111 @@
+import json
+import os
+import time
+from datetime import datetime, timezone
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+
+class JsonLinesResultsPlugin:
+    """
+    Plugin de pytest que escribe un resultado por línea (JSON lines) en cuanto termina cada test
+    Cada línea es un objeto JSON independiente y el fichero se vacía tras cada escritura,
+    así que un dashboard puede leerlo mientras la ejecución sigue en curso
+    Con pytest-xdist solo se registra en el proceso principal: los reports de los
+    workers llegan ahí con sus user_properties (tiempos de página, perfil, latencias API)
+    """
+    
+    def __init__(self, path, markers=()):
+        self.path = path
+        # Markers registrados en pytest.ini: son los únicos keywords que interesa exportar
+        self.markers = set(markers)
+        self._file = None
+        self._phases = {}
+        self._counts = {}
+        self._start = None
+    
+    def _write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()
+    
+    def pytest_sessionstart(self, session):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._start = time.perf_counter()
+        self._write({"event": "session_start", "timestamp": _now(), "rootdir": str(session.config.rootpath)})
+    
+    def pytest_runtest_logreport(self, report):
+        phases = self._phases.setdefault(report.nodeid, {})
+        phases[report.when] = report
+        if report.when != "teardown":
+            return
+        del self._phases[report.nodeid]
+        record = self._test_record(report.nodeid, phases)
+        self._counts[record["outcome"]] = self._counts.get(record["outcome"], 0) + 1
+        self._write(record)
+    
+    def _test_record(self, nodeid, phases):
+        setup, call, teardown = phases.get("setup"), phases.get("call"), phases.get("teardown")
+        # Resultado del test como lo cuenta pytest: falla cualquier fase, skip en setup o call
+        outcome = "passed"
+        failed = next((report for report in (setup, call, teardown) if report and report.failed), None)
+        skipped = next((report for report in (setup, call) if report and report.skipped), None)
+        if failed is not None:
+            outcome = "error" if failed.when != "call" else "failed"
+        elif skipped is not None:
+            outcome = "xfailed" if hasattr(skipped, "wasxfail") else "skipped"
+        elif call is not None and hasattr(call, "wasxfail"):
+            outcome = "xpassed"
+        
+        record = {
+            "event": "test",
+            "timestamp": _now(),
+            "nodeid": nodeid,
+            "outcome": outcome,
+            "duration": call.duration if call else 0.0,
+            "setup": setup.duration if setup else 0.0,
+            "teardown": teardown.duration if teardown else 0.0,
+            "worker": self._worker(teardown),
+            "markers": sorted(name for name in (teardown.keywords if teardown else {}) if name in self.markers),
+        }
+        if failed is not None or skipped is not None:
+            report = failed or skipped
+            record["message"] = self._message(report)
+            if failed is not None:
+                record["longrepr"] = report.longreprtext
+        for name, value in teardown.user_properties if teardown else ():
+            record[name] = value
+        return record
+    
+    @staticmethod
+    def _message(report):
+        """Motivo del skip o última línea del error"""
+        if isinstance(report.longrepr, tuple):
+            # Los skips se reportan como (fichero, línea, "Skipped: motivo")
+            return report.longrepr[2]
+        lines = report.longreprtext.strip().splitlines()
+        return lines[-1] if lines else ""
+    
+    @staticmethod
+    def _worker(report):
+        """Worker de pytest-xdist que ejecutó el test ('gw0'...) o 'master' sin paralelismo"""
+        node = getattr(report, "node", None)
+        gateway = getattr(node, "gateway", None)
+        return gateway.id if gateway is not None else "master"
+    
+    def pytest_sessionfinish(self, session, exitstatus):
+        if self._file is None:
+            return
+        self._write({
+            "event": "session_finish",
+            "timestamp": _now(),
+            "duration": time.perf_counter() - self._start,
+            "exitstatus": int(exitstatus),
+            "counts": self._counts,
+        })
+        self._file.close()
+        self._file = None
@@ -0,0 +1,70 @@
+import random
+import time
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    StaleElementReferenceException,
+)
+
+
+# Fallos transitorios de una interacción: el DOM se re-renderizó, otro elemento
+# (overlay, spinner) tapa el click o el elemento aún no acepta eventos
+TRANSIENT_EXCEPTIONS = (
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+)
+
+
+class RetryPolicy:
+    """
+    Reintentos con backoff exponencial, jitter y un presupuesto total de tiempo
+    La acción recibe el tiempo que queda del presupuesto para que sus esperas
+    internas no vuelvan a empezar de cero en cada intento
+    """
+    
+    def __init__(self, exceptions=TRANSIENT_EXCEPTIONS, initial_delay=0.1, max_delay=1.0,
+                 multiplier=2.0, jitter=0.5, max_attempts=None):
+        self.exceptions = tuple(exceptions)
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.max_attempts = max_attempts
+    
+    def delays(self):
+        """Pausas sucesivas entre intentos: exponenciales, con tope y con una parte aleatoria"""
+        delay = self.initial_delay
+        while True:
+            # Jitter: entre (1 - jitter) y 1 veces la pausa, para no sincronizar reintentos
+            yield delay * (1 - self.jitter * random.random())
+            delay = min(delay * self.multiplier, self.max_delay)
+    
+    def run(self, action, deadline, max_attempts=None):
+        """
+        Ejecutar action(restante) hasta que termine bien, se agote el presupuesto
+        (deadline, en segundos) o se llegue a max_attempts
+        Las excepciones que no son transitorias se propagan en el primer intento
+        """
+        max_attempts = max_attempts or self.max_attempts
+        end = time.monotonic() + deadline
+        attempt = 0
+        delays = self.delays()
+        while True:
+            attempt += 1
+            remaining = max(end - time.monotonic(), 0)
+            try:
+                return action(remaining)
+            except self.exceptions:
+                pause = next(delays)
+                if (max_attempts and attempt >= max_attempts) or time.monotonic() + pause >= end:
+                    raise
+                time.sleep(pause)
+    
+    def with_exceptions(self, *exceptions):
+        """Copia de la política que además reintenta estas excepciones"""
+        return RetryPolicy(
+            self.exceptions + exceptions, self.initial_delay, self.max_delay,
+            self.multiplier, self.jitter, self.max_attempts,
+        )
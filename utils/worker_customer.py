@@ -0,0 +1,19 @@
+from api.data_factory import new_username as _new_username
+
+
+def new_username(worker_id):
+    """Nombre de usuario único por worker y por ejecución"""
+    return _new_username(f"qa_{worker_id}")
+
+
+def provision_customer(data_factory, worker_id):
+    """
+    Registrar un cliente nuevo para un worker con dos cuentas con saldo
+    Los tests de transferencia necesitan al menos dos cuentas propias
+    Todo va por HTTP (formulario de registro + API REST), sin abrir el navegador
+    Devuelve el CustomerData (credenciales, customer_id y números de cuenta)
+    """
+    data = data_factory.provision_customer(new_username(worker_id), "demo", accounts=2)
+    print(f"✓ Cliente de prueba '{data.username}' registrado para el worker {worker_id} "
+          f"(cuentas {', '.join(data.account_ids)})")
+    return data